@@ -0,0 +1,72 @@
+"""
+bench_parallel.py
+
+Measure rendering throughput of a CSV file for different worker counts, with the
+workers reading and rendering byte ranges of the file themselves.
+
+Usage:
+    python -m benchmarks.bench_parallel [--rows ROWS] [--cols COLS] [--jobs 1,2,4]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from mdtable.parallel import iter_md_csv_parallel
+
+
+def make_csv(path: Path, rows: int, cols: int) -> None:
+    """
+    Write a synthetic CSV file with underscore-separated numeric cells.
+
+    Parameters:
+        path (Path): Where to write the file.
+        rows (int): Number of body rows.
+        cols (int): Number of columns.
+    """
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(",".join(f"col{c}" for c in range(cols)) + "\n")
+        for r in range(rows):
+            f.write(",".join(f"{r * c:_}.{c:06d}" for c in range(cols)) + "\n")
+
+
+def main() -> None:
+    """
+    Render the same file with each worker count and report rows per second.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Parallel rendering benchmark")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--cols", type=int, default=8)
+    parser.add_argument(
+        "--jobs",
+        default=",".join(str(2**i) for i in range((os.cpu_count() or 1).bit_length())),
+        help="Comma-separated worker counts (default: powers of two up to CPUs)",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.csv"
+        make_csv(path, args.rows, args.cols)
+        print(f"{os.cpu_count()} CPUs, {path.stat().st_size / 1024**2:.1f} MB")
+
+        baseline = None
+        for workers in sorted({int(j) for j in args.jobs.split(",") if j}):
+            start = time.perf_counter()
+            for _ in iter_md_csv_parallel(str(path), workers=workers):
+                pass
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(
+                f"workers={workers:<3} {elapsed:8.3f}s "
+                f"{args.rows / elapsed:12,.0f} rows/s  "
+                f"speedup {baseline / elapsed:5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
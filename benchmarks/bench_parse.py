@@ -0,0 +1,92 @@
+"""
+bench_parse.py
+
+Measure CSV parsing throughput of the mmap backend and of iter_csv_parallel for
+different worker counts, against the single-process csv backend.
+
+Usage:
+    python -m benchmarks.bench_parse [--rows ROWS] [--cols COLS] [--jobs 1,2,4]
+                                     [--plain]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from mdtable.core import iter_csv
+from mdtable.parallel import iter_csv_parallel
+
+
+def make_csv(path: Path, rows: int, cols: int, quoted: bool = True) -> None:
+    """
+    Write a synthetic CSV file where every other row has a quoted multi-line cell.
+
+    Parameters:
+        path (Path): Where to write the file.
+        rows (int): Number of body rows.
+        cols (int): Number of columns.
+        quoted (bool): Whether to write the quoted cells at all.
+    """
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(",".join(f"col{c}" for c in range(cols)) + "\n")
+        for r in range(rows):
+            cells = [f"{r * c:_}.{c:06d}" for c in range(cols)]
+            if quoted and r % 2:
+                cells[0] = f'"note {r}, ""quoted""\nsecond line"'
+            f.write(",".join(cells) + "\n")
+
+
+def main() -> None:
+    """
+    Parse the same file with each worker count and report rows per second.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Parallel CSV parsing benchmark")
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--cols", type=int, default=8)
+    parser.add_argument(
+        "--jobs",
+        default=",".join(str(2**i) for i in range((os.cpu_count() or 1).bit_length())),
+        help="Comma-separated worker counts (default: powers of two up to CPUs)",
+    )
+    parser.add_argument("--plain", action="store_true", help="Write no quoted cells")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.csv"
+        make_csv(path, args.rows, args.cols, quoted=not args.plain)
+        size_mb = path.stat().st_size / 1024**2
+
+        start = time.perf_counter()
+        for _ in iter_csv(str(path)):
+            pass
+        baseline = time.perf_counter() - start
+        print(f"csv backend  {baseline:8.3f}s {size_mb / baseline:8.1f} MB/s")
+
+        start = time.perf_counter()
+        for _ in iter_csv(str(path), backend="mmap"):
+            pass
+        elapsed = time.perf_counter() - start
+        print(
+            f"mmap backend {elapsed:8.3f}s {size_mb / elapsed:8.1f} MB/s "
+            f"speedup {baseline / elapsed:5.2f}x"
+        )
+
+        for workers in sorted({int(j) for j in args.jobs.split(",") if j}):
+            start = time.perf_counter()
+            for _ in iter_csv_parallel(str(path), workers):
+                pass
+            elapsed = time.perf_counter() - start
+            print(
+                f"workers={workers:<3} {elapsed:8.3f}s {size_mb / elapsed:8.1f} MB/s "
+                f"{args.rows / elapsed:12,.0f} rows/s  "
+                f"speedup {baseline / elapsed:5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
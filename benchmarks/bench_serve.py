@@ -0,0 +1,88 @@
+"""
+bench_serve.py
+
+Compare per-table latency of a fresh CLI process with a request to a warm
+'mdtable serve' server.
+
+Usage:
+    python -m benchmarks.bench_serve [--runs RUNS] [--rows ROWS]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from mdtable.server import request_render, start_server
+
+
+def time_runs(func, runs: int) -> list[float]:
+    """
+    Call a function repeatedly and record each call's latency.
+
+    Parameters:
+        func (Callable[[], object]): The function to time.
+        runs (int): Number of calls.
+
+    Returns:
+        List[float]: Latencies in seconds.
+    """
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main() -> None:
+    """
+    Time both paths on a small table and print median and p95 latencies.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Server latency benchmark")
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--rows", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = ["Name,Balance"] + [f"user{i},{i * 1000:_} XRP" for i in range(args.rows)]
+    body = "\n".join(rows).encode()
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_file = Path(tmp) / "input.csv"
+        csv_file.write_bytes(body)
+        command = [
+            sys.executable,
+            "-c",
+            "from mdtable.cli import main; main()",
+            "--input",
+            str(csv_file),
+            "--no-cache",
+        ]
+        cli = time_runs(
+            lambda: subprocess.run(command, check=True, capture_output=True), args.runs
+        )
+
+    server = start_server(port=0)
+    host, port = server.server_address[:2]
+    url = f"http://{host}:{port}/"
+    try:
+        served = time_runs(lambda: request_render(body, url), args.runs)
+    finally:
+        server.shutdown()
+
+    for name, latencies in (("cli process", cli), ("warm server", served)):
+        p95 = statistics.quantiles(latencies, n=20)[-1]
+        print(
+            f"{name:<12} median {statistics.median(latencies) * 1000:8.2f} ms "
+            f"p95 {p95 * 1000:8.2f} ms"
+        )
+    print(f"speedup {statistics.median(cli) / statistics.median(served):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+bench_transforms.py
+
+Compare the per-cell format_commas path with the compiled row formatter.
+
+Usage:
+    python -m benchmarks.bench_transforms [--rows ROWS] [--cols COLS]
+"""
+
+import argparse
+import timeit
+
+from mdtable.core import format_commas
+from mdtable.transforms import compile_row_formatter
+
+
+def per_cell(rows: list[list[str]]) -> list[str]:
+    """
+    Render rows the way generate_md_table did before the transform pipeline.
+
+    Parameters:
+        rows (List[List[str]]): The body rows.
+
+    Returns:
+        List[str]: The rendered Markdown lines.
+    """
+    formatted_rows = [[format_commas(cell) for cell in row] for row in rows]
+    return ["| " + " | ".join(row) + " |" for row in formatted_rows]
+
+
+def main() -> None:
+    """
+    Time both rendering paths for each transform pipeline and print the speedup.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Cell transform microbenchmark")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--cols", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = [[f"{r * c:_}.{c:03d}" for c in range(args.cols)] for r in range(args.rows)]
+    baseline = min(timeit.repeat(lambda: per_cell(rows), number=1, repeat=args.repeat))
+    print(f"{'format_commas per cell':<28} {baseline:8.3f}s")
+
+    for transforms in [("commas",), ("commas", "escape"), ("trim", "commas")]:
+        fmt = compile_row_formatter(transforms)
+        elapsed = min(
+            timeit.repeat(lambda: list(map(fmt, rows)), number=1, repeat=args.repeat)
+        )
+        print(
+            f"{'compiled ' + ','.join(transforms):<28} {elapsed:8.3f}s "
+            f"({baseline / elapsed:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
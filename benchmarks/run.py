@@ -0,0 +1,262 @@
+"""
+run.py
+
+Benchmark suite for every render path, with regression gates against a stored
+baseline.
+
+Synthetic CSV files are generated once per size and shape under benchmarks/.data,
+then each stage (read, render, preview, write and the end-to-end stream) is timed
+and its peak memory measured. Results are compared with benchmarks/baseline.json
+and the run fails if any stage got slower or hungrier than the tolerance allows.
+
+Usage:
+    python -m benchmarks.run [--sizes 1KB,1MB,32MB] [--save-baseline]
+"""
+
+import argparse
+import contextlib
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+from mdtable.core import (
+    generate_md_table,
+    iter_csv,
+    iter_md_table,
+    read_csv,
+    write_lines,
+    write_output,
+)
+from mdtable.preview import preview_table
+
+BENCH_DIR = Path(__file__).resolve().parent
+DATA_DIR = BENCH_DIR / ".data"
+BASELINE = BENCH_DIR / "baseline.json"
+UNITS = {"KB": 1024, "MB": 1024**2, "GB": 1024**3}
+# name: (columns, cell width)
+SHAPES = {"narrow": (4, 8), "wide": (32, 8), "long-cells": (4, 64)}
+# Inputs above this size only run the constant-memory stream stage.
+IN_MEMORY_LIMIT = 256 * 1024**2
+# Measurements below these floors are too noisy to gate on.
+NOISE_FLOOR = {"seconds": 0.005, "peak_bytes": 64 * 1024}
+
+
+def parse_size(size: str) -> int:
+    """
+    Parse a human-readable size such as '32MB' into bytes.
+
+    Parameters:
+        size (str): A number followed by KB, MB or GB.
+
+    Returns:
+        int: The size in bytes.
+    """
+    size = size.strip().upper()
+    for unit, factor in UNITS.items():
+        if size.endswith(unit):
+            return int(float(size[: -len(unit)]) * factor)
+    return int(size)
+
+
+def make_csv(size: int, shape: str) -> Path:
+    """
+    Generate a synthetic CSV file of roughly the given size, reusing earlier runs.
+
+    Parameters:
+        size (int): Target file size in bytes.
+        shape (str): One of SHAPES, selecting column count and cell width.
+
+    Returns:
+        Path: The generated file.
+    """
+    cols, width = SHAPES[shape]
+    path = DATA_DIR / f"{shape}-{size}.csv"
+    if path.exists():
+        return path
+
+    DATA_DIR.mkdir(exist_ok=True)
+    header = ",".join(f"col{c}" for c in range(cols)) + "\n"
+    written = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(header)
+        written += len(header)
+        r = 0
+        while written < size:
+            cells = [f"{r * (c + 1):_}".rjust(width, "x")[-width:] for c in range(cols)]
+            line = ",".join(cells) + "\n"
+            f.write(line)
+            written += len(line)
+            r += 1
+    return path
+
+
+def measure(func: Callable[[], object], repeat: int) -> dict[str, float]:
+    """
+    Time a function and measure its peak Python memory allocation.
+
+    The peak is measured in a separate run so tracing does not skew the timings.
+
+    Parameters:
+        func (Callable[[], object]): The stage to measure.
+        repeat (int): Number of timed runs; the fastest is kept.
+
+    Returns:
+        Dict[str, float]: The fastest wall time in seconds and the peak memory in
+        bytes.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": best, "peak_bytes": peak}
+
+
+def stages(path: Path, out: Path) -> dict[str, Callable[[], object]]:
+    """
+    Build the stage functions for one input file.
+
+    Parameters:
+        path (Path): The input CSV file.
+        out (Path): Scratch file for written output.
+
+    Returns:
+        Dict[str, Callable[[], object]]: Stage names mapped to functions.
+    """
+
+    def stream() -> None:
+        write_lines(str(out), iter_md_table(iter_csv(str(path))))
+
+    if path.stat().st_size > IN_MEMORY_LIMIT:
+        return {"stream": stream}
+
+    data = read_csv(str(path))
+    md_table = generate_md_table(data)
+
+    def preview() -> None:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            preview_table(data)
+
+    return {
+        "read": lambda: read_csv(str(path)),
+        "render": lambda: generate_md_table(data),
+        "preview": preview,
+        "write": lambda: write_output(str(out), md_table),
+        "stream": stream,
+    }
+
+
+def run(sizes: list[int], repeat: int) -> dict[str, dict[str, float]]:
+    """
+    Run every stage for every size and shape.
+
+    Parameters:
+        sizes (List[int]): Input sizes in bytes.
+        repeat (int): Number of timed runs per stage.
+
+    Returns:
+        Dict[str, Dict[str, float]]: Results keyed on 'shape/size/stage'.
+    """
+    results = {}
+    out = DATA_DIR / "output.md"
+    for size in sizes:
+        for shape in SHAPES:
+            path = make_csv(size, shape)
+            for stage, func in stages(path, out).items():
+                result = measure(func, repeat)
+                result["mb_per_s"] = path.stat().st_size / 1024**2 / result["seconds"]
+                name = f"{shape}/{size}/{stage}"
+                results[name] = result
+                print(
+                    f"{name:<28} {result['seconds'] * 1000:10.2f} ms "
+                    f"{result['mb_per_s']:9.1f} MB/s "
+                    f"{result['peak_bytes'] / 1024**2:9.2f} MB peak"
+                )
+    out.unlink(missing_ok=True)
+    return results
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float,
+) -> list[str]:
+    """
+    Compare results against a baseline.
+
+    Parameters:
+        results (Dict[str, Dict[str, float]]): The current results.
+        baseline (Dict[str, Dict[str, float]]): The stored baseline.
+        tolerance (float): Allowed relative slowdown or memory growth.
+
+    Returns:
+        List[str]: A description of each regression found.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        for metric in ("seconds", "peak_bytes"):
+            before, after = baseline[name][metric], result[metric]
+            if after < NOISE_FLOOR[metric]:
+                continue
+            if after > max(before, NOISE_FLOOR[metric]) * (1 + tolerance):
+                regressions.append(
+                    f"{name} {metric}: {before:.4g} -> {after:.4g} "
+                    f"(+{(after / before - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def main() -> None:
+    """
+    Entry point for the benchmark suite.
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="mdtable benchmark suite")
+    parser.add_argument(
+        "--sizes", default="1KB,1MB,32MB", help="Comma-separated input sizes"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per stage")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed relative regression before failing (default: 0.25)",
+    )
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="Store results as the baseline"
+    )
+    args = parser.parse_args()
+
+    results = run([parse_size(s) for s in args.sizes.split(",")], args.repeat)
+
+    if args.save_baseline or not BASELINE.exists():
+        BASELINE.write_text(json.dumps(results, indent=2))
+        print(f"Baseline saved to {BASELINE}")
+        return
+
+    regressions = compare(results, json.loads(BASELINE.read_text()), args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    if regressions:
+        sys.exit(1)
+    print("No regressions.")
+
+
+if __name__ == "__main__":
+    main()
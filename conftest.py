@@ -53,6 +53,23 @@ def malformed_table() -> list[list[str]]:
     ]
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache(monkeypatch: pytest.MonkeyPatch, tmp_path_factory) -> None:
+    """
+    Point the render cache at a temporary directory so tests never touch the real
+    user cache.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture for safely patching built-ins and
+        environment during the test.
+        tmp_path_factory (pytest.TempPathFactory): Factory for temporary directories.
+
+    Returns:
+        None
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
+
+
 @pytest.fixture
 def cli_args(monkeypatch: pytest.MonkeyPatch) -> Callable:
     """
@@ -1,3 +1,42 @@
-from mdtable import cli, core, preview
+import importlib
 
-__all__ = ["cli", "core", "preview"]
+from ._version import __author__, __email__, __version__  # noqa: F401
+
+__all__ = [
+    "aggregate",
+    "aio",
+    "batch",
+    "cache",
+    "cli",
+    "compression",
+    "core",
+    "incremental",
+    "pager",
+    "parallel",
+    "preview",
+    "query",
+    "readers",
+    "server",
+    "sorting",
+    "stats",
+    "table",
+    "transforms",
+    "typed",
+    "watch",
+    "width",
+]
+
+
+def __getattr__(name: str) -> object:
+    """
+    Import submodules on first access, so `import mdtable` stays cheap.
+
+    Parameters:
+        name (str): The attribute being looked up.
+
+    Returns:
+        object: The submodule.
+    """
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
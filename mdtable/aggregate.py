@@ -0,0 +1,201 @@
+from collections.abc import Iterable, Iterator, Sequence
+
+from .core import _check_columns
+from .query import _number, column_indices
+
+AGGREGATES = {"count", "sum", "min", "max", "mean"}
+
+Aggregate = tuple[str, str | None]
+
+
+def parse_aggregates(aggs: str | Sequence[str]) -> list[Aggregate]:
+    """
+    Parse aggregate specifications such as 'count' or 'sum:Balance'.
+
+    Parameters:
+        aggs (Union[str, Sequence[str]]): Specifications as a comma-separated string
+        or a sequence of strings. 'count' counts rows; every other function, and
+        'count' with a column, takes the column after a colon.
+
+    Returns:
+        List[Tuple[str, Optional[str]]]: (function, column) pairs, column None for a
+        plain row count.
+    """
+    if isinstance(aggs, str):
+        aggs = aggs.split(",") if aggs else []
+    parsed = []
+    for spec in aggs:
+        func, _, column = spec.strip().partition(":")
+        func = func.strip().lower()
+        if func not in AGGREGATES or (func != "count" and not column):
+            raise ValueError(f"Invalid aggregate: '{spec}'")
+        parsed.append((func, column.strip() or None))
+    return parsed
+
+
+def aggregate_columns(group_by: Sequence[str], aggs: Sequence[Aggregate]) -> list[str]:
+    """
+    List the input columns needed to compute a summary.
+
+    Parameters:
+        group_by (Sequence[str]): Names of the columns to group by.
+        aggs (Sequence[Tuple[str, Optional[str]]]): Parsed aggregates.
+
+    Returns:
+        List[str]: The column names, without duplicates.
+    """
+    return list(dict.fromkeys([*group_by, *(col for _, col in aggs if col)]))
+
+
+class Accumulator:
+    """
+    Running count, sum, minimum and maximum of the numeric cells of one column.
+
+    Non-numeric cells are skipped, except that every non-empty cell is counted by
+    `filled`. The minimum and maximum keep the original text of the cell. The sum,
+    and a mean that divides evenly, stay exact while every number is an integer;
+    the sum becomes a float once any other number is added.
+    """
+
+    __slots__ = ("filled", "count", "total", "low", "low_cell", "high", "high_cell")
+
+    def __init__(self) -> None:
+        self.filled = 0
+        self.count = 0
+        self.total: int | float = 0
+        self.low: int | float = 0
+        self.high: int | float = 0
+        self.low_cell = self.high_cell = ""
+
+    def add(self, cell: str) -> None:
+        """
+        Add one cell to the running totals.
+
+        Parameters:
+            cell (str): The cell.
+        """
+        if not cell:
+            return
+        self.filled += 1
+        number = _cell_number(cell)
+        if number is None or number != number:  # text or NaN
+            return
+        if not self.count or number < self.low:
+            self.low, self.low_cell = number, cell
+        if not self.count or number > self.high:
+            self.high, self.high_cell = number, cell
+        self.count += 1
+        self.total += number
+
+    def result(self, func: str) -> str:
+        """
+        Return the value of an aggregate function as a cell.
+
+        Parameters:
+            func (str): One of 'count', 'sum', 'min', 'max' or 'mean'.
+
+        Returns:
+            str: The value, or an empty cell when the column had no numbers.
+        """
+        if func == "count":
+            return str(self.filled)
+        if not self.count:
+            return ""
+        if func == "min":
+            return self.low_cell
+        if func == "max":
+            return self.high_cell
+        exact = isinstance(self.total, int)
+        if func == "mean":
+            if exact and not self.total % self.count:
+                return str(self.total // self.count)
+            return format_number(self.total / self.count)
+        return str(self.total) if exact else format_number(self.total)
+
+
+def _cell_number(cell: str) -> int | float | None:
+    """
+    Parse a cell as an exact int if possible, else as a float.
+
+    Parameters:
+        cell (str): The cell.
+
+    Returns:
+        Optional[Union[int, float]]: The number, or None if the cell is not numeric.
+    """
+    try:
+        return int(cell.replace(",", ""))
+    except ValueError:
+        return _number(cell)
+
+
+def format_number(value: float) -> str:
+    """
+    Format a computed number without floating-point noise.
+
+    Parameters:
+        value (float): The number.
+
+    Returns:
+        str: Whole numbers without a fractional part, others to 15 significant
+        digits.
+    """
+    if value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return f"{value:.15g}"
+
+
+def aggregate_rows(
+    rows: Iterable[list[str]],
+    group_by: Sequence[str] = (),
+    aggs: str | Sequence[str] = ("count",),
+) -> Iterator[list[str]]:
+    """
+    Summarize rows per group in a single pass.
+
+    Each group keeps a row count and one Accumulator per aggregated column in dicts
+    keyed on the group's values, so memory grows with the number of groups,
+    not rows. Groups are listed in the order they first appear.
+
+    Parameters:
+        rows (Iterable[List[str]]): The header followed by the body rows.
+        group_by (Sequence[str]): Names of the columns to group by. The whole table
+        is one group when empty.
+        aggs (Union[str, Sequence[str]]): Aggregates such as 'count' or
+        'mean:Balance', see `parse_aggregates`. Rows are counted when empty.
+
+    Returns:
+        Iterator[List[str]]: The summary header, with columns such as
+        'sum(Balance)', followed by one row per group.
+    """
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        return
+    specs = parse_aggregates(aggs) or [("count", None)]
+    keys = column_indices(header, group_by)
+    columns = list(dict.fromkeys(col for _, col in specs if col))
+    indices = column_indices(header, columns)
+
+    counts: dict[tuple[str, ...], int] = {}
+    groups: dict[tuple[str, ...], list[Accumulator]] = {}
+    for row in _check_columns(rows, len(header)):
+        key = tuple([row[i] for i in keys])
+        accs = groups.get(key)
+        if accs is None:
+            accs = groups[key] = [Accumulator() for _ in indices]
+            counts[key] = 0
+        counts[key] += 1
+        for index, acc in zip(indices, accs):
+            acc.add(row[index])
+    if not group_by and not groups:
+        groups[()] = [Accumulator() for _ in indices]
+        counts[()] = 0
+
+    yield [*group_by, *(f"{f}({c})" if c else f for f, c in specs)]
+    for key, accs in groups.items():
+        by_column = dict(zip(columns, accs))
+        yield [
+            *key,
+            *(by_column[c].result(f) if c else str(counts[key]) for f, c in specs),
+        ]
@@ -0,0 +1,283 @@
+import asyncio
+import codecs
+import csv
+import inspect
+import io
+import os
+import weakref
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterator,
+    Sequence,
+)
+from concurrent.futures import Executor
+from typing import Any
+
+from . import core
+from .transforms import DEFAULT_TRANSFORMS, normalize_transforms
+
+# Maximum number of renders offloaded to an executor at once, per event loop.
+MAX_CONCURRENT_RENDERS = os.cpu_count() or 1
+READ_CHUNK_SIZE = 64 * 1024
+
+_limits: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+async def file_source(
+    input_path: str, chunk_size: int = READ_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """
+    Read a file as an async byte source, without blocking the event loop.
+
+    Parameters:
+        input_path (str): Path to the input file.
+        chunk_size (int): Number of bytes read per chunk.
+
+    Returns:
+        AsyncIterator[bytes]: The file's contents, chunk by chunk.
+    """
+    loop = asyncio.get_running_loop()
+    f = await loop.run_in_executor(None, open, input_path, "rb")
+    try:
+        while chunk := await loop.run_in_executor(None, f.read, chunk_size):
+            yield chunk
+    finally:
+        f.close()
+
+
+async def iter_csv(
+    source: AsyncIterable[bytes], encoding: str = "utf-8"
+) -> AsyncIterator[list[str]]:
+    """
+    Lazily parse CSV rows from an async byte source.
+
+    Each chunk is decoded and parsed with `csv.reader` in a worker thread, so the
+    event loop is never blocked. Chunks may split records, quoted fields and
+    multi-byte characters anywhere: an unfinished record is kept and parsed with
+    the next chunk. The next chunk is only requested once the rows already
+    received have been consumed.
+
+    Parameters:
+        source (AsyncIterable[bytes]): Chunks of CSV data, such as an
+        asyncio.StreamReader or an aiohttp request body.
+        encoding (str): Text encoding of the input.
+
+    Returns:
+        AsyncIterator[List[str]]: The parsed rows.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    pending = ""
+    async for chunk in source:
+        rows, pending = await asyncio.to_thread(
+            _parse_complete, pending, decoder, chunk
+        )
+        for row in rows:
+            yield row
+    text = pending + decoder.decode(b"", final=True)
+    if text:
+        for row in await asyncio.to_thread(_parse_all, text):
+            yield row
+
+
+def _parse_complete(
+    pending: str, decoder: codecs.IncrementalDecoder, chunk: bytes
+) -> tuple[list[list[str]], str]:
+    """
+    Decode a chunk and parse the complete records that precede it.
+
+    Parameters:
+        pending (str): Unparsed text left over from the previous chunk.
+        decoder (codecs.IncrementalDecoder): Decoder for the input's encoding.
+        chunk (bytes): The new chunk of CSV data.
+
+    Returns:
+        Tuple[List[List[str]], str]: The complete rows, and the text of the
+        unfinished record that follows them.
+    """
+    lines = io.StringIO(pending + decoder.decode(chunk), newline="").readlines()
+    # An unterminated last line, or a '\r' that may start a '\r\n', is kept.
+    tail = lines.pop() if lines and not lines[-1].endswith("\n") else ""
+    fed = 0
+
+    def feed() -> Iterator[str]:
+        nonlocal fed
+        for line in lines:
+            fed += 1
+            yield line
+        fed += 1
+
+    rows = []
+    done = 0
+    for row in csv.reader(feed()):
+        if fed > len(lines):
+            # The reader ran out of lines inside a quoted field.
+            break
+        rows.append(row)
+        done = fed
+    return rows, "".join(lines[done:]) + tail
+
+
+def _parse_all(text: str) -> list[list[str]]:
+    """
+    Parse the final records of the input.
+
+    Parameters:
+        text (str): The remaining decoded text.
+
+    Returns:
+        List[List[str]]: The parsed rows.
+    """
+    return list(csv.reader(io.StringIO(text, newline="")))
+
+
+async def read_csv(
+    source: AsyncIterable[bytes], encoding: str = "utf-8"
+) -> list[list[str]]:
+    """
+    Read all CSV rows from an async byte source.
+
+    Parameters:
+        source (AsyncIterable[bytes]): Chunks of CSV data.
+        encoding (str): Text encoding of the input.
+
+    Returns:
+        List[List[str]]: A list of rows, where each row is a list of string cells.
+    """
+    return [row async for row in iter_csv(source, encoding)]
+
+
+async def iter_md_table(
+    rows: AsyncIterable[list[str]],
+    alignments: str | list[str] | None = None,
+    transforms: str | Sequence[str] = DEFAULT_TRANSFORMS,
+    executor: Executor | None = None,
+) -> AsyncIterator[str]:
+    """
+    Lazily render rows from an async source as a Markdown table.
+
+    Rows are collected into chunks of core.CHUNK_SIZE, and each chunk is rendered
+    in the executor and yielded as a block of newline-separated lines.
+
+    Parameters:
+        rows (AsyncIterable[List[str]]): The header followed by the body rows.
+        alignments (Optional[Union[List[str], str]]): Column alignments ('left',
+        'center', 'right') as a list or comma-separated string.
+        transforms (Union[str, Sequence[str]]): Names of the cell transforms applied
+        to body rows.
+        executor (Optional[Executor]): Executor used for rendering, the event loop's
+        default executor if None. A ProcessPoolExecutor can be used.
+
+    Returns:
+        AsyncIterator[str]: The Markdown table, a line or chunk of lines at a time.
+    """
+    transforms = normalize_transforms(transforms)
+    rows = aiter(rows)
+    header = await anext(rows, None)
+    if header is None:
+        raise ValueError("Table data is empty.")
+    for line in core.iter_md_table([header], alignments, 1, transforms):
+        yield line
+
+    chunk = []
+    async for row in rows:
+        if len(row) != len(header):
+            raise ValueError("All rows must have the same number of columns.")
+        chunk.append(row)
+        if len(chunk) >= core.CHUNK_SIZE:
+            yield await _offload(executor, core._render_chunk, chunk, transforms)
+            chunk = []
+    if chunk:
+        yield await _offload(executor, core._render_chunk, chunk, transforms)
+
+
+async def generate_md_table(
+    data: list[list[str]],
+    alignments: str | list[str] | None = None,
+    transforms: str | Sequence[str] = DEFAULT_TRANSFORMS,
+    executor: Executor | None = None,
+) -> str:
+    """
+    Generate a Markdown table in an executor, without blocking the event loop.
+
+    Parameters:
+        data (List[List[str]]): A list of rows, where each row is a list of string
+        cells.
+        alignments (Optional[Union[List[str], str]]): Column alignments ('left',
+        'center', 'right') as a list or comma-separated string.
+        transforms (Union[str, Sequence[str]]): Names of the cell transforms applied
+        to body rows.
+        executor (Optional[Executor]): Executor used for rendering, the event loop's
+        default executor if None.
+
+    Returns:
+        str: The generated Markdown table as a string.
+    """
+    return await _offload(
+        executor, core.generate_md_table, data, alignments, 1, transforms
+    )
+
+
+async def write_lines(
+    writer: Any, lines: AsyncIterable[str], encoding: str = "utf-8"
+) -> None:
+    """
+    Write lines to an async writer, waiting for it to drain after each write.
+
+    Parameters:
+        writer (Any): An asyncio.StreamWriter, or any object whose `write` method
+        is a coroutine (such as an aiohttp StreamResponse).
+        lines (AsyncIterable[str]): The lines to write, without trailing newlines.
+        encoding (str): Text encoding of the output.
+    """
+    separator = ""
+    async for line in lines:
+        result = writer.write((separator + line).encode(encoding))
+        if inspect.isawaitable(result):
+            await result
+        elif hasattr(writer, "drain"):
+            await writer.drain()
+        separator = "\n"
+
+
+async def convert(
+    source: AsyncIterable[bytes],
+    writer: Any,
+    alignments: str | list[str] | None = None,
+    transforms: str | Sequence[str] = DEFAULT_TRANSFORMS,
+    executor: Executor | None = None,
+) -> None:
+    """
+    Stream a CSV byte source into a Markdown table on an async writer.
+
+    Parameters:
+        source (AsyncIterable[bytes]): Chunks of CSV data.
+        writer (Any): An asyncio.StreamWriter or an object with a coroutine `write`.
+        alignments (Optional[Union[List[str], str]]): Column alignments ('left',
+        'center', 'right') as a list or comma-separated string.
+        transforms (Union[str, Sequence[str]]): Names of the cell transforms applied
+        to body rows.
+        executor (Optional[Executor]): Executor used for rendering.
+    """
+    rows = iter_csv(source)
+    await write_lines(writer, iter_md_table(rows, alignments, transforms, executor))
+
+
+async def _offload(executor: Executor | None, func: Callable, *args: Any) -> Any:
+    """
+    Run a function in an executor, limiting how many run at once per event loop.
+
+    Parameters:
+        executor (Optional[Executor]): The executor, or None for the loop default.
+        func (Callable): The function to run.
+        *args (Any): Positional arguments for the function.
+
+    Returns:
+        Any: The function's return value.
+    """
+    loop = asyncio.get_running_loop()
+    if loop not in _limits:
+        _limits[loop] = asyncio.Semaphore(MAX_CONCURRENT_RENDERS)
+    async with _limits[loop]:
+        return await loop.run_in_executor(executor, func, *args)
@@ -0,0 +1,153 @@
+import csv
+import glob
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from .compression import split_compression
+from .core import generate_md_table, read_csv, write_output
+
+
+def expand_sources(patterns: Iterable[str]) -> list[str]:
+    """
+    Expand glob patterns into a sorted, de-duplicated list of CSV paths.
+
+    Parameters:
+        patterns (Iterable[str]): Glob patterns or plain paths. '**' matches
+        recursively.
+
+    Returns:
+        List[str]: The matching file paths.
+    """
+    paths: set[str] = set()
+    for pattern in patterns:
+        matches = glob.glob(pattern, recursive=True)
+        paths.update(p for p in matches if Path(p).is_file())
+    return sorted(paths)
+
+
+def output_path(src: str, out_dir: str) -> str:
+    """
+    Build the Markdown output path for a CSV file.
+
+    Parameters:
+        src (str): Path to the input CSV file.
+        out_dir (str): Directory the Markdown file is written to.
+
+    Returns:
+        str: The output path, named after the input with a '.md' extension. A
+        compression extension such as '.gz' is dropped first.
+    """
+    name = Path(split_compression(src)[0]).with_suffix(".md").name
+    return str(Path(out_dir) / name)
+
+
+def convert_file(
+    src: str, dest: str, alignments: str | list[str] | None = None
+) -> float:
+    """
+    Convert one CSV file into a Markdown file.
+
+    Parameters:
+        src (str): Path to the input CSV file.
+        dest (str): Path to the output Markdown file.
+        alignments (Optional[Union[List[str], str]]): Column alignments ('left',
+        'center', 'right') as a list or comma-separated string.
+
+    Returns:
+        float: The time taken, in seconds.
+    """
+    start = time.perf_counter()
+    write_output(dest, generate_md_table(read_csv(src), alignments))
+    return time.perf_counter() - start
+
+
+def _convert_task(
+    src: str, dest: str, alignments: str | list[str] | None
+) -> tuple[str, str, float | str]:
+    """
+    Convert a file, capturing errors so one bad file does not stop the batch.
+
+    Parameters:
+        src (str): Path to the input CSV file.
+        dest (str): Path to the output Markdown file.
+        alignments (Optional[Union[List[str], str]]): Column alignments.
+
+    Returns:
+        Tuple[str, str, Union[float, str]]: The source, destination and either the
+        elapsed seconds or an error message.
+    """
+    try:
+        return src, dest, convert_file(src, dest, alignments)
+    except (OSError, ValueError, UnicodeDecodeError, csv.Error) as e:
+        return src, dest, str(e)
+
+
+def run_batch(
+    sources: Iterable[str],
+    out_dir: str,
+    alignments: str | list[str] | None = None,
+    workers: int = 1,
+) -> Iterator[tuple[str, str, float | str]]:
+    """
+    Convert many CSV files in a single process, or across a process pool.
+
+    Parameters:
+        sources (Iterable[str]): Paths to the input CSV files.
+        out_dir (str): Directory the Markdown files are written to. It is created
+        if missing.
+        alignments (Optional[Union[List[str], str]]): Column alignments applied to
+        every file.
+        workers (int): Number of processes used to convert files.
+
+    Returns:
+        Iterator[Tuple[str, str, Union[float, str]]]: For each file, in input order,
+        the source, destination and either the elapsed seconds or an error message.
+        Files that would be written to the same output, such as 'a/x.csv' and
+        'b/x.csv', are all reported as errors and none of them is converted.
+    """
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    sources = list(sources)
+    dests = [output_path(src, out_dir) for src in sources]
+    clashes = {dest for dest, count in Counter(dests).items() if count > 1}
+    tasks = [(src, dest) for src, dest in zip(sources, dests) if dest not in clashes]
+    srcs = [src for src, _ in tasks]
+    outs = [dest for _, dest in tasks]
+    aligns = [alignments] * len(tasks)
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            converted = pool.map(_convert_task, srcs, outs, aligns)
+            yield from _report_clashes(sources, dests, clashes, converted)
+    else:
+        converted = map(_convert_task, srcs, outs, aligns)
+        yield from _report_clashes(sources, dests, clashes, converted)
+
+
+def _report_clashes(
+    sources: list[str],
+    dests: list[str],
+    clashes: set[str],
+    converted: Iterator[tuple[str, str, float | str]],
+) -> Iterator[tuple[str, str, float | str]]:
+    """
+    Put an error for each file with a shared output back among the conversions.
+
+    Parameters:
+        sources (List[str]): Paths to the input CSV files.
+        dests (List[str]): The output path of each input file.
+        clashes (Set[str]): Output paths shared by more than one input file.
+        converted (Iterator[Tuple[str, str, Union[float, str]]]): The results of
+        the other files, in input order.
+
+    Returns:
+        Iterator[Tuple[str, str, Union[float, str]]]: The results of all files, in
+        input order.
+    """
+    for src, dest in zip(sources, dests):
+        if dest in clashes:
+            yield src, dest, f"{dest} is also the output of another input file"
+        else:
+            yield next(converted)
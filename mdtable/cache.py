@@ -0,0 +1,125 @@
+import hashlib
+import os
+from pathlib import Path
+
+from ._version import __version__
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def default_cache_dir() -> str:
+    """
+    Return the default cache directory, honoring XDG_CACHE_HOME.
+
+    Returns:
+        str: The path to the mdtable cache directory.
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return str(Path(base) / "mdtable")
+
+
+class RenderCache:
+    """
+    On-disk cache of rendered Markdown tables with size-bounded LRU eviction.
+
+    Entries are keyed on a hash of the input bytes plus the rendering options, and
+    each hit refreshes the entry's modification time so the least recently used
+    entries are evicted first once the cache grows past `max_bytes`.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """
+        Parameters:
+            cache_dir (str): Directory holding the cache entries. It is created on
+            first write.
+            max_bytes (int): Maximum total size of the cache entries.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(input_path: str, **options: object) -> str:
+        """
+        Build a cache key from the contents of a file and the rendering options.
+
+        Parameters:
+            input_path (str): Path to the input file.
+            **options (object): Options that affect the rendered output.
+
+        Returns:
+            str: A hex digest identifying the rendered output.
+        """
+        with open(input_path, "rb") as f:
+            digest = hashlib.file_digest(f, "sha256")
+        digest.update(repr((__version__, sorted(options.items()))).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """
+        Look up a rendered table, marking it as recently used.
+
+        Parameters:
+            key (str): The cache key.
+
+        Returns:
+            Optional[str]: The cached Markdown, or None on a miss.
+        """
+        path = self.cache_dir / f"{key}.md"
+        try:
+            content = path.read_text(encoding="utf-8")
+            os.utime(path)
+        except OSError:
+            return None
+        return content
+
+    def put(self, key: str, content: str) -> None:
+        """
+        Store a rendered table, then evict old entries if the cache is too large.
+
+        The entry is written to a temporary file and renamed into place, so
+        concurrent readers never see a partial entry. Tables larger than the whole
+        cache are not stored, rather than evicting every other entry.
+
+        Parameters:
+            key (str): The cache key.
+            content (str): The rendered Markdown.
+        """
+        import tempfile
+
+        data = content.encode("utf-8")
+        if len(data) > self.max_bytes:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        path = self.cache_dir / f"{key}.md"
+        os.replace(tmp, path)
+        self.evict(keep=path)
+
+    def evict(self, keep: Path | None = None) -> None:
+        """
+        Remove the least recently used entries until the cache fits in max_bytes.
+
+        Parameters:
+            keep (Optional[Path]): An entry that is never removed, such as the one
+            just written.
+        """
+        entries = []
+        for path in self.cache_dir.glob("*.md"):
+            if path == keep:
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        if keep is not None and keep.exists():
+            total += keep.stat().st_size
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
@@ -1,8 +1,15 @@
 #!/usr/bin/env python3
 import argparse
+import os
+import sys
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
 
-from .core import generate_md_table, read_csv, write_output
-from .preview import preview_table
+# Everything else is imported by the code path that needs it, to keep startup fast.
+from .stats import NullStats, Stats
+
+if TYPE_CHECKING:
+    from .table import Table
 
 
 def main() -> None:
@@ -12,24 +19,740 @@ def main() -> None:
     Returns:
         None
     """
-    parser = argparse.ArgumentParser(description="Generate Markdown tables from CSV")
-    parser.add_argument("--input", required=True, help="Path to CSV file")
-    parser.add_argument("--output", help="Path to save Markdown output")
+    if len(sys.argv) > 1 and sys.argv[1] in COMMANDS:
+        COMMANDS[sys.argv[1]](sys.argv[2:])
+        return
+
+    parser = build_parser()
+    args = parser.parse_args()
+    check_args(parser, args)
+
+    stats = Stats() if args.stats else NullStats()
+    profiler = None
+    if args.profile:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        convert(args, stats)
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+        if args.stats:
+            print(stats.format(args.stats), file=sys.stderr)
+
+
+def check_args(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """
+    Reject combinations of options that cannot work together.
+
+    Parameters:
+        parser (argparse.ArgumentParser): The parser, used to report errors.
+        args (argparse.Namespace): The parsed command-line arguments.
+
+    Returns:
+        None
+    """
+    if args.incremental:
+        check_incremental(parser, args)
+    check_selection(parser, args)
+    check_output_modes(parser, args)
+
+
+def check_incremental(
+    parser: argparse.ArgumentParser, args: argparse.Namespace
+) -> None:
+    """
+    Reject inputs and options that --incremental cannot handle.
+
+    Parameters:
+        parser (argparse.ArgumentParser): The parser, used to report errors.
+        args (argparse.Namespace): The parsed command-line arguments.
+
+    Returns:
+        None
+    """
+    from .compression import detect_compression, split_compression
+    from .readers import detect_format
+
+    if not args.output or args.input == "-":
+        parser.error("--incremental requires an input file and --output")
+    if (args.format or detect_format(args.input)) != "csv":
+        parser.error("--incremental only supports CSV input")
+    if detect_compression(args.input) or split_compression(args.output)[1]:
+        parser.error("--incremental does not support compressed files")
+    if any(selection(args).values()):
+        parser.error(
+            "--incremental cannot be combined with --columns, --where, --limit, "
+            "--offset, --sort-by, --group-by or --agg"
+        )
+
+
+def check_selection(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """
+    Reject inconsistent row selection and sorting options.
+
+    Parameters:
+        parser (argparse.ArgumentParser): The parser, used to report errors.
+        args (argparse.Namespace): The parsed command-line arguments.
+
+    Returns:
+        None
+    """
+    if (args.top is not None or args.desc) and not args.sort_by:
+        parser.error("--top and --desc require --sort-by")
+    if args.top is not None and args.limit is not None:
+        parser.error("--top cannot be combined with --limit")
+    for option in ("limit", "offset", "top"):
+        if (getattr(args, option) or 0) < 0:
+            parser.error(f"--{option} must not be negative")
+
+
+def check_output_modes(
+    parser: argparse.ArgumentParser, args: argparse.Namespace
+) -> None:
+    """
+    Reject output options that do not work with the chosen output mode.
+
+    Parameters:
+        parser (argparse.ArgumentParser): The parser, used to report errors.
+        args (argparse.Namespace): The parsed command-line arguments.
+
+    Returns:
+        None
+    """
+    paged = args.page_rows or args.page_bytes
+    if args.page_sections and not paged:
+        parser.error("--page-sections requires --page-rows or --page-bytes")
+    if paged and (args.preview or args.incremental):
+        parser.error(
+            "--page-rows and --page-bytes cannot be combined with --preview or "
+            "--incremental"
+        )
+    if args.pager and not args.preview:
+        parser.error("--pager requires --preview")
+    if args.pad and (args.stream or args.incremental):
+        parser.error("--pad cannot be combined with --stream or --incremental")
+    if args.typed and (args.stream or args.incremental or args.pager):
+        parser.error(
+            "--typed cannot be combined with --stream, --incremental or --pager"
+        )
+
+
+def selection(args: argparse.Namespace) -> dict:
+    """
+    Collect the row and column selection and sorting options for the readers.
+
+    Parameters:
+        args (argparse.Namespace): The parsed command-line arguments.
+
+    Returns:
+        dict: Keyword arguments for `readers.iter_rows`.
+    """
+    return {
+        "columns": args.columns.split(",") if args.columns else None,
+        "where": args.where,
+        "limit": args.limit if args.top is None else args.top,
+        "offset": args.offset,
+        "sort_by": args.sort_by,
+        "desc": args.desc,
+        "group_by": args.group_by.split(",") if args.group_by else [],
+        "aggs": args.agg or [],
+    }
+
+
+def paging(args: argparse.Namespace) -> tuple[int | None, int | None, bool]:
+    """
+    Collect the output splitting options for the writers.
+
+    Parameters:
+        args (argparse.Namespace): The parsed command-line arguments.
+
+    Returns:
+        Tuple[Optional[int], Optional[int], bool]: The page_rows, page_bytes and
+        sections arguments of `core.write_output`.
+    """
+    return args.page_rows, args.page_bytes, args.page_sections
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser for the main command.
+
+    Returns:
+        argparse.ArgumentParser: The configured parser.
+    """
+    from .core import VALID_BACKENDS
+    from .readers import READERS
+    from .transforms import DEFAULT_TRANSFORMS
+
+    parser = argparse.ArgumentParser(
+        description="Generate Markdown tables from CSV",
+        epilog="Other commands: 'mdtable batch' converts many files in one run, "
+        "'mdtable watch' re-renders files as they change, 'mdtable serve' keeps a "
+        "rendering server warm and 'mdtable client' sends a file to it. Add --help "
+        "to any of them for details.",
+    )
+    parser.add_argument(
+        "--input",
+        required=True,
+        help="Path to CSV file, optionally compressed (.gz, .bz2, .xz, .zst)",
+    )
+    parser.add_argument(
+        "--output",
+        help="Path to save Markdown output, compressed if it ends in .gz, .bz2, "
+        ".xz or .zst",
+    )
     parser.add_argument(
         "--align", help="Comma-separated alignment (e.g. left,center,right)"
     )
     parser.add_argument(
         "--preview", action="store_true", help="Preview table in terminal"
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--pager",
+        action="store_true",
+        help="Browse the --preview interactively, one screen at a time",
+    )
+    parser.add_argument(
+        "--format",
+        choices=sorted(READERS),
+        help="Input format (default: detected from the file extension)",
+    )
+    parser.add_argument(
+        "--columns", help="Comma-separated names of the columns to keep, in order"
+    )
+    parser.add_argument(
+        "--where",
+        action="append",
+        default=[],
+        help="Keep only rows matching a condition such as 'Score>=80' "
+        "(operators: = != < <= > >= ~); may be repeated",
+    )
+    parser.add_argument("--limit", type=int, help="Keep at most this many rows")
+    parser.add_argument(
+        "--offset", type=int, default=0, help="Skip this many matching rows first"
+    )
+    parser.add_argument("--sort-by", help="Name of the column to sort rows by")
+    parser.add_argument("--desc", action="store_true", help="Sort in descending order")
+    parser.add_argument(
+        "--top", type=int, help="Keep only the first N rows in --sort-by order"
+    )
+    parser.add_argument(
+        "--group-by", help="Comma-separated columns to summarize rows by"
+    )
+    parser.add_argument(
+        "--agg",
+        help="Comma-separated aggregates per group: count or count, sum, min, max "
+        "or mean of a column (e.g. count,sum:Balance)",
+    )
+    parser.add_argument(
+        "--page-rows",
+        type=int,
+        help="Split the output into pages of at most N rows, each repeating the "
+        "header, written to OUTPUT-1.md, OUTPUT-2.md, ...",
+    )
+    parser.add_argument(
+        "--page-bytes",
+        type=int,
+        help="Split the output into pages of at most N bytes",
+    )
+    parser.add_argument(
+        "--page-sections",
+        action="store_true",
+        help="Write the pages as separate tables in a single output",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream rows from input to output without loading the whole table",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=sorted(VALID_BACKENDS),
+        default="csv",
+        help="CSV parser to use for input files",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes used to render the table",
+    )
+    parser.add_argument(
+        "--cache-dir", help="Directory for cached tables (default: ~/.cache/mdtable)"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Always re-render the table"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Append only new rows of an append-only CSV to the existing output",
+    )
+    parser.add_argument(
+        "--transforms",
+        default=",".join(DEFAULT_TRANSFORMS),
+        help="Comma-separated cell transforms (commas, escape, trim)",
+    )
+    parser.add_argument(
+        "--stats",
+        nargs="?",
+        const="human",
+        choices=["human", "json"],
+        help="Print per-stage timings, throughput and peak memory to stderr",
+    )
+    parser.add_argument("--profile", help="Write cProfile data to this file")
+    parser.add_argument(
+        "--zstd-threads",
+        type=int,
+        default=0,
+        help="Threads used to compress .zst output (-1: one per CPU)",
+    )
+    parser.add_argument(
+        "--typed",
+        action="store_true",
+        help="Detect numeric columns, format them and align them to the right",
+    )
+    parser.add_argument(
+        "--precision",
+        type=int,
+        help="Decimal places for float and decimal columns with --typed",
+    )
+    parser.add_argument(
+        "--pad",
+        action="store_true",
+        help="Pad cells so the Markdown columns line up as plain text",
+    )
+    return parser
+
+
+def convert(args: argparse.Namespace, stats: Stats) -> None:
+    """
+    Run the conversion selected by the command-line arguments.
+
+    Parameters:
+        args (argparse.Namespace): The parsed command-line arguments.
+        stats (Stats): Collects timings and counters for --stats.
 
-    data = read_csv(args.input)
+    Returns:
+        None
+    """
     alignments = args.align.split(",") if args.align else None
-    md_table = generate_md_table(data, alignments)
+    query = selection(args)
+    if stats.enabled and args.input != "-":
+        stats.bytes_in = os.path.getsize(args.input)
+
+    if args.pager:
+        from .pager import page_csv
+
+        with stats.stage("pager"):
+            page_csv(args.input, args.format, args.backend, **query)
+        return
+
+    if args.stream:
+        from .core import write_lines
+        from .preview import preview_csv
+
+        with stats.stage("stream"):
+            if args.preview:
+                preview_csv(args.input, alignments, args.backend, args.format, **query)
+            else:
+                lines = stream_lines(args, alignments, stats)
+                paths = write_lines(
+                    args.output, lines, *paging(args), args.zstd_threads
+                )
+                if stats.enabled and paths:
+                    stats.bytes_out = sum(map(os.path.getsize, paths))
+        return
 
     if args.preview:
-        preview_table(data, alignments)
-    elif args.output:
-        write_output(args.output, md_table)
+        from .preview import preview_table
+        from .readers import read_table
+
+        with stats.stage("read"):
+            table = read_table(args.input, args.format, args.backend, **query)
+        stats.rows = len(table)
+        if args.typed:
+            table, alignments = format_typed(table, alignments, args, stats)
+        with stats.stage("preview"):
+            preview_table(table, alignments)
+        return
+
+    if args.incremental:
+        from .incremental import render_incremental
+
+        with stats.stage("incremental"):
+            render_incremental(args.input, args.output, alignments, args.transforms)
+        return
+
+    from .core import write_output
+
+    md_table = render(args, alignments, stats)
+    with stats.stage("write"):
+        write_output(args.output, md_table, *paging(args), args.zstd_threads)
+    if stats.enabled:
+        stats.bytes_out = len(md_table.encode("utf-8"))
+
+
+def splits_input(args: argparse.Namespace) -> bool:
+    """
+    Check whether --jobs can hand byte ranges of the input file to the workers.
+
+    That works for local, uncompressed CSV files rendered as they are. Other
+    inputs are read here and their rows sent to the workers.
+
+    Parameters:
+        args (argparse.Namespace): The parsed command-line arguments.
+
+    Returns:
+        bool: True if the workers can read the input themselves.
+    """
+    from .compression import detect_compression
+    from .readers import detect_format
+
+    if args.jobs < 2 or args.input == "-" or args.typed or args.pad:
+        return False
+    if any(selection(args).values()):
+        return False
+    fmt = args.format or detect_format(args.input)
+    return fmt == "csv" and not detect_compression(args.input)
+
+
+def stream_lines(
+    args: argparse.Namespace, alignments: list[str] | None, stats: Stats
+) -> Iterator[str]:
+    """
+    Lazily render the input file for --stream.
+
+    Parameters:
+        args (argparse.Namespace): The parsed command-line arguments.
+        alignments (Optional[List[str]]): Column alignments.
+        stats (Stats): Collects timings and counters for --stats.
+
+    Returns:
+        Iterator[str]: The Markdown table, one line (or chunk of lines) at a time.
+    """
+    if splits_input(args):
+        from .parallel import iter_md_csv_parallel
+
+        lines = iter_md_csv_parallel(args.input, alignments, args.jobs, args.transforms)
+        return stats.count_lines(lines)
+
+    from .core import iter_md_table
+    from .readers import iter_rows
+
+    rows = iter_rows(args.input, args.format, args.backend, **selection(args))
+    counted = stats.count_rows(rows)
+    return iter_md_table(counted, alignments, args.jobs, args.transforms)
+
+
+def render(args: argparse.Namespace, alignments: list[str] | None, stats: Stats) -> str:
+    """
+    Render the input file, serving it from the render cache when unchanged.
+
+    Stdin is never cached.
+
+    Parameters:
+        args (argparse.Namespace): The parsed command-line arguments.
+        alignments (Optional[List[str]]): Column alignments.
+        stats (Stats): Collects timings and counters for --stats.
+
+    Returns:
+        str: The generated Markdown table.
+    """
+    from .cache import RenderCache, default_cache_dir
+    from .readers import detect_format
+
+    query = selection(args)
+    cache = None
+    if not args.no_cache and args.input != "-":
+        with stats.stage("cache"):
+            cache = RenderCache(args.cache_dir or default_cache_dir())
+            key = cache.key(
+                args.input,
+                align=alignments,
+                transforms=args.transforms,
+                format=args.format or detect_format(args.input),
+                **query,
+                typed=args.typed,
+                precision=args.precision,
+                padded=args.pad,
+            )
+            cached = cache.get(key)
+        if cached is not None:
+            # Body rows: every line but the header and the alignment row.
+            stats.rows = cached.count("\n") - 1
+            return cached
+
+    md_table = render_table(args, alignments, stats)
+    if cache:
+        with stats.stage("cache"):
+            cache.put(key, md_table)
+    return md_table
+
+
+def render_table(
+    args: argparse.Namespace, alignments: list[str] | None, stats: Stats
+) -> str:
+    """
+    Read and render the input file.
+
+    Parameters:
+        args (argparse.Namespace): The parsed command-line arguments.
+        alignments (Optional[List[str]]): Column alignments.
+        stats (Stats): Collects timings and counters for --stats.
+
+    Returns:
+        str: The generated Markdown table.
+    """
+    from .core import generate_md_table
+    from .readers import read_rows, read_table
+
+    query = selection(args)
+    if splits_input(args):
+        from .parallel import iter_md_csv_parallel
+
+        with stats.stage("render"):
+            lines = iter_md_csv_parallel(
+                args.input, alignments, args.jobs, args.transforms
+            )
+            md_table = "\n".join(lines)
+        stats.rows = md_table.count("\n") - 1
+        return md_table
+
+    data: list[list[str]] | Table
+    if args.typed:
+        with stats.stage("read"):
+            table = read_table(args.input, args.format, args.backend, **query)
+        stats.rows = len(table)
+        data, alignments = format_typed(table, alignments, args, stats)
+    else:
+        with stats.stage("read"):
+            data = read_rows(args.input, args.format, args.backend, **query)
+        stats.rows = len(data) - 1
+    with stats.stage("render"):
+        return generate_md_table(data, alignments, args.jobs, args.transforms, args.pad)
+
+
+def format_typed(
+    table: "Table", alignments: list[str] | None, args: argparse.Namespace, stats: Stats
+) -> tuple["Table", list[str]]:
+    """
+    Apply --typed formatting: infer column types, format numbers, align right.
+
+    Parameters:
+        table (Table): The table read from the input.
+        alignments (Optional[List[str]]): Explicit column alignments.
+        args (argparse.Namespace): The parsed command-line arguments.
+        stats (Stats): Collects timings and counters for --stats.
+
+    Returns:
+        Tuple[Table, List[str]]: The formatted table and its alignments.
+    """
+    from .typed import format_table
+
+    with stats.stage("types"):
+        return format_table(table, alignments, args.precision)
+
+
+def batch(argv: list[str]) -> None:
+    """
+    Entry point for the 'batch' command, converting many CSV files in one process.
+
+    Parameters:
+        argv (List[str]): Command-line arguments following 'batch'.
+
+    Returns:
+        None
+    """
+    import time
+
+    from .batch import expand_sources, run_batch
+
+    parser = argparse.ArgumentParser(
+        prog="mdtable batch", description="Convert many CSV files to Markdown"
+    )
+    parser.add_argument("sources", nargs="+", help="CSV files or glob patterns")
+    parser.add_argument(
+        "--out-dir", required=True, help="Directory to save Markdown files"
+    )
+    parser.add_argument(
+        "--align", help="Comma-separated alignment (e.g. left,center,right)"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=1, help="Number of processes converting files"
+    )
+    args = parser.parse_args(argv)
+
+    sources = expand_sources(args.sources)
+    if not sources:
+        parser.error("no CSV files matched")
+
+    start = time.perf_counter()
+    failed = report(run_batch(sources, args.out_dir, args.align, args.jobs))
+    elapsed = time.perf_counter() - start
+    print(
+        f"Converted {len(sources) - failed} of {len(sources)} files in {elapsed:.3f}s",
+        file=sys.stderr,
+    )
+    if failed:
+        sys.exit(1)
+
+
+def watch(argv: list[str]) -> None:
+    """
+    Entry point for the 'watch' command, re-rendering CSV files as they change.
+
+    Parameters:
+        argv (List[str]): Command-line arguments following 'watch'.
+
+    Returns:
+        None
+    """
+    from .watch import DEBOUNCE_SECONDS, POLL_INTERVAL, make_watcher
+    from .watch import watch as watch_files
+
+    parser = argparse.ArgumentParser(
+        prog="mdtable watch",
+        description="Re-render CSV files to Markdown whenever they change",
+    )
+    parser.add_argument("sources", nargs="+", help="CSV files or glob patterns")
+    parser.add_argument(
+        "--out-dir", required=True, help="Directory to save Markdown files"
+    )
+    parser.add_argument(
+        "--align", help="Comma-separated alignment (e.g. left,center,right)"
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=DEBOUNCE_SECONDS,
+        help="Seconds without changes to wait before rendering",
+    )
+    parser.add_argument(
+        "--poll", action="store_true", help="Poll for changes instead of using inotify"
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=POLL_INTERVAL,
+        help="Seconds between scans when polling",
+    )
+    args = parser.parse_args(argv)
+
+    watcher = make_watcher(args.sources, args.poll, args.interval)
+    kind = type(watcher).__name__.removesuffix("Watcher").lower()
+    print(f"Watching {', '.join(args.sources)} with {kind}", file=sys.stderr)
+    rounds = watch_files(args.sources, args.out_dir, args.align, args.debounce, watcher)
+    try:
+        for results in rounds:
+            report(results)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        rounds.close()
+
+
+def report(results: Iterable[tuple[str, str, float | str]]) -> int:
+    """
+    Print the outcome of each file conversion to stderr.
+
+    Parameters:
+        results (Iterable[Tuple[str, str, Union[float, str]]]): The source,
+        destination and either the elapsed seconds or an error message of each
+        converted file.
+
+    Returns:
+        int: The number of files that failed.
+    """
+    failed = 0
+    for src, dest, result in results:
+        if isinstance(result, str):
+            failed += 1
+            print(f"{src}: error: {result}", file=sys.stderr)
+        else:
+            print(f"{src} -> {dest} ({result:.3f}s)", file=sys.stderr)
+    return failed
+
+
+def serve(argv: list[str]) -> None:
+    """
+    Entry point for the 'serve' command, running a local rendering server.
+
+    Parameters:
+        argv (List[str]): Command-line arguments following 'serve'.
+
+    Returns:
+        None
+    """
+    from .server import DEFAULT_HOST, DEFAULT_PORT, make_server
+
+    parser = argparse.ArgumentParser(
+        prog="mdtable serve",
+        description="Keep a warm rendering server that accepts CSV over HTTP",
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Interface to bind")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port to bind")
+    args = parser.parse_args(argv)
+
+    server = make_server(args.host, args.port)
+    print(f"Serving on http://{args.host}:{server.server_port}/", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def client(argv: list[str]) -> None:
+    """
+    Entry point for the 'client' command, rendering a file on a running server.
+
+    Parameters:
+        argv (List[str]): Command-line arguments following 'client'.
+
+    Returns:
+        None
+    """
+    from .core import write_output
+    from .server import DEFAULT_HOST, DEFAULT_PORT, request_render
+
+    parser = argparse.ArgumentParser(
+        prog="mdtable client", description="Render a CSV file on an mdtable server"
+    )
+    parser.add_argument("--input", required=True, help="Path to CSV file")
+    parser.add_argument("--output", help="Path to save Markdown output")
+    parser.add_argument(
+        "--align", help="Comma-separated alignment (e.g. left,center,right)"
+    )
+    parser.add_argument(
+        "--transforms", help="Comma-separated cell transforms (commas, escape, trim)"
+    )
+    parser.add_argument(
+        "--preview", action="store_true", help="Preview table in terminal"
+    )
+    parser.add_argument(
+        "--url",
+        default=f"http://{DEFAULT_HOST}:{DEFAULT_PORT}/",
+        help="Address of the server",
+    )
+    args = parser.parse_args(argv)
+
+    if args.input == "-":
+        body = sys.stdin.buffer.read()
     else:
-        print(md_table)
+        with open(args.input, "rb") as f:
+            body = f.read()
+
+    content = request_render(body, args.url, args.align, args.transforms, args.preview)
+    if args.output and not args.preview:
+        write_output(args.output, content)
+    else:
+        print(content)
+
+
+COMMANDS = {"batch": batch, "watch": watch, "serve": serve, "client": client}
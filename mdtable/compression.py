@@ -0,0 +1,150 @@
+import io
+import os
+from typing import IO, TextIO, cast
+
+BLOCK_SIZE = 1024 * 1024
+
+EXTENSIONS = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz", ".zst": "zstd"}
+MAGIC = {
+    b"\x1f\x8b": "gzip",
+    # 'BZh' is followed by the block size, from '1' to '9'.
+    **{b"BZh%d" % size: "bz2" for size in range(1, 10)},
+    b"\xfd7zXZ\x00": "xz",
+    b"\x28\xb5\x2f\xfd": "zstd",
+}
+
+
+def split_compression(path: str) -> tuple[str, str | None]:
+    """
+    Split a compression extension such as '.gz' off a path.
+
+    Parameters:
+        path (str): The path.
+
+    Returns:
+        Tuple[str, Optional[str]]: The path without the extension and the codec
+        name, or the unchanged path and None if it has no compression extension.
+    """
+    root, ext = os.path.splitext(path)
+    codec = EXTENSIONS.get(ext.lower())
+    return (root, codec) if codec else (path, None)
+
+
+def detect_compression(path: str) -> str | None:
+    """
+    Detect the codec of an input file from its extension or its first bytes.
+
+    Parameters:
+        path (str): Path to the input file. Stdin ("-") is never decompressed.
+
+    Returns:
+        Optional[str]: 'gzip', 'bz2', 'xz' or 'zstd', or None if uncompressed.
+    """
+    if path == "-":
+        return None
+    codec = split_compression(path)[1]
+    if codec:
+        return codec
+    try:
+        with open(path, "rb") as f:
+            head = f.read(6)
+    except OSError:
+        return None
+    for magic, name in MAGIC.items():
+        if head.startswith(magic):
+            return name
+    return None
+
+
+def open_input(path: str, newline: str | None = "") -> TextIO:
+    """
+    Open a text file for reading, decompressing it on the fly if needed.
+
+    Compressed files are decoded in blocks of BLOCK_SIZE bytes, without a
+    temporary copy on disk.
+
+    Parameters:
+        path (str): Path to the input file.
+        newline (Optional[str]): Newline handling, as for `open`.
+
+    Returns:
+        TextIO: The opened file.
+    """
+    codec = detect_compression(path)
+    if codec is None:
+        return open(path, encoding="utf-8", newline=newline)
+    raw = _open_codec(codec, path, "rb")
+    buffered = io.BufferedReader(raw, BLOCK_SIZE)  # type: ignore[type-var]
+    return io.TextIOWrapper(buffered, encoding="utf-8", newline=newline)
+
+
+def open_output(path: str, zstd_threads: int = 0) -> TextIO:
+    """
+    Open a text file for writing, compressing it if its extension asks for it.
+
+    Text is handed to the compressor in blocks of BLOCK_SIZE bytes.
+
+    Parameters:
+        path (str): Path to the output file.
+        zstd_threads (int): Worker threads for zstd compression: 0 compresses in
+        the calling thread, -1 uses one thread per CPU.
+
+    Returns:
+        TextIO: The opened file.
+    """
+    codec = split_compression(path)[1]
+    if codec is None:
+        return open(path, "w", encoding="utf-8")
+    raw = _open_codec(codec, path, "wb", zstd_threads)
+    buffered = io.BufferedWriter(raw, BLOCK_SIZE)  # type: ignore[arg-type]
+    return io.TextIOWrapper(buffered, encoding="utf-8")
+
+
+def _open_codec(codec: str, path: str, mode: str, zstd_threads: int = 0) -> IO[bytes]:
+    """
+    Open a compressed file as a binary stream.
+
+    Parameters:
+        codec (str): 'gzip', 'bz2', 'xz' or 'zstd'.
+        path (str): Path to the file.
+        mode (str): 'rb' or 'wb'.
+        zstd_threads (int): Worker threads for zstd compression.
+
+    Returns:
+        IO[bytes]: The decompressed (or compressing) stream.
+    """
+    if codec == "gzip":
+        import gzip
+
+        return cast(IO[bytes], gzip.open(path, mode, compresslevel=6))
+    if codec == "bz2":
+        import bz2
+
+        return cast(IO[bytes], bz2.open(path, mode))
+    if codec == "xz":
+        import lzma
+
+        return cast(IO[bytes], lzma.open(path, mode))
+    return _open_zstd(path, mode, zstd_threads)
+
+
+def _open_zstd(path: str, mode: str, threads: int = 0) -> IO[bytes]:
+    """
+    Open a zstd file with the optional zstandard package.
+
+    Parameters:
+        path (str): Path to the file.
+        mode (str): 'rb' or 'wb'.
+        threads (int): Worker threads for compression.
+
+    Returns:
+        IO[bytes]: The decompressed (or compressing) stream.
+    """
+    try:
+        import zstandard  # type: ignore[import-not-found]
+    except ImportError:
+        raise ValueError("Reading and writing .zst files requires zstandard.") from None
+    if mode == "rb":
+        return zstandard.open(path, "rb")
+    compressor = zstandard.ZstdCompressor(threads=threads)
+    return zstandard.open(path, "wb", cctx=compressor)
@@ -1,5 +1,23 @@
 import csv
+import io
+import mmap
+import os
 import sys
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import chain, islice, repeat
+from typing import TextIO, TypeVar
+
+from .compression import detect_compression, open_input, open_output, split_compression
+from .table import Table
+from .transforms import (
+    DEFAULT_TRANSFORMS,
+    compile_cell_formatter,
+    compile_row_formatter,
+    format_header,
+    normalize_transforms,
+)
+from .width import display_width, pad
 
 ALIGN_MAP = {
     "left": ":---",
@@ -7,6 +25,12 @@
     "right": "---:",
 }
 VALID_ALIGNMENTS = {"left", "center", "right"}
+VALID_BACKENDS = {"csv", "mmap", "parallel"}
+CHUNK_SIZE = 10_000
+# Size of the blocks the mmap backend decodes and splits at once.
+MMAP_BLOCK_BYTES = 1024 * 1024
+
+RowT = TypeVar("RowT", bound=Sequence[str])
 
 
 def format_commas(cell: str) -> str:
@@ -23,27 +47,136 @@ def format_commas(cell: str) -> str:
 
 
 def generate_md_table(
-    data: list[list[str]], alignments: str | list[str] | None = None
+    data: list[list[str]] | Table,
+    alignments: str | list[str] | None = None,
+    workers: int = 1,
+    transforms: str | Sequence[str] = DEFAULT_TRANSFORMS,
+    padded: bool = False,
 ) -> str:
     """
     Generate a Markdown-formatted table from a list of rows.
 
     Parameters:
-        data (List[List[str]]): A list of rows, where each row is a list of string
-        cells.
+        data (Union[List[List[str]], Table]): A list of rows, where each row is a
+        list of string cells, or a Table.
         alignments (Optional[Union[List[str], str]]): Column alignments ('left',
         'center', 'right') as a list or comma-separated string.
+        workers (int): Number of processes used to render the rows.
+        transforms (Union[str, Sequence[str]]): Names of the cell transforms applied
+        to body rows, as a sequence or comma-separated string.
+        padded (bool): Pad every cell so the columns also line up as plain text.
+        See `iter_padded_table`; `workers` is ignored.
 
     Returns:
         str: The generated Markdown table as a string.
     """
-    if not data:
-        raise ValueError("Table data is empty.")
-    elif not all(len(row) == len(data[0]) for row in data[1:]):
-        raise ValueError("All rows must have the same number of columns.")
+    # Tables validate column counts as rows are appended
+    if not isinstance(data, Table):
+        if not data:
+            raise ValueError("Table data is empty.")
+        elif not all(len(row) == len(data[0]) for row in data[1:]):
+            raise ValueError("All rows must have the same number of columns.")
+
+    if padded:
+        return "\n".join(iter_padded_table(data, alignments, transforms))
+    return "\n".join(iter_md_table(data, alignments, workers, transforms))
+
+
+def iter_padded_table(
+    data: list[list[str]] | Table,
+    alignments: str | list[str] | None = None,
+    transforms: str | Sequence[str] = DEFAULT_TRANSFORMS,
+) -> Iterator[str]:
+    """
+    Generate the lines of a Markdown table whose columns line up as plain text.
+
+    Body cells are transformed first, then every cell is padded, following its
+    column's alignment, to the widest display width in the column (see
+    `width.display_width`), so CJK and emoji cells stay aligned. The delimiter row
+    is stretched to the same width.
+
+    Parameters:
+        data (Union[List[List[str]], Table]): The header followed by the body rows.
+        alignments (Optional[Union[List[str], str]]): Column alignments ('left',
+        'center', 'right') as a list or comma-separated string.
+        transforms (Union[str, Sequence[str]]): Names of the cell transforms applied
+        to body rows, as a sequence or comma-separated string.
 
-    headers = data[0]
-    rows = data[1:]
+    Returns:
+        Iterator[str]: The Markdown table, one line at a time.
+    """
+    transforms = normalize_transforms(transforms)
+    format_cell = compile_cell_formatter(transforms)
+    rows = iter(data)
+    headers = format_header(next(rows), transforms)
+    body = [[format_cell(cell) for cell in row] for row in rows]
+    align_list = normalize_alignments(alignments) if alignments else []
+    align_list += ["left"] * (len(headers) - len(align_list))
+    widths = [
+        max(len(ALIGN_MAP[align]), *map(display_width, column))
+        for align, column in zip(align_list, zip(headers, *body))
+    ]
+
+    def line(cells: Sequence[str]) -> str:
+        padded = map(pad, cells, widths, align_list)
+        return "| " + " | ".join(padded) + " |"
+
+    yield line(headers)
+    yield "| " + " | ".join(map(_delimiter, align_list, widths)) + " |"
+    for row in body:
+        yield line(row)
+
+
+def _delimiter(align: str, width: int) -> str:
+    """
+    Build a delimiter row cell such as ':---' stretched to a width.
+
+    Parameters:
+        align (str): 'left', 'center' or 'right'.
+        width (int): Width of the column.
+
+    Returns:
+        str: The delimiter cell.
+    """
+    if align == "center":
+        return ":" + "-" * (width - 2) + ":"
+    if align == "right":
+        return "-" * (width - 1) + ":"
+    return ":" + "-" * (width - 1)
+
+
+def iter_md_table(
+    rows: Iterable[Sequence[str]],
+    alignments: str | list[str] | None = None,
+    workers: int = 1,
+    transforms: str | Sequence[str] = DEFAULT_TRANSFORMS,
+) -> Iterator[str]:
+    """
+    Lazily generate the lines of a Markdown-formatted table.
+
+    Column counts are validated row by row as the input is consumed, so the whole
+    table never has to be held in memory. With more than one worker, rows are
+    rendered in chunks across a process pool and each chunk is yielded as a block
+    of newline-separated lines, in input order. The parsed rows have to be pickled
+    over to the workers, which can cost more than rendering them; for CSV files,
+    `parallel.iter_md_csv_parallel` lets the workers read the file themselves.
+
+    Parameters:
+        rows (Iterable[Sequence[str]]): An iterable of rows, the first being the header.
+        alignments (Optional[Union[List[str], str]]): Column alignments ('left',
+        'center', 'right') as a list or comma-separated string.
+        workers (int): Number of processes used to render the rows.
+        transforms (Union[str, Sequence[str]]): Names of the cell transforms applied
+        to body rows, as a sequence or comma-separated string.
+
+    Returns:
+        Iterator[str]: The Markdown table, one line (or chunk of lines) at a time.
+    """
+    transforms = normalize_transforms(transforms)
+    rows = iter(rows)
+    headers = next(rows, None)
+    if headers is None:
+        raise ValueError("Table data is empty.")
     num_cols = len(headers)
 
     # Parse alignments
@@ -53,16 +186,74 @@ def generate_md_table(
     else:
         align_row = [":---"] * num_cols
 
-    formatted_rows = [[format_commas(cell) for cell in row] for row in rows]
+    yield "| " + " | ".join(format_header(headers, transforms)) + " |"
+    yield "| " + " | ".join(align_row) + " |"
+    checked = _check_columns(rows, num_cols)
+    if workers > 1:
+        yield from _render_parallel(checked, workers, transforms)
+    else:
+        yield from map(compile_row_formatter(transforms), checked)
+
+
+def _check_columns(rows: Iterable[RowT], num_cols: int) -> Iterator[RowT]:
+    """
+    Pass rows through, raising as soon as one has the wrong number of columns.
+
+    Parameters:
+        rows (Iterable[Sequence[str]]): An iterable of rows.
+        num_cols (int): The expected number of columns.
+
+    Returns:
+        Iterator[Sequence[str]]: The same rows.
+    """
+    for row in rows:
+        if len(row) != num_cols:
+            raise ValueError("All rows must have the same number of columns.")
+        yield row
+
+
+def _render_chunk(rows: list[Sequence[str]], transforms: tuple[str, ...]) -> str:
+    """
+    Render a chunk of body rows as newline-separated Markdown lines.
+
+    Parameters:
+        rows (List[Sequence[str]]): A list of rows.
+        transforms (Tuple[str, ...]): Names of the cell transforms to apply.
+
+    Returns:
+        str: The formatted Markdown lines.
+    """
+    return "\n".join(map(compile_row_formatter(transforms), rows))
+
+
+def _render_parallel(
+    rows: Iterable[Sequence[str]], workers: int, transforms: tuple[str, ...]
+) -> Iterator[str]:
+    """
+    Render rows in chunks across a process pool, yielding the chunks in order.
+
+    Only a bounded number of chunks are in flight at once, so memory stays flat
+    when the rows come from a lazy iterator.
+
+    Parameters:
+        rows (Iterable[Sequence[str]]): An iterable of rows.
+        workers (int): Number of worker processes.
+        transforms (Tuple[str, ...]): Names of the cell transforms to apply.
 
-    # Build table
-    table = ["| " + " | ".join(headers) + " |"]
-    table.append("| " + " | ".join(align_row) + " |")
-    for row in formatted_rows:
-        padded_row = row + [""] * (num_cols - len(row))  # pad if row is short
-        table.append("| " + " | ".join(padded_row) + " |")
+    Returns:
+        Iterator[str]: Rendered chunks of newline-separated Markdown lines.
+    """
+    from concurrent.futures import ProcessPoolExecutor
 
-    return "\n".join(table)
+    rows = iter(rows)
+    pending: deque = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while chunk := list(islice(rows, CHUNK_SIZE)):
+            pending.append(pool.submit(_render_chunk, chunk, transforms))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
 
 
 def normalize_alignments(alignments: str | list[str]) -> list[str]:
@@ -85,34 +276,427 @@ def normalize_alignments(alignments: str | list[str]) -> list[str]:
     return normalized
 
 
-def read_csv(input_path: str = "") -> list[list[str]]:
+def read_csv(input_path: str = "", backend: str = "csv") -> list[list[str]]:
     """
     Read a CSV file and return its contents as a list of rows.
 
     Parameters:
         input_path (str): Path to the input CSV file. If set to "-", reads from stdin.
+        backend (str): Parser to use: 'csv', 'mmap' or 'parallel'. Stdin is always read
+        with 'csv'.
 
     Returns:
         list[list[str]]: A list of rows, where each row is a list of string cells.
     """
+    return list(iter_csv(input_path, backend))
+
+
+def iter_csv(input_path: str = "", backend: str = "csv") -> Iterator[list[str]]:
+    """
+    Lazily read a CSV file one row at a time.
+
+    Files compressed with gzip, bz2, xz or zstd are decompressed as they are read.
+
+    Parameters:
+        input_path (str): Path to the input CSV file. If set to "-", reads from stdin.
+        backend (str): Parser to use: 'csv', 'mmap' or 'parallel'. Stdin and compressed
+        files are always read with 'csv'.
+
+    Returns:
+        Iterator[list[str]]: An iterator over rows, where each row is a list of
+        string cells.
+    """
+    if backend not in VALID_BACKENDS:
+        raise ValueError(f"Invalid backend: '{backend}'")
+
     if input_path == "-":
-        return list(csv.reader(sys.stdin))
+        yield from csv.reader(sys.stdin)
+    elif backend == "csv" or detect_compression(input_path):
+        with open_input(input_path) as f:
+            yield from csv.reader(f)
+    elif backend == "mmap":
+        yield from _iter_csv_mmap(input_path)
+    else:
+        from .parallel import iter_csv_parallel
+
+        yield from iter_csv_parallel(input_path)
+
+
+def _iter_csv_mmap(input_path: str) -> Iterator[list[str]]:
+    """
+    Read a CSV file through a memory map, splitting quote-free blocks directly.
+
+    The mapped bytes are cut into blocks of about MMAP_BLOCK_BYTES that end on a
+    newline. A block without quotes holds one record per line, so it is decoded at
+    once and split with `str.split`, which is faster than `csv.reader`. From the
+    first block that contains a quote on, the rest of the file is read with
+    `csv.reader`, so quoted files parse no faster than with the 'csv' backend.
+
+    Parameters:
+        input_path (str): Path to the input CSV file.
+
+    Returns:
+        Iterator[list[str]]: An iterator over rows, where each row is a list of
+        string cells.
+    """
+    with open(input_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            pos = 0
+            while pos < size:
+                end = _block_end(buf, pos, size)
+                if buf.find(b'"', pos, end) != -1:
+                    break
+                text = buf[pos:end].decode("utf-8")
+                pos = end
+                yield from _split_block(text)
+            else:
+                return
+        f.seek(pos)
+        yield from csv.reader(io.TextIOWrapper(f, encoding="utf-8", newline=""))
+
+
+def _block_end(buf: mmap.mmap, start: int, size: int) -> int:
+    """
+    Find the end of the block starting at `start`, just past a newline.
+
+    Parameters:
+        buf (mmap.mmap): The mapped file.
+        start (int): Offset of the first byte of the block.
+        size (int): Size of the file.
+
+    Returns:
+        int: Offset just past the last newline within MMAP_BLOCK_BYTES, past the
+        next newline if a line is longer than that, or the file size.
+    """
+    limit = start + MMAP_BLOCK_BYTES
+    if limit >= size:
+        return size
+    newline = buf.rfind(b"\n", start, limit)
+    if newline == -1:
+        newline = buf.find(b"\n", limit)
+    return size if newline == -1 else newline + 1
+
+
+def _split_block(text: str) -> Iterator[list[str]]:
+    """
+    Split a block of quote-free CSV records into cells, as `csv.reader` would.
+
+    Parameters:
+        text (str): The decoded records, each ending with a newline except maybe
+        the last one of the file.
+
+    Returns:
+        Iterator[list[str]]: The records' cells. Blank lines give empty rows.
+    """
+    if "\r" in text:
+        text = text.replace("\r\n", "\n")
+        if "\r" in text:  # csv.reader also ends records on a lone '\r'
+            yield from csv.reader(io.StringIO(text, newline=""))
+            return
+    lines = text.split("\n")
+    if not lines[-1]:
+        lines.pop()
+    if "" in lines:
+        yield from (line.split(",") if line else [] for line in lines)
     else:
-        with open(input_path, newline="", encoding="utf-8") as f:
-            return list(csv.reader(f))
+        yield from map(str.split, lines, repeat(","))
+
+
+def _record_end(buf: bytes | bytearray | mmap.mmap, start: int) -> int:
+    """
+    Find the newline that ends the CSV record starting at `start`.
+
+    As with `csv.reader`, a quote only opens a quoted section at the start of a
+    field; quotes elsewhere, such as in `5'10"`, are plain characters. Newlines
+    inside quoted sections are skipped.
+
+    Parameters:
+        buf (bytes | bytearray | mmap.mmap): The buffer to scan.
+        start (int): Offset of the first byte of the record.
+
+    Returns:
+        int: Offset of the terminating newline, or the buffer length if the record
+        runs to the end of the buffer.
+    """
+    size = len(buf)
+    pos = start
+    while True:
+        # pos is at the start of a field
+        if buf.find(b'"', pos, pos + 1) == pos:
+            pos = _quoted_end(buf, pos + 1)
+        newline = buf.find(b"\n", pos)
+        if newline == -1:
+            newline = size
+        if buf.find(b'"', pos, newline) == -1:
+            return newline
+        comma = buf.find(b",", pos, newline)
+        if comma == -1:
+            return newline
+        pos = comma + 1
+
+
+def _quoted_end(buf: bytes | bytearray | mmap.mmap, pos: int) -> int:
+    """
+    Find the end of a quoted section, skipping escaped quotes ('""').
+
+    Parameters:
+        buf (bytes | bytearray | mmap.mmap): The buffer to scan.
+        pos (int): Offset just past the opening quote.
+
+    Returns:
+        int: Offset just past the closing quote, or the buffer length if the
+        section is never closed.
+    """
+    while True:
+        quote = buf.find(b'"', pos)
+        if quote == -1:
+            return len(buf)
+        if buf.find(b'"', quote + 1, quote + 2) == -1:
+            return quote + 1
+        pos = quote + 2
 
 
-def write_output(output_path: str, content: str) -> None:
+def read_table(input_path: str = "", backend: str = "csv") -> Table:
+    """
+    Read a CSV file into a column-oriented Table.
+
+    Parameters:
+        input_path (str): Path to the input CSV file. If set to "-", reads from stdin.
+        backend (str): Parser to use: 'csv', 'mmap' or 'parallel'.
+
+    Returns:
+        Table: The table, with column widths already computed.
+    """
+    return Table.from_rows(iter_csv(input_path, backend))
+
+
+def write_output(
+    output_path: str,
+    content: str,
+    page_rows: int | None = None,
+    page_bytes: int | None = None,
+    sections: bool = False,
+    zstd_threads: int = 0,
+) -> list[str]:
     """
     Write content to a file or stdout.
 
+    Output paths ending in '.gz', '.bz2', '.xz' or '.zst' are compressed.
+
     Parameters:
         output_path (str): Path to the output file. If '-', content is written to
         stdout.
         content (str): The content to write.
+        page_rows (Optional[int]): Split a table into pages of at most this many
+        body rows, see `write_pages`.
+        page_bytes (Optional[int]): Split a table into pages of at most this many
+        bytes, see `write_pages`.
+        sections (bool): Write the pages as sections of a single output.
+        zstd_threads (int): Worker threads for compressing .zst output, see
+        `compression.open_output`.
+
+    Returns:
+        List[str]: The paths of the files written, empty for stdout.
     """
+    if page_rows or page_bytes:
+        lines = content.split("\n")
+        return write_pages(
+            output_path, lines, page_rows, page_bytes, sections, zstd_threads
+        )
     if output_path:
-        with open(output_path, "w", encoding="utf-8") as f:
+        with open_output(output_path, zstd_threads) as f:
             f.write(content)
-    else:
-        print(content)
+        return [output_path]
+    print(content)
+    return []
+
+
+def write_lines(
+    output_path: str,
+    lines: Iterable[str],
+    page_rows: int | None = None,
+    page_bytes: int | None = None,
+    sections: bool = False,
+    zstd_threads: int = 0,
+) -> list[str]:
+    """
+    Write lines to a file or stdout as they are produced.
+
+    The result is identical to passing the joined lines to `write_output`, but each
+    line is written straight to the output handle instead of being collected first.
+
+    Parameters:
+        output_path (str): Path to the output file. If empty, lines are written to
+        stdout.
+        lines (Iterable[str]): The lines to write, without trailing newlines.
+        page_rows (Optional[int]): Split a table into pages of at most this many
+        body rows, see `write_pages`.
+        page_bytes (Optional[int]): Split a table into pages of at most this many
+        bytes, see `write_pages`.
+        sections (bool): Write the pages as sections of a single output.
+        zstd_threads (int): Worker threads for compressing .zst output, see
+        `compression.open_output`.
+
+    Returns:
+        List[str]: The paths of the files written, empty for stdout.
+    """
+    if page_rows or page_bytes:
+        return write_pages(
+            output_path, lines, page_rows, page_bytes, sections, zstd_threads
+        )
+    if output_path:
+        with open_output(output_path, zstd_threads) as f:
+            _write_joined(f, lines)
+        return [output_path]
+    _write_joined(sys.stdout, lines)
+    sys.stdout.write("\n")
+    return []
+
+
+def write_pages(
+    output_path: str,
+    lines: Iterable[str],
+    page_rows: int | None = None,
+    page_bytes: int | None = None,
+    sections: bool = False,
+    zstd_threads: int = 0,
+) -> list[str]:
+    """
+    Write a Markdown table split into pages that each repeat the header.
+
+    Pages are written as soon as they are full: each one goes to its own file named
+    after the output ('table.md' becomes 'table-1.md', 'table-2.md', ...) and is
+    closed before the next one starts. With `sections`, or when writing to stdout,
+    the pages are written one after another to the same output, separated by blank
+    lines, and the output is flushed after each page.
+
+    Parameters:
+        output_path (str): Path to the output file. If empty, pages are written to
+        stdout.
+        lines (Iterable[str]): The table's lines, header and alignment row first.
+        page_rows (Optional[int]): Maximum number of body rows per page.
+        page_bytes (Optional[int]): Maximum size of a page in bytes. A page always
+        holds at least one body row, even if that row alone is larger.
+        sections (bool): Write the pages as sections of a single output.
+        zstd_threads (int): Worker threads for compressing .zst output, see
+        `compression.open_output`.
+
+    Returns:
+        List[str]: The paths of the files written, empty for stdout.
+    """
+    pages = paginate(lines, page_rows, page_bytes)
+    if not output_path:
+        _write_sections(sys.stdout, pages)
+        sys.stdout.write("\n")
+        return []
+    if sections:
+        with open_output(output_path, zstd_threads) as f:
+            _write_sections(f, pages)
+        return [output_path]
+
+    paths = []
+    for number, page in enumerate(pages, 1):
+        paths.append(page_path(output_path, number))
+        with open_output(paths[-1], zstd_threads) as f:
+            _write_joined(f, page)
+    return paths
+
+
+def paginate(
+    lines: Iterable[str], page_rows: int | None = None, page_bytes: int | None = None
+) -> Iterator[list[str]]:
+    """
+    Group the lines of a Markdown table into pages that each repeat the header.
+
+    Only one page is held in memory at a time. Chunks of newline-separated lines,
+    as rendered by parallel workers, are split into their lines first.
+
+    Parameters:
+        lines (Iterable[str]): The table's lines, header and alignment row first.
+        page_rows (Optional[int]): Maximum number of body rows per page.
+        page_bytes (Optional[int]): Maximum size of a page in bytes, counting a
+        newline after each line.
+
+    Returns:
+        Iterator[List[str]]: The lines of each page.
+    """
+    lines = chain.from_iterable(chunk.split("\n") for chunk in lines)
+    head = list(islice(lines, 2))
+    head_bytes = sum(_byte_len(line) + 1 for line in head)
+    page: list[str] = []
+    size = head_bytes
+    for line in lines:
+        line_bytes = _byte_len(line) + 1
+        full = (page_rows and len(page) >= page_rows) or (
+            page_bytes and size + line_bytes > page_bytes
+        )
+        if full and page:
+            yield head + page
+            page, size = [], head_bytes
+        page.append(line)
+        size += line_bytes
+    yield head + page
+
+
+def page_path(output_path: str, number: int) -> str:
+    """
+    Return the path of one page of a split output.
+
+    Parameters:
+        output_path (str): Path to the output file.
+        number (int): The page number, starting at 1.
+
+    Returns:
+        str: The output path with '-<number>' added before its extension, or
+        before the extension preceding a compression extension such as '.gz'.
+    """
+    path = split_compression(output_path)[0]
+    root, ext = os.path.splitext(path)
+    return f"{root}-{number}{ext}{output_path[len(path):]}"
+
+
+def _byte_len(line: str) -> int:
+    """
+    Return the UTF-8 size of a line, without encoding ASCII lines.
+
+    Parameters:
+        line (str): The line.
+
+    Returns:
+        int: The size in bytes.
+    """
+    return len(line) if line.isascii() else len(line.encode("utf-8"))
+
+
+def _write_sections(handle: TextIO, pages: Iterable[list[str]]) -> None:
+    """
+    Write pages to one handle separated by blank lines, flushing after each page.
+
+    Parameters:
+        handle (TextIO): The handle to write to.
+        pages (Iterable[List[str]]): The lines of each page.
+    """
+    separator = ""
+    for page in pages:
+        handle.write(separator)
+        _write_joined(handle, page)
+        handle.flush()
+        separator = "\n\n"
+
+
+def _write_joined(handle: TextIO, lines: Iterable[str]) -> None:
+    """
+    Write lines to a handle separated by newlines, without a trailing newline.
+
+    Parameters:
+        handle (TextIO): The handle to write to.
+        lines (Iterable[str]): The lines to write.
+    """
+    separator = ""
+    for line in lines:
+        handle.write(separator)
+        handle.write(line)
+        separator = "\n"
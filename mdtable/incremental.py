@@ -0,0 +1,199 @@
+import csv
+import hashlib
+import io
+import json
+from collections.abc import Sequence
+from itertools import chain, islice
+from pathlib import Path
+from typing import BinaryIO
+
+from .core import iter_md_table, normalize_alignments, write_output
+from .transforms import DEFAULT_TRANSFORMS, normalize_transforms
+
+FINGERPRINT_BYTES = 64 * 1024
+
+
+def state_path(output_path: str) -> Path:
+    """
+    Return the path of the state file kept next to an incremental output.
+
+    Parameters:
+        output_path (str): Path to the Markdown output file.
+
+    Returns:
+        Path: The hidden '.<name>.state.json' file beside the output.
+    """
+    output = Path(output_path)
+    return output.with_name(f".{output.name}.state.json")
+
+
+def fingerprint(f: BinaryIO, offset: int) -> str:
+    """
+    Fingerprint the rendered part of an input file.
+
+    Only the first and last FINGERPRINT_BYTES before `offset` are hashed, which is
+    enough to notice a file that was rewritten rather than appended to without
+    reading all of it.
+
+    Parameters:
+        f (BinaryIO): The input file, opened in binary mode.
+        offset (int): Number of bytes that were rendered.
+
+    Returns:
+        str: A hex digest of the sampled bytes.
+    """
+    digest = hashlib.sha256(str(offset).encode())
+    f.seek(0)
+    digest.update(f.read(min(offset, FINGERPRINT_BYTES)))
+    tail = max(0, offset - FINGERPRINT_BYTES)
+    f.seek(tail)
+    digest.update(f.read(offset - tail))
+    return digest.hexdigest()
+
+
+def render_incremental(
+    input_path: str,
+    output_path: str,
+    alignments: str | list[str] | None = None,
+    transforms: str | Sequence[str] = DEFAULT_TRANSFORMS,
+) -> bool:
+    """
+    Render a CSV file, appending only the new rows when the file has just grown.
+
+    The byte offset, header, alignment and transforms of each render are remembered
+    in a state file next to the output. When the input still starts with the bytes
+    that were rendered last time, only the rows after that offset are read, parsed
+    and appended to the existing output. Otherwise the whole table is regenerated.
+    New rows are all rendered before the output is touched, so a malformed row
+    leaves it unchanged. A last row without a trailing newline is rendered but
+    not remembered, so it is rendered again once the writer finishes it. Writers
+    are expected to append whole rows otherwise.
+
+    Parameters:
+        input_path (str): Path to the input CSV file.
+        output_path (str): Path to the Markdown output file.
+        alignments (Optional[Union[List[str], str]]): Column alignments ('left',
+        'center', 'right') as a list or comma-separated string.
+        transforms (Union[str, Sequence[str]]): Names of the cell transforms applied
+        to body rows.
+
+    Returns:
+        bool: True if rows were appended, False if the table was fully rendered.
+    """
+    align_list = normalize_alignments(alignments) if alignments else None
+    transforms = list(normalize_transforms(transforms))
+    state = _load_state(output_path)
+
+    with open(input_path, "rb") as f:
+        size = f.seek(0, io.SEEK_END)
+        appended = state is not None and _can_append(
+            state, f, size, output_path, align_list, transforms
+        )
+        start = state["offset"] if state is not None and appended else 0
+        f.seek(start)
+        data = f.read(size - start)
+        # Rows after the last newline may still be being written: they are
+        # rendered, but rendered again from the next run on.
+        cut = data.rfind(b"\n") + 1
+        offset = start + cut
+        new_fingerprint = fingerprint(f, offset)
+    complete = _parse(data[:cut])
+    partial = _parse(data[cut:])
+
+    if state is not None and appended:
+        header = state["header"]
+        complete = [row for row in complete if row]
+        partial = [row for row in partial if row]
+        table = iter_md_table(
+            chain([header], complete, partial), align_list, 1, transforms
+        )
+        # Render every new row before touching the output, so a malformed row
+        # leaves it as it was.
+        lines = ["\n" + line for line in islice(table, 2, None)]
+        done = len(complete)
+        with open(output_path, "r+b") as out:
+            out.truncate(state["output_size"])
+            out.seek(0, io.SEEK_END)
+            out.write("".join(lines[:done]).encode("utf-8"))
+            output_size = out.tell()
+            out.write("".join(lines[done:]).encode("utf-8"))
+    else:
+        rows = complete + partial
+        lines = list(iter_md_table(rows, align_list, 1, transforms))
+        header = rows[0]
+        write_output(output_path, "\n".join(lines))
+        # The header and alignment lines, then one line per complete body row.
+        done = len(complete) + 1 if complete else 0
+        output_size = len("\n".join(lines[:done]).encode("utf-8"))
+
+    state = {
+        "offset": offset if complete or appended else 0,
+        "output_size": output_size,
+        "fingerprint": new_fingerprint,
+        "header": header,
+        "alignments": align_list,
+        "transforms": transforms,
+    }
+    state_path(output_path).write_text(json.dumps(state), encoding="utf-8")
+    return appended
+
+
+def _parse(data: bytes) -> list[list[str]]:
+    """
+    Parse CSV bytes into rows.
+
+    Parameters:
+        data (bytes): UTF-8 encoded CSV records.
+
+    Returns:
+        List[List[str]]: The rows.
+    """
+    return list(csv.reader(io.StringIO(data.decode("utf-8"), newline="")))
+
+
+def _can_append(
+    state: dict,
+    f: BinaryIO,
+    size: int,
+    output_path: str,
+    align_list: list[str] | None,
+    transforms: list[str],
+) -> bool:
+    """
+    Check whether the previous render can be extended with the appended rows.
+
+    Parameters:
+        state (dict): The state saved by the previous render.
+        f (BinaryIO): The input file, opened in binary mode.
+        size (int): Current size of the input file in bytes.
+        output_path (str): Path to the Markdown output file.
+        align_list (Optional[List[str]]): The normalized column alignments.
+        transforms (List[str]): The normalized transform names.
+
+    Returns:
+        bool: True if the options match and the rendered bytes are unchanged.
+    """
+    if state["alignments"] != align_list or state.get("transforms") != transforms:
+        return False
+    if not 0 < state["offset"] <= size or "output_size" not in state:
+        return False
+    output = Path(output_path)
+    if not output.exists() or output.stat().st_size < state["output_size"]:
+        return False
+    return state["fingerprint"] == fingerprint(f, state["offset"])
+
+
+def _load_state(output_path: str) -> dict | None:
+    """
+    Load the state of the previous incremental render, if any.
+
+    Parameters:
+        output_path (str): Path to the Markdown output file.
+
+    Returns:
+        Optional[dict]: The saved state, or None if missing or unreadable.
+    """
+    try:
+        return json.loads(state_path(output_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,401 @@
+import csv
+import io
+import os
+import sys
+from array import array
+from collections.abc import Callable, Sequence
+from typing import Any, Protocol
+
+from .compression import detect_compression
+from .preview import column_widths, fmt_row, format_line, hr
+from .readers import detect_format, read_rows
+from .width import truncate
+
+# Lines of the screen taken by the table borders, the header and the status line.
+CHROME_LINES = 5
+
+
+class Rows(Protocol):
+    """
+    Body rows the pager can measure and slice, such as a list or a RowIndex.
+    """
+
+    def __len__(self) -> int:
+        """
+        Number of body rows.
+        """
+
+    def __getitem__(self, index: slice) -> list[list[str]]:
+        """
+        Read a range of body rows.
+        """
+
+
+class RowIndex:
+    """
+    Random access to the body rows of a CSV file through the byte offset of each
+    record.
+
+    The offsets are found in one pass over the raw lines. A line with an odd number
+    of quotes opens or closes a quoted field, so newlines inside quoted fields never
+    start a record. Rows are only decoded and parsed when they are sliced out.
+    """
+
+    __slots__ = ("file", "offsets", "header")
+
+    def __init__(self, input_path: str):
+        """
+        Parameters:
+            input_path (str): Path to the input CSV file.
+        """
+        self.file = open(input_path, "rb")
+        try:
+            self.offsets = self._index()
+            header = self._read(0, 1)
+        except BaseException:
+            self.file.close()
+            raise
+        self.header = header[0] if header else []
+
+    def _index(self) -> array:
+        """
+        Find the byte offset of every record.
+
+        Returns:
+            array: The offset of each record, followed by the file size.
+        """
+        offsets = array("q")
+        pos = 0
+        in_quotes = False
+        for line in self.file:
+            if not in_quotes:
+                offsets.append(pos)
+            if line.count(b'"') % 2:
+                in_quotes = not in_quotes
+            pos += len(line)
+        offsets.append(pos)
+        return offsets
+
+    def __len__(self) -> int:
+        return max(len(self.offsets) - 2, 0)
+
+    def __getitem__(self, index: slice) -> list[list[str]]:
+        """
+        Read a range of body rows.
+
+        Parameters:
+            index (slice): The rows to read, without a step.
+
+        Returns:
+            List[List[str]]: The rows.
+        """
+        start, stop, _ = index.indices(len(self))
+        if start >= stop:
+            return []
+        return self._read(start + 1, stop + 1)
+
+    def _read(self, start: int, stop: int) -> list[list[str]]:
+        """
+        Parse the records between two positions of the offset index.
+
+        Parameters:
+            start (int): Position of the first record, 0 for the header.
+            stop (int): Position just past the last record.
+
+        Returns:
+            List[List[str]]: The parsed records.
+        """
+        stop = min(stop, len(self.offsets) - 1)
+        if start >= stop:
+            return []
+        self.file.seek(self.offsets[start])
+        text = self.file.read(self.offsets[stop] - self.offsets[start]).decode()
+        return list(csv.reader(io.StringIO(text, newline="")))
+
+    def close(self) -> None:
+        """
+        Close the input file.
+        """
+        self.file.close()
+
+
+def render_viewport(
+    header: list[str],
+    rows: Sequence[list[str]],
+    first_row: int = 0,
+    first_col: int = 0,
+    width: int = 80,
+) -> list[str]:
+    """
+    Format the part of a table that fits in a terminal viewport.
+
+    Only the given rows, and the columns from `first_col` that fit in `width`, are
+    measured and formatted, so the cost does not depend on the size of the table.
+    A row number column stays pinned on the left while scrolling sideways, and line
+    breaks inside cells are shown as spaces.
+
+    Parameters:
+        header (List[str]): The header row.
+        rows (Sequence[List[str]]): The visible body rows.
+        first_row (int): Position of the first visible row in the table.
+        first_col (int): Position of the first visible column.
+        width (int): Width of the viewport in characters. Lines are cut to fit.
+
+    Returns:
+        List[str]: The lines of the boxed table, including its borders.
+    """
+    numbers = [str(first_row + i + 1) for i in range(len(rows))]
+    visible = [["#", *header[first_col:]]]
+    visible += [[n, *row[first_col:]] for n, row in zip(numbers, rows)]
+    # A line break inside a quoted cell would break the box apart.
+    visible = [[_one_line(cell) for cell in row] for row in visible]
+    widths = column_widths(visible, len(visible[0]))
+
+    used = 1
+    num_cols = 0
+    for w in widths:
+        if num_cols > 1 and used + w + 3 > width:
+            break
+        used += w + 3
+        num_cols += 1
+    widths = widths[:num_cols]
+
+    lines = [hr(widths), fmt_row(widths, num_cols, visible[0]), hr(widths)]
+    lines += [format_line(fmt_row(widths, num_cols, row)) for row in visible[1:]]
+    lines.append(hr(widths))
+    return [truncate(line, width) for line in lines]
+
+
+def _one_line(cell: str) -> str:
+    """
+    Replace the line breaks in a cell with spaces.
+
+    Parameters:
+        cell (str): The cell.
+
+    Returns:
+        str: The cell on a single line.
+    """
+    if "\n" in cell or "\r" in cell:
+        return cell.replace("\r\n", " ").replace("\n", " ").replace("\r", " ")
+    return cell
+
+
+class Pager:
+    """
+    Scroll position of the interactive preview, independent of curses.
+    """
+
+    __slots__ = ("header", "rows", "top", "left", "height", "width")
+
+    def __init__(
+        self,
+        header: list[str],
+        rows: Rows,
+        height: int = 24,
+        width: int = 80,
+    ):
+        """
+        Parameters:
+            header (List[str]): The header row.
+            rows (Rows): The body rows, such as a list or a RowIndex.
+            height (int): Height of the screen in lines.
+            width (int): Width of the screen in characters.
+        """
+        self.header = header
+        self.rows = rows
+        self.top = 0
+        self.left = 0
+        self.height = height
+        self.width = width
+
+    @property
+    def page_rows(self) -> int:
+        """
+        Number of body rows shown at once.
+        """
+        return max(self.height - CHROME_LINES, 1)
+
+    def scroll(self, rows: int = 0, cols: int = 0) -> None:
+        """
+        Move the viewport, staying within the table.
+
+        Parameters:
+            rows (int): Number of rows to move down, negative to move up.
+            cols (int): Number of columns to move right, negative to move left.
+        """
+        last_top = max(len(self.rows) - self.page_rows, 0)
+        self.top = min(max(self.top + rows, 0), last_top)
+        self.left = min(max(self.left + cols, 0), max(len(self.header) - 1, 0))
+
+    def jump(self, row: int) -> None:
+        """
+        Scroll so that a row is at the top of the viewport.
+
+        Parameters:
+            row (int): The row number, counting from 1 as displayed.
+        """
+        self.scroll(rows=row - 1 - self.top)
+
+    def screen(self) -> list[str]:
+        """
+        Render the current viewport and a status line.
+
+        Returns:
+            List[str]: The lines to draw.
+        """
+        top, bottom = self.top, self.top + self.page_rows
+        rows = self.rows[top:bottom]
+        lines = render_viewport(self.header, rows, self.top, self.left, self.width)
+        last = self.top + len(rows)
+        status = (
+            f"rows {self.top + 1 if rows else 0}-{last} of {len(self.rows):,}  "
+            f"column {self.left + 1} of {len(self.header)}  "
+            "(arrows/hjkl scroll, space/b page, g/G ends, : jump, q quit)"
+        )
+        return lines + [truncate(status, self.width)]
+
+
+def page_csv(
+    input_path: str, fmt: str | None = None, backend: str = "csv", **query: Any
+) -> None:
+    """
+    Browse an input file in an interactive terminal pager.
+
+    Local, uncompressed CSV files without a selection are read through a RowIndex,
+    so only the rows on screen are ever parsed. Other inputs are read into memory
+    first.
+
+    Parameters:
+        input_path (str): Path to the input file. If set to "-", reads from stdin.
+        fmt (Optional[str]): Name of the input reader. Detected from the file
+        extension when None.
+        backend (str): Parser to use for CSV input: 'csv', 'mmap' or 'parallel'.
+        **query: Selection options (columns, where, limit, offset, sort_by, desc,
+        group_by, aggs) passed to `iter_rows`.
+
+    Returns:
+        None
+    """
+    try:
+        import curses
+    except ImportError:
+        raise ValueError("The pager requires the curses module.") from None
+    if not sys.stdout.isatty():
+        raise ValueError("The pager requires an interactive terminal.")
+
+    if _indexable(input_path, fmt, query):
+        index = RowIndex(input_path)
+        try:
+            if not index.header:
+                raise ValueError("Table data is empty.")
+            curses.wrapper(_run, Pager(index.header, index))
+        finally:
+            index.close()
+        return
+
+    rows = read_rows(input_path, fmt, backend, **query)
+    if not rows:
+        raise ValueError("Table data is empty.")
+    if input_path == "-":
+        # Keys are read from the terminal once stdin has been consumed.
+        tty = os.open("/dev/tty", os.O_RDONLY)
+        os.dup2(tty, 0)
+        os.close(tty)
+    curses.wrapper(_run, Pager(rows[0], rows[1:]))
+
+
+def _indexable(input_path: str, fmt: str | None, query: dict[str, Any]) -> bool:
+    """
+    Check whether an input can be browsed through a RowIndex.
+
+    Parameters:
+        input_path (str): Path to the input file, or "-" for stdin.
+        fmt (Optional[str]): Name of the input reader, or None to detect it.
+        query (dict): The selection options.
+
+    Returns:
+        bool: True for local, uncompressed CSV files without a selection.
+    """
+    if input_path == "-" or detect_compression(input_path):
+        return False
+    if any(query.values()):
+        return False
+    return (fmt or detect_format(input_path)) == "csv"
+
+
+def _key_actions() -> dict[int, Callable[[Pager], None]]:
+    """
+    Map the pager's keys to what they do.
+
+    Returns:
+        Dict[int, Callable[[Pager], None]]: An action for each key code.
+    """
+    import curses
+
+    actions: dict[int, Callable[[Pager], None]] = {}
+    for codes, action in (
+        ((curses.KEY_DOWN, ord("j")), lambda p: p.scroll(rows=1)),
+        ((curses.KEY_UP, ord("k")), lambda p: p.scroll(rows=-1)),
+        ((curses.KEY_RIGHT, ord("l")), lambda p: p.scroll(cols=1)),
+        ((curses.KEY_LEFT, ord("h")), lambda p: p.scroll(cols=-1)),
+        ((curses.KEY_NPAGE, ord(" ")), lambda p: p.scroll(rows=p.page_rows)),
+        ((curses.KEY_PPAGE, ord("b")), lambda p: p.scroll(rows=-p.page_rows)),
+        ((curses.KEY_HOME, ord("g")), lambda p: p.jump(1)),
+        ((curses.KEY_END, ord("G")), lambda p: p.jump(len(p.rows))),
+    ):
+        actions.update(dict.fromkeys(codes, action))
+    return actions
+
+
+def _run(stdscr: Any, pager: Pager) -> None:
+    """
+    Draw the pager and handle key presses until the user quits.
+
+    Parameters:
+        stdscr (curses.window): The screen, from `curses.wrapper`.
+        pager (Pager): The pager state.
+    """
+    import curses
+
+    actions = _key_actions()
+    curses.curs_set(0)
+    while True:
+        pager.height, pager.width = stdscr.getmaxyx()
+        pager.width -= 1  # writing the last column of the last line fails
+        pager.scroll()
+        stdscr.erase()
+        for y, line in enumerate(pager.screen()[: pager.height]):
+            stdscr.addstr(y, 0, line)
+        key = stdscr.getch()
+        if key in (ord("q"), 27):  # q or Escape
+            return
+        if key == ord(":"):
+            _prompt_jump(stdscr, pager)
+        elif key in actions:
+            actions[key](pager)
+
+
+def _prompt_jump(stdscr: Any, pager: Pager) -> None:
+    """
+    Ask for a row number on the bottom line and jump to it.
+
+    Parameters:
+        stdscr (curses.window): The screen.
+        pager (Pager): The pager state.
+    """
+    import curses
+
+    y = pager.height - 1
+    stdscr.move(y, 0)
+    stdscr.clrtoeol()
+    stdscr.addstr(y, 0, "Go to row: ")
+    curses.echo()
+    curses.curs_set(1)
+    try:
+        answer = stdscr.getstr(y, 11, 20).decode().strip().replace(",", "")
+    finally:
+        curses.noecho()
+        curses.curs_set(0)
+    if answer.isdigit():
+        pager.jump(int(answer))
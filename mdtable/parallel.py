@@ -0,0 +1,285 @@
+import csv
+import io
+import mmap
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from itertools import repeat
+
+from .core import _check_columns, _record_end, iter_md_table
+from .transforms import (
+    DEFAULT_TRANSFORMS,
+    compile_row_formatter,
+    normalize_transforms,
+)
+
+PARSE_CHUNK_BYTES = 16 * 1024 * 1024
+READ_BLOCK_BYTES = 1024 * 1024
+# Parsed ranges are sent back as one string with ASCII unit and record separators
+# between cells and rows: pickling a list of row lists costs more than parsing.
+FIELD_SEP = "\x1f"
+RECORD_SEP = "\x1e"
+
+
+def iter_csv_parallel(
+    input_path: str, workers: int | None = None, chunk_bytes: int = PARSE_CHUNK_BYTES
+) -> Iterator[list[str]]:
+    """
+    Parse a large CSV file across a process pool, yielding rows in file order.
+
+    The file is cut into byte ranges of about `chunk_bytes` that end on record
+    boundaries (see `split_ranges`), each range is parsed with `csv.reader` in a
+    worker process, and the rows of each range are yielded as soon as it and
+    every range before it are done. Only a bounded number of ranges are in flight
+    at once. Files no larger than one chunk are parsed in this process.
+
+    Quotes are assumed to only appear around quoted fields, as in RFC 4180.
+
+    Parameters:
+        input_path (str): Path to the input CSV file.
+        workers (Optional[int]): Number of worker processes, one per CPU if None.
+        chunk_bytes (int): Target size of each range in bytes.
+
+    Returns:
+        Iterator[List[str]]: An iterator over rows, where each row is a list of
+        string cells.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or os.path.getsize(input_path) <= chunk_bytes:
+        with open(input_path, newline="", encoding="utf-8") as f:
+            yield from csv.reader(f)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    pending: deque = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for start, end in split_ranges(input_path, chunk_bytes, pool.map):
+            pending.append(pool.submit(_parse_range, input_path, start, end))
+            if len(pending) >= workers * 2:
+                yield from _decode(pending.popleft().result())
+        while pending:
+            yield from _decode(pending.popleft().result())
+
+
+def iter_md_csv_parallel(
+    input_path: str,
+    alignments: str | list[str] | None = None,
+    workers: int | None = None,
+    transforms: str | Sequence[str] = DEFAULT_TRANSFORMS,
+    chunk_bytes: int = PARSE_CHUNK_BYTES,
+) -> Iterator[str]:
+    """
+    Render a CSV file as a Markdown table across a process pool.
+
+    The file is cut into byte ranges that end on record boundaries (see
+    `split_ranges`), and each worker reads, parses, validates and renders one range
+    and returns its lines as a single string. Only file offsets and rendered text
+    cross process boundaries, never parsed rows. Chunks are yielded in file order,
+    with a bounded number of ranges in flight. Files no larger than one chunk are
+    rendered in this process.
+
+    Parameters:
+        input_path (str): Path to the input CSV file.
+        alignments (Optional[Union[List[str], str]]): Column alignments ('left',
+        'center', 'right') as a list or comma-separated string.
+        workers (Optional[int]): Number of worker processes, one per CPU if None.
+        transforms (Union[str, Sequence[str]]): Names of the cell transforms applied
+        to body rows, as a sequence or comma-separated string.
+        chunk_bytes (int): Target size of each range in bytes.
+
+    Returns:
+        Iterator[str]: The header and alignment lines, then chunks of
+        newline-separated body lines.
+    """
+    transforms = normalize_transforms(transforms)
+    with open(input_path, newline="", encoding="utf-8") as f:
+        header = next(csv.reader(f), None)
+    if header is None:
+        raise ValueError("Table data is empty.")
+    yield from iter_md_table([header], alignments, 1, transforms)
+
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(input_path)
+    if workers == 1 or size <= chunk_bytes:
+        chunk = _render_range(input_path, 0, size, len(header), transforms)
+        if chunk:
+            yield chunk
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    pending: deque = deque()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for start, end in split_ranges(input_path, chunk_bytes, pool.map):
+            pending.append(
+                pool.submit(
+                    _render_range, input_path, start, end, len(header), transforms
+                )
+            )
+            if len(pending) >= workers * 2:
+                if chunk := pending.popleft().result():
+                    yield chunk
+        while pending:
+            if chunk := pending.popleft().result():
+                yield chunk
+
+
+def split_ranges(
+    input_path: str,
+    chunk_bytes: int = PARSE_CHUNK_BYTES,
+    map_func: Callable[..., Iterable[int]] = map,
+) -> list[tuple[int, int]]:
+    """
+    Cut a CSV file into byte ranges that each hold whole records.
+
+    The quotes in each fixed-size chunk are counted first (with `map_func`, so the
+    counting can run in parallel). An odd number of quotes before a cut means the
+    cut falls inside a quoted field, so the range boundary is moved past the end
+    of that field and then to the next newline. Newlines inside quoted fields
+    therefore never split a record.
+
+    Parameters:
+        input_path (str): Path to the input CSV file.
+        chunk_bytes (int): Target size of each range in bytes.
+        map_func (Callable): A `map`-like function used to count the quotes of
+        every chunk, such as `Executor.map`.
+
+    Returns:
+        List[Tuple[int, int]]: (start, end) byte offsets of each range, in order.
+    """
+    size = os.path.getsize(input_path)
+    if size == 0:
+        return []
+    starts = list(range(0, size, chunk_bytes))
+    ends = starts[1:] + [size]
+    counts = list(map_func(_count_quotes, repeat(input_path), starts, ends))
+
+    bounds = [0]
+    quotes = 0
+    with open(input_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            for cut, count in zip(ends[:-1], counts):
+                quotes += count
+                boundary = _next_boundary(buf, cut, quotes % 2 == 1)
+                if bounds[-1] < boundary < size:
+                    bounds.append(boundary)
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def _next_boundary(buf: mmap.mmap, pos: int, in_quotes: bool) -> int:
+    """
+    Find the start of the first record that begins at or after `pos`.
+
+    Parameters:
+        buf (mmap.mmap): The mapped file.
+        pos (int): Offset to start scanning from.
+        in_quotes (bool): Whether `pos` is inside a quoted field.
+
+    Returns:
+        int: Offset just past the newline ending the current record, or the file
+        size if there is none.
+    """
+    if in_quotes:
+        closing = buf.find(b'"', pos)
+        if closing == -1:
+            return len(buf)
+        pos = closing + 1
+    return min(_record_end(buf, pos) + 1, len(buf))
+
+
+def _count_quotes(input_path: str, start: int, end: int) -> int:
+    """
+    Count the quote characters in a byte range of a file.
+
+    Parameters:
+        input_path (str): Path to the file.
+        start (int): Offset of the first byte.
+        end (int): Offset just past the last byte.
+
+    Returns:
+        int: The number of '"' bytes.
+    """
+    count = 0
+    with open(input_path, "rb") as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            block = f.read(min(READ_BLOCK_BYTES, remaining))
+            if not block:
+                break
+            count += block.count(b'"')
+            remaining -= len(block)
+    return count
+
+
+def _render_range(
+    input_path: str,
+    start: int,
+    end: int,
+    num_cols: int,
+    transforms: tuple[str, ...],
+) -> str:
+    """
+    Parse and render the body rows in a byte range of a CSV file.
+
+    Parameters:
+        input_path (str): Path to the input CSV file.
+        start (int): Offset of the first byte of the first record. The header is
+        skipped when this is 0.
+        end (int): Offset just past the last record.
+        num_cols (int): The expected number of columns.
+        transforms (Tuple[str, ...]): Names of the cell transforms to apply.
+
+    Returns:
+        str: The rendered Markdown lines, newline-separated.
+    """
+    with open(input_path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode("utf-8")
+    rows = csv.reader(io.StringIO(text, newline=""))
+    if start == 0:
+        next(rows, None)
+    format_row = compile_row_formatter(transforms)
+    return "\n".join(map(format_row, _check_columns(rows, num_cols)))
+
+
+def _parse_range(input_path: str, start: int, end: int) -> str | list[list[str]]:
+    """
+    Parse the records in a byte range of a CSV file.
+
+    Parameters:
+        input_path (str): Path to the input CSV file.
+        start (int): Offset of the first byte of the first record.
+        end (int): Offset just past the last record.
+
+    Returns:
+        Union[str, List[List[str]]]: The parsed rows, joined with FIELD_SEP and
+        RECORD_SEP, or as lists if a cell contains a separator or a line is blank.
+        See `_decode`.
+    """
+    with open(input_path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode("utf-8")
+    rows = list(csv.reader(io.StringIO(text, newline="")))
+    if FIELD_SEP in text or RECORD_SEP in text or not all(rows):
+        return rows
+    return RECORD_SEP.join([FIELD_SEP.join(row) for row in rows])
+
+
+def _decode(batch: str | list[list[str]]) -> list[list[str]]:
+    """
+    Turn the result of `_parse_range` back into rows.
+
+    Parameters:
+        batch (Union[str, List[List[str]]]): Joined or already split rows.
+
+    Returns:
+        List[List[str]]: The rows.
+    """
+    if isinstance(batch, list):
+        return batch
+    if not batch:
+        return []
+    return [record.split(FIELD_SEP) for record in batch.split(RECORD_SEP)]
@@ -1,21 +1,34 @@
-from .core import format_commas
+from collections.abc import Iterable, Sequence
+from itertools import chain
+from typing import Any
+
+from .readers import iter_rows, read_rows
+from .table import Table
+from .transforms import compile_replacer
+from .width import display_width, pad
+
+# Comma formatting keeps cell widths, so it can be applied to whole padded lines.
+format_line = compile_replacer(("commas",))
 
 
 # Format row
-def fmt_row(col_widths: list[int], num_cols: int, row: list[str]) -> str:
+def fmt_row(col_widths: list[int], num_cols: int, row: Sequence[str]) -> str:
     """
     Format a row of cells for a Markdown-style table.
 
+    Cells are padded to their display width, so wide characters such as CJK
+    stay aligned.
+
     Parameters:
         col_widths (List[int]): Widths for each column.
         num_cols (int): Total number of columns to format.
-        row (List[str]): A list of string cells.
+        row (Sequence[str]): A sequence of string cells.
 
     Returns:
         str: The formatted row as a string.
     """
     padded = [
-        row[i].ljust(col_widths[i]) if i < len(row) else " " * col_widths[i]
+        pad(row[i], col_widths[i]) if i < len(row) else " " * col_widths[i]
         for i in range(num_cols)
     ]
     return "| " + " | ".join(padded) + " |"
@@ -36,37 +49,121 @@ def hr(col_widths: list[int]) -> str:
 
 
 def preview_table(
-    data: list[list[str]], alignments: str | list[str] | None = None
+    data: list[list[str]] | Table, alignments: str | list[str] | None = None
 ) -> None:
     """
     Render a Markdown-style table preview in the terminal.
 
     Parameters:
-        data (List[List[str]]): A list of rows, where each row is a list of string
-        cells.
+        data (Union[List[List[str]], Table]): A list of rows, where each row is a
+        list of string cells, or a Table whose precomputed widths are reused.
         alignments (Optional[Union[List[str], str]]): Column alignments ('left',
         'center', 'right') as a list or comma-separated string.
 
     Returns:
         None
     """
-    headers = data[0]
-    rows = data[1:]
-    num_cols = len(headers)
+    print(format_preview(data, alignments))
 
-    # Determine column widths
-    col_widths = [len(h) for h in headers]
-    for row in rows:
-        for i, cell in enumerate(row):
-            if i < num_cols:
-                col_widths[i] = max(col_widths[i], len(cell))
 
-    formatted_data = [[format_commas(cell) for cell in row] for row in data]
+def format_preview(
+    data: list[list[str]] | Table, alignments: str | list[str] | None = None
+) -> str:
+    """
+    Build the terminal preview of a table as a string.
+
+    Parameters:
+        data (Union[List[List[str]], Table]): A list of rows, where each row is a
+        list of string cells, or a Table whose precomputed widths are reused.
+        alignments (Optional[Union[List[str], str]]): Column alignments ('left',
+        'center', 'right') as a list or comma-separated string.
+
+    Returns:
+        str: The boxed table preview.
+    """
+    if isinstance(data, Table):
+        headers = data.header
+        num_cols = len(headers)
+        col_widths = data.widths
+    else:
+        headers = data[0]
+        num_cols = len(headers)
+        col_widths = column_widths(data, num_cols)
 
     # Assemble preview
     lines = [hr(col_widths), fmt_row(col_widths, num_cols, headers), hr(col_widths)]
-    for row in formatted_data:
-        lines.append(fmt_row(col_widths, num_cols, row))
+    for row in data:
+        lines.append(format_line(fmt_row(col_widths, num_cols, row)))
     lines.append(hr(col_widths))
 
-    print("\n".join(lines))
+    return "\n".join(lines)
+
+
+def column_widths(rows: Iterable[list[str]], num_cols: int) -> list[int]:
+    """
+    Compute the width of each column in a single pass over the rows.
+
+    Only one integer per column is kept, so the rows can come from a lazy iterator.
+    Cells are measured by display width (see `width.display_width`), with ASCII
+    cells taking the `len` fast path.
+
+    Parameters:
+        rows (Iterable[List[str]]): An iterable of rows, including the header.
+        num_cols (int): Total number of columns to measure.
+
+    Returns:
+        List[int]: The widest cell display width for each column.
+    """
+    col_widths = [0] * num_cols
+    for row in rows:
+        for i, cell in enumerate(row[:num_cols]):
+            width = len(cell) if cell.isascii() else display_width(cell)
+            if width > col_widths[i]:
+                col_widths[i] = width
+    return col_widths
+
+
+def preview_csv(
+    input_path: str,
+    alignments: str | list[str] | None = None,
+    backend: str = "csv",
+    fmt: str | None = None,
+    **query: Any,
+) -> None:
+    """
+    Render a terminal preview of an input file in constant memory.
+
+    The file is read twice: once to compute the column widths and once to print
+    each padded row as soon as it is formatted. Stdin cannot be re-read, so it falls
+    back to `preview_table`.
+
+    Parameters:
+        input_path (str): Path to the input file. If set to "-", reads from stdin.
+        alignments (Optional[Union[List[str], str]]): Column alignments ('left',
+        'center', 'right') as a list or comma-separated string.
+        backend (str): Parser to use for CSV input: 'csv', 'mmap' or 'parallel'.
+        fmt (Optional[str]): Name of the input reader. Detected from the file
+        extension when None.
+        **query: Selection options (columns, where, limit, offset, sort_by, desc,
+        group_by, aggs) passed to `iter_rows`.
+
+    Returns:
+        None
+    """
+    if input_path == "-":
+        preview_table(read_rows(input_path, fmt, **query), alignments)
+        return
+
+    rows = iter_rows(input_path, fmt, backend, **query)
+    headers = next(rows, None)
+    if headers is None:
+        raise ValueError("Table data is empty.")
+    num_cols = len(headers)
+    col_widths = column_widths(chain([headers], rows), num_cols)
+
+    print(hr(col_widths))
+    print(fmt_row(col_widths, num_cols, headers))
+    print(hr(col_widths))
+    for row in iter_rows(input_path, fmt, backend, **query):
+        print(format_line(fmt_row(col_widths, num_cols, row)))
+    print(hr(col_widths))
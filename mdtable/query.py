@@ -0,0 +1,183 @@
+import operator
+import re
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from itertools import islice
+from typing import Any
+
+from .core import _check_columns
+
+# Longer operators come first so that '<=' is not read as '<'.
+OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "<=": operator.le,
+    ">=": operator.ge,
+    "!=": operator.ne,
+    "==": operator.eq,
+    "=": operator.eq,
+    "<": operator.lt,
+    ">": operator.gt,
+    "~": operator.contains,
+}
+_CONDITION = re.compile(
+    r"\s*(.+?)\s*(" + "|".join(re.escape(op) for op in OPERATORS) + r")\s*(.*?)\s*"
+)
+
+Condition = tuple[str, str, str]
+
+
+def parse_where(condition: str) -> Condition:
+    """
+    Split a condition such as 'Score>=80' into column, operator and value.
+
+    Supported operators are =, ==, !=, <, <=, >, >= and ~ (the cell contains the
+    value). Values that look like numbers are compared numerically, ignoring
+    underscores and commas used as thousands separators.
+
+    Parameters:
+        condition (str): The condition.
+
+    Returns:
+        Tuple[str, str, str]: The column name, the operator and the value.
+    """
+    match = _CONDITION.fullmatch(condition)
+    if not match:
+        raise ValueError(f"Invalid condition: '{condition}'")
+    return match.group(1), match.group(2), match.group(3)
+
+
+def condition_columns(where: Sequence[str]) -> list[str]:
+    """
+    List the columns referenced by a set of conditions.
+
+    Parameters:
+        where (Sequence[str]): The conditions.
+
+    Returns:
+        List[str]: The column names, in order of first use.
+    """
+    return list(dict.fromkeys(parse_where(c)[0] for c in where))
+
+
+def column_indices(header: Sequence[str], columns: Sequence[str]) -> list[int]:
+    """
+    Look up the positions of columns in a header.
+
+    Parameters:
+        header (Sequence[str]): The column names.
+        columns (Sequence[str]): The columns to find.
+
+    Returns:
+        List[int]: The index of each column.
+    """
+    positions = {name: i for i, name in enumerate(header)}
+    try:
+        return [positions[name] for name in columns]
+    except KeyError as e:
+        raise ValueError(f"Unknown column: '{e.args[0]}'") from None
+
+
+def compile_where(
+    where: Sequence[str], header: Sequence[str]
+) -> Callable[[list[str]], bool]:
+    """
+    Build a predicate that is true for rows matching every condition.
+
+    Parameters:
+        where (Sequence[str]): The conditions.
+        header (Sequence[str]): The column names.
+
+    Returns:
+        Callable[[List[str]], bool]: The predicate.
+    """
+    tests = []
+    for condition in where:
+        column, op, value = parse_where(condition)
+        (index,) = column_indices(header, [column])
+        tests.append((index, OPERATORS[op], _number(value), value))
+
+    def predicate(row: list[str]) -> bool:
+        for index, compare, number, value in tests:
+            cell = row[index]
+            if number is not None and compare is not operator.contains:
+                cell_number = _number(cell)
+                if cell_number is None or not compare(cell_number, number):
+                    return False
+            elif not compare(cell, value):
+                return False
+        return True
+
+    return predicate
+
+
+def _number(value: str) -> float | None:
+    """
+    Parse a cell as a number, allowing underscores and commas as separators.
+
+    Parameters:
+        value (str): The cell.
+
+    Returns:
+        Optional[float]: The number, or None if the cell is not numeric.
+    """
+    try:
+        return float(value.replace(",", ""))
+    except ValueError:
+        return None
+
+
+def select_rows(
+    rows: Iterable[list[str]],
+    columns: Sequence[str] | None = None,
+    where: Sequence[str] = (),
+    limit: int | None = None,
+    offset: int = 0,
+    sort_by: str | None = None,
+    desc: bool = False,
+) -> Iterator[list[str]]:
+    """
+    Filter, sort, slice and project rows as they are read.
+
+    Conditions are checked first, then matching rows are sorted if `sort_by` is
+    given, then `offset` rows are skipped and at most `limit` are kept, and only
+    then are the selected columns picked out. Without sorting, rows are pulled from
+    `rows` one at a time, so a reader is not advanced past the last row the limit
+    lets through. With sorting and a limit, only the top `offset + limit` rows are
+    kept in a heap; a full sort spills to temporary files when the input is large.
+
+    Parameters:
+        rows (Iterable[List[str]]): The header followed by the body rows.
+        columns (Optional[Sequence[str]]): Names of the columns to keep, in output
+        order. All columns are kept when None.
+        where (Sequence[str]): Conditions every kept row must match.
+        limit (Optional[int]): Maximum number of body rows to keep.
+        offset (int): Number of matching body rows to skip.
+        sort_by (Optional[str]): Name of the column to sort by.
+        desc (bool): Sort in descending order.
+
+    Returns:
+        Iterator[List[str]]: The selected header and rows.
+    """
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        return
+    if where or columns or sort_by:
+        rows = _check_columns(rows, len(header))
+    if where:
+        rows = filter(compile_where(where, header), rows)
+    if sort_by:
+        from .sorting import order_rows
+
+        (index,) = column_indices(header, [sort_by])
+        keep = None if limit is None else offset + limit
+        rows = order_rows(rows, index, desc, keep)
+    if offset or limit is not None:
+        rows = islice(rows, offset, None if limit is None else offset + limit)
+    if not columns:
+        yield header
+        yield from rows
+        return
+
+    indices = column_indices(header, columns)
+    yield [header[i] for i in indices]
+    for row in rows:
+        yield [row[i] for i in indices]
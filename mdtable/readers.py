@@ -0,0 +1,445 @@
+import csv
+import json
+import os
+import sys
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import Any
+
+from .aggregate import aggregate_columns, aggregate_rows, parse_aggregates
+from .compression import open_input, split_compression
+from .core import iter_csv
+from .query import column_indices, condition_columns, select_rows
+from .table import Table
+
+# A reader takes an input path ("-" for stdin) and a CSV backend name, and yields
+# the header followed by the body rows as lists of strings. Readers registered as
+# projecting also take the names of the columns to read.
+Reader = Callable[..., Iterator[list[str]]]
+
+READERS: dict[str, Reader] = {}
+EXTENSIONS: dict[str, str] = {}
+PROJECTING: set[str] = set()
+DEFAULT_FORMAT = "csv"
+
+
+def register_reader(
+    name: str, reader: Reader, extensions: tuple[str, ...] = (), projects: bool = False
+) -> None:
+    """
+    Register an input reader, optionally selected by file extension.
+
+    Parameters:
+        name (str): Name used to select the reader with --format.
+        reader (Reader): Function taking an input path and a CSV backend name and
+        yielding the header followed by each row.
+        extensions (Tuple[str, ...]): File extensions, such as '.tsv', that select
+        the reader when no format is given.
+        projects (bool): Whether the reader accepts a third argument listing the
+        columns to read, so that other columns are never decoded.
+    """
+    READERS[name] = reader
+    if projects:
+        PROJECTING.add(name)
+    else:
+        PROJECTING.discard(name)
+    for ext in extensions:
+        EXTENSIONS[ext.lower()] = name
+
+
+def detect_format(input_path: str) -> str:
+    """
+    Pick a reader from an input file's extension, ignoring a compression extension
+    such as '.gz'.
+
+    Parameters:
+        input_path (str): Path to the input file. Stdin ("-") is read as CSV.
+
+    Returns:
+        str: The name of the reader, 'csv' if the extension is unknown.
+    """
+    ext = os.path.splitext(split_compression(input_path)[0])[1].lower()
+    return EXTENSIONS.get(ext, DEFAULT_FORMAT)
+
+
+def iter_rows(
+    input_path: str = "",
+    fmt: str | None = None,
+    backend: str = "csv",
+    columns: Sequence[str] | None = None,
+    where: Sequence[str] = (),
+    limit: int | None = None,
+    offset: int = 0,
+    sort_by: str | None = None,
+    desc: bool = False,
+    group_by: Sequence[str] = (),
+    aggs: str | Sequence[str] = (),
+) -> Iterator[list[str]]:
+    """
+    Lazily read any supported input file one row at a time.
+
+    The selection options are applied while reading: projecting readers only decode
+    the columns that are needed, other readers drop unselected cells as soon as a
+    row is parsed, and unless the rows are sorted, reading stops once `limit` rows
+    have been produced.
+
+    With `group_by` or `aggs`, the rows matching `where` are summarized in one pass
+    and the other options apply to the summary rows instead.
+
+    Parameters:
+        input_path (str): Path to the input file. If set to "-", reads from stdin.
+        fmt (Optional[str]): Name of the reader to use. Detected from the file
+        extension when None.
+        backend (str): Parser to use for CSV input: 'csv', 'mmap' or 'parallel'.
+        columns (Optional[Sequence[str]]): Names of the columns to keep, in output
+        order. All columns are kept when None.
+        where (Sequence[str]): Conditions, such as 'Score>=80', that every row must
+        match.
+        limit (Optional[int]): Maximum number of body rows to read.
+        offset (int): Number of matching body rows to skip.
+        sort_by (Optional[str]): Name of the column to sort by. Sorted tables larger
+        than memory are spilled to temporary files.
+        desc (bool): Sort in descending order.
+        group_by (Sequence[str]): Names of the columns to group rows by.
+        aggs (Union[str, Sequence[str]]): Aggregates computed per group, such as
+        'count' or 'sum:Balance'.
+
+    Returns:
+        Iterator[List[str]]: An iterator over the header and then each row.
+    """
+    fmt = fmt or detect_format(input_path)
+    if fmt not in READERS:
+        raise ValueError(f"Invalid format: '{fmt}'")
+    reader = READERS[fmt]
+    needed = _needed_columns(columns, where, sort_by, group_by, aggs)
+    if needed and fmt in PROJECTING:
+        rows = reader(input_path, backend, needed)
+    else:
+        rows = reader(input_path, backend)
+    return query_rows(
+        rows, columns, where, limit, offset, sort_by, desc, group_by, aggs
+    )
+
+
+def query_rows(
+    rows: Iterable[list[str]],
+    columns: Sequence[str] | None = None,
+    where: Sequence[str] = (),
+    limit: int | None = None,
+    offset: int = 0,
+    sort_by: str | None = None,
+    desc: bool = False,
+    group_by: Sequence[str] = (),
+    aggs: str | Sequence[str] = (),
+) -> Iterator[list[str]]:
+    """
+    Apply the selection options of `iter_rows` to rows that are already parsed.
+
+    Parameters:
+        rows (Iterable[List[str]]): The header followed by the body rows.
+        columns (Optional[Sequence[str]]): Names of the columns to keep.
+        where (Sequence[str]): Conditions that every row must match.
+        limit (Optional[int]): Maximum number of body rows to keep.
+        offset (int): Number of matching body rows to skip.
+        sort_by (Optional[str]): Name of the column to sort by.
+        desc (bool): Sort in descending order.
+        group_by (Sequence[str]): Names of the columns to group rows by.
+        aggs (Union[str, Sequence[str]]): Aggregates computed per group.
+
+    Returns:
+        Iterator[List[str]]: An iterator over the header and then each row.
+    """
+    rows = iter(rows)
+    if group_by or aggs:
+        rows = aggregate_rows(select_rows(rows, where=where), group_by, aggs)
+        where = ()
+    if columns or where or limit is not None or offset or sort_by:
+        rows = select_rows(rows, columns, where, limit, offset, sort_by, desc)
+    return rows
+
+
+def _needed_columns(
+    columns: Sequence[str] | None,
+    where: Sequence[str],
+    sort_by: str | None,
+    group_by: Sequence[str],
+    aggs: str | Sequence[str],
+) -> list[str]:
+    """
+    List the input columns a selection reads, for projecting readers.
+
+    Parameters:
+        columns (Optional[Sequence[str]]): Names of the columns to keep.
+        where (Sequence[str]): Conditions rows must match.
+        sort_by (Optional[str]): Name of the column to sort by.
+        group_by (Sequence[str]): Names of the columns to group rows by.
+        aggs (Union[str, Sequence[str]]): Aggregates computed per group.
+
+    Returns:
+        List[str]: The column names, or an empty list if every column is needed.
+    """
+    if group_by or aggs:
+        needed = aggregate_columns(group_by, parse_aggregates(aggs))
+    elif columns:
+        needed = [*columns, *([sort_by] if sort_by else [])]
+    else:
+        return []
+    return list(dict.fromkeys([*needed, *condition_columns(where)]))
+
+
+def read_rows(
+    input_path: str = "", fmt: str | None = None, backend: str = "csv", **query: Any
+) -> list[list[str]]:
+    """
+    Read any supported input file into a list of rows.
+
+    Parameters:
+        input_path (str): Path to the input file. If set to "-", reads from stdin.
+        fmt (Optional[str]): Name of the reader to use. Detected from the file
+        extension when None.
+        backend (str): Parser to use for CSV input: 'csv', 'mmap' or 'parallel'.
+        **query: Selection options (columns, where, limit, offset, sort_by, desc,
+        group_by, aggs) passed to `iter_rows`.
+
+    Returns:
+        List[List[str]]: The header followed by each row.
+    """
+    return list(iter_rows(input_path, fmt, backend, **query))
+
+
+def read_table(
+    input_path: str = "", fmt: str | None = None, backend: str = "csv", **query: Any
+) -> Table:
+    """
+    Read any supported input file into a column-oriented Table.
+
+    Parameters:
+        input_path (str): Path to the input file. If set to "-", reads from stdin.
+        fmt (Optional[str]): Name of the reader to use. Detected from the file
+        extension when None.
+        backend (str): Parser to use for CSV input: 'csv', 'mmap' or 'parallel'.
+        **query: Selection options (columns, where, limit, offset, sort_by, desc,
+        group_by, aggs) passed to `iter_rows`.
+
+    Returns:
+        Table: The table, with column widths already computed.
+    """
+    return Table.from_rows(iter_rows(input_path, fmt, backend, **query))
+
+
+def iter_tsv(input_path: str, backend: str = "csv") -> Iterator[list[str]]:
+    """
+    Lazily read a tab-separated file one row at a time.
+
+    Parameters:
+        input_path (str): Path to the input file. If set to "-", reads from stdin.
+        backend (str): Unused, TSV files are always read with the csv module.
+
+    Returns:
+        Iterator[List[str]]: An iterator over the header and then each row.
+    """
+    if input_path == "-":
+        yield from csv.reader(sys.stdin, delimiter="\t")
+        return
+    with open_input(input_path) as f:
+        yield from csv.reader(f, delimiter="\t")
+
+
+def iter_ndjson(
+    input_path: str, backend: str = "csv", columns: Sequence[str] | None = None
+) -> Iterator[list[str]]:
+    """
+    Lazily read a newline-delimited JSON file one object at a time.
+
+    The header is taken from the keys of the first object. Keys missing from later
+    objects give empty cells and keys the first object did not have are ignored.
+
+    Parameters:
+        input_path (str): Path to the input file. If set to "-", reads from stdin.
+        backend (str): Unused, each line is decoded with the json module.
+        columns (Optional[Sequence[str]]): Keys to read. All keys of the first
+        object are read when None.
+
+    Returns:
+        Iterator[List[str]]: An iterator over the header and then each row.
+    """
+    if input_path == "-":
+        yield from _ndjson_rows(sys.stdin, columns)
+        return
+    with open_input(input_path, newline=None) as f:
+        yield from _ndjson_rows(f, columns)
+
+
+def _ndjson_rows(
+    lines: Iterator[str], columns: Sequence[str] | None = None
+) -> Iterator[list[str]]:
+    """
+    Turn lines of JSON objects into a header and rows of cells.
+
+    Parameters:
+        lines (Iterator[str]): Lines of text, one JSON object each.
+        columns (Optional[Sequence[str]]): Keys to read, all keys of the first
+        object when None.
+
+    Returns:
+        Iterator[List[str]]: An iterator over the header and then each row.
+    """
+    header = None
+    for line in lines:
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        if not isinstance(record, dict):
+            raise ValueError("NDJSON lines must be JSON objects.")
+        if header is None:
+            header = list(record)
+            if columns:
+                column_indices(header, columns)
+                header = list(columns)
+            yield header
+        yield [_cell(record.get(key)) for key in header]
+
+
+def _cell(value: Any) -> str:
+    """
+    Convert a decoded value to the text of a cell.
+
+    Parameters:
+        value (Any): A value decoded from JSON or Arrow.
+
+    Returns:
+        str: Strings unchanged, an empty string for null and JSON for the rest.
+    """
+    if isinstance(value, str):
+        return value
+    if value is None:
+        return ""
+    try:
+        return json.dumps(value)
+    except TypeError:
+        return str(value)
+
+
+def iter_parquet(
+    input_path: str, backend: str = "csv", columns: Sequence[str] | None = None
+) -> Iterator[list[str]]:
+    """
+    Lazily read a Parquet file one record batch at a time. Requires pyarrow.
+
+    Parameters:
+        input_path (str): Path to the input file. If set to "-", reads from stdin.
+        backend (str): Unused.
+        columns (Optional[Sequence[str]]): Columns to read. Other column chunks are
+        skipped without being decoded. All columns are read when None.
+
+    Returns:
+        Iterator[List[str]]: An iterator over the header and then each row.
+    """
+    pa = _import_pyarrow()
+    import pyarrow.parquet as pq  # type: ignore[import-not-found]
+
+    parquet_file = pq.ParquetFile(_arrow_source(pa, input_path))
+    header = list(parquet_file.schema_arrow.names)
+    if columns:
+        column_indices(header, columns)
+        header = list(columns)
+    yield header
+    for batch in parquet_file.iter_batches(columns=columns or None):
+        yield from _batch_rows(pa, batch)
+
+
+def iter_arrow(
+    input_path: str, backend: str = "csv", columns: Sequence[str] | None = None
+) -> Iterator[list[str]]:
+    """
+    Lazily read an Arrow IPC file or stream one record batch at a time. Requires
+    pyarrow.
+
+    Parameters:
+        input_path (str): Path to the input file. If set to "-", reads from stdin.
+        backend (str): Unused.
+        columns (Optional[Sequence[str]]): Columns to read. Other columns are never
+        converted to text. All columns are read when None.
+
+    Returns:
+        Iterator[List[str]]: An iterator over the header and then each row.
+    """
+    pa = _import_pyarrow()
+    import pyarrow.ipc as ipc  # type: ignore[import-not-found]
+
+    source = _arrow_source(pa, input_path)
+    try:
+        reader = ipc.open_file(source)
+        batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+    except pa.ArrowInvalid:
+        reader = ipc.open_stream(source)
+        batches = iter(reader)
+    header = list(reader.schema.names)
+    if columns:
+        column_indices(header, columns)
+        header = list(columns)
+    yield header
+    for batch in batches:
+        if columns:
+            batch = batch.select(columns)
+        yield from _batch_rows(pa, batch)
+
+
+def _import_pyarrow() -> Any:
+    """
+    Import pyarrow, which is only needed for Parquet and Arrow input.
+
+    Returns:
+        module: The pyarrow module.
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        raise ValueError("Reading Parquet and Arrow files requires pyarrow.") from None
+    return pyarrow
+
+
+def _arrow_source(pa: Any, input_path: str) -> Any:
+    """
+    Open an input for pyarrow, buffering stdin since Arrow readers need to seek.
+
+    Parameters:
+        pa (module): The pyarrow module.
+        input_path (str): Path to the input file. If set to "-", reads from stdin.
+
+    Returns:
+        Any: A path or an in-memory buffer reader.
+    """
+    if input_path == "-":
+        return pa.BufferReader(sys.stdin.buffer.read())
+    return input_path
+
+
+def _batch_rows(pa: Any, batch: Any) -> Iterator[list[str]]:
+    """
+    Convert an Arrow record batch to rows of cells.
+
+    Columns are cast to strings by Arrow in one call each, falling back to
+    converting values one at a time for types Arrow cannot cast, such as lists.
+
+    Parameters:
+        pa (module): The pyarrow module.
+        batch (pyarrow.RecordBatch): The record batch.
+
+    Returns:
+        Iterator[List[str]]: The batch's rows.
+    """
+    columns = []
+    for column in batch.columns:
+        try:
+            values = column.cast(pa.string()).to_pylist()
+            columns.append(["" if v is None else v for v in values])
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            columns.append([_cell(v) for v in column.to_pylist()])
+    return map(list, zip(*columns))
+
+
+register_reader("csv", iter_csv, (".csv",))
+register_reader("tsv", iter_tsv, (".tsv", ".tab"))
+register_reader("ndjson", iter_ndjson, (".ndjson", ".jsonl"), projects=True)
+register_reader("parquet", iter_parquet, (".parquet", ".pq"), projects=True)
+register_reader("arrow", iter_arrow, (".arrow", ".feather", ".ipc"), projects=True)
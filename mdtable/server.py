@@ -0,0 +1,283 @@
+import csv
+import io
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from .core import generate_md_table, paginate
+from .preview import format_preview
+from .readers import query_rows
+from .table import Table
+from .transforms import DEFAULT_TRANSFORMS
+from .typed import format_table
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_BODY_BYTES = 16 * 1024 * 1024
+# Seconds a connection may stay idle, for example while sending its body.
+REQUEST_TIMEOUT = 30
+
+# Query-string options, named like the command-line flags, with the keyword
+# argument of `render_payload` they set and the kind of value they take.
+OPTIONS = {
+    "align": ("alignments", "text"),
+    "transforms": ("transforms", "text"),
+    "preview": ("preview", "flag"),
+    "columns": ("columns", "names"),
+    "where": ("where", "repeated"),
+    "limit": ("limit", "int"),
+    "offset": ("offset", "int"),
+    "sort-by": ("sort_by", "text"),
+    "desc": ("desc", "flag"),
+    "top": ("top", "int"),
+    "group-by": ("group_by", "names"),
+    "agg": ("aggs", "text"),
+    "typed": ("typed", "flag"),
+    "precision": ("precision", "int"),
+    "pad": ("pad", "flag"),
+    "page-rows": ("page_rows", "int"),
+    "page-bytes": ("page_bytes", "int"),
+}
+
+
+def parse_options(query: dict[str, list[str]]) -> dict[str, Any]:
+    """
+    Convert query-string options into keyword arguments for `render_payload`.
+
+    Options that only make sense for files or processes, such as 'format',
+    'backend', 'jobs', 'stream', 'incremental' or 'zstd-threads', are rejected.
+
+    Parameters:
+        query (Dict[str, List[str]]): The parsed query string.
+
+    Returns:
+        Dict[str, Any]: The keyword arguments.
+    """
+    unsupported = sorted(set(query) - set(OPTIONS))
+    if unsupported:
+        raise ValueError(f"Unsupported options: {', '.join(unsupported)}")
+    options = {}
+    for name, values in query.items():
+        keyword, kind = OPTIONS[name]
+        try:
+            options[keyword] = _option_value(kind, values)
+        except ValueError:
+            raise ValueError(f"Invalid value for '{name}': {values[-1]}") from None
+    return options
+
+
+def _option_value(kind: str, values: list[str]) -> Any:
+    """
+    Parse the values of one query-string option; only 'where' may be repeated.
+
+    Parameters:
+        kind (str): 'text', 'flag', 'int', 'names' (comma-separated) or
+        'repeated'.
+        values (List[str]): The values given for the option.
+
+    Returns:
+        Any: The parsed value.
+    """
+    value = values[-1]
+    if kind == "flag":
+        return value.lower() in ("1", "true", "yes")
+    if kind == "int":
+        return int(value)
+    if kind == "names":
+        return value.split(",")
+    return values if kind == "repeated" else value
+
+
+def render_payload(
+    body: bytes,
+    alignments: str | None = None,
+    transforms: str = ",".join(DEFAULT_TRANSFORMS),
+    preview: bool = False,
+    typed: bool = False,
+    precision: int | None = None,
+    pad: bool = False,
+    page_rows: int | None = None,
+    page_bytes: int | None = None,
+    top: int | None = None,
+    **query: Any,
+) -> str:
+    """
+    Render a CSV payload the same way the command line does.
+
+    Parameters:
+        body (bytes): The CSV data, UTF-8 encoded.
+        alignments (Optional[str]): Comma-separated column alignments.
+        transforms (str): Comma-separated cell transforms.
+        preview (bool): Return the terminal preview instead of Markdown.
+        typed (bool): Format numeric columns and align them to the right.
+        precision (Optional[int]): Decimal places for float and decimal columns
+        with `typed`.
+        pad (bool): Pad cells so the Markdown columns line up as plain text.
+        page_rows (Optional[int]): Split the table into pages of at most this many
+        body rows, returned as sections separated by blank lines.
+        page_bytes (Optional[int]): Split the table into pages of at most this many
+        bytes.
+        top (Optional[int]): Keep only the first N rows in `sort_by` order.
+        **query: Selection options (columns, where, limit, offset, sort_by, desc,
+        group_by, aggs) passed to `readers.query_rows`.
+
+    Returns:
+        str: The rendered table.
+    """
+    _check_options(preview, page_rows or page_bytes, top, query)
+    if top is not None:
+        query["limit"] = top
+    aligns = alignments.split(",") if alignments else None
+    text = io.StringIO(body.decode("utf-8"), newline="")
+    rows = query_rows(csv.reader(text), **query)
+    data: list[list[str]] | Table
+    if typed:
+        data, aligns = format_table(Table.from_rows(rows), aligns, precision)
+    else:
+        data = Table.from_rows(rows) if preview else list(rows)
+    if preview:
+        return format_preview(data, aligns)
+    content = generate_md_table(data, aligns, 1, transforms, pad)
+    if page_rows or page_bytes:
+        pages = paginate(content.split("\n"), page_rows, page_bytes)
+        return "\n\n".join("\n".join(page) for page in pages)
+    return content
+
+
+def _check_options(
+    preview: bool, paged: int | None, top: int | None, query: dict[str, Any]
+) -> None:
+    """
+    Reject the option combinations the command line rejects.
+
+    Parameters:
+        preview (bool): Whether the preview is requested.
+        paged (Optional[int]): The page size, if the table is split into pages.
+        top (Optional[int]): The 'top' option.
+        query (Dict[str, Any]): The selection options.
+
+    Returns:
+        None
+    """
+    if (top is not None or query.get("desc")) and not query.get("sort_by"):
+        raise ValueError("'top' and 'desc' require 'sort-by'")
+    if top is not None and query.get("limit") is not None:
+        raise ValueError("'top' cannot be combined with 'limit'")
+    if min(top or 0, query.get("limit") or 0, query.get("offset") or 0) < 0:
+        raise ValueError("'limit', 'offset' and 'top' must not be negative")
+    if paged and preview:
+        raise ValueError(
+            "'page-rows' and 'page-bytes' cannot be combined with 'preview'"
+        )
+
+
+class RenderHandler(BaseHTTPRequestHandler):
+    """
+    Renders the CSV in a POST body, taking the options listed in OPTIONS from the
+    query string.
+    """
+
+    server_version = "mdtable"
+    timeout = REQUEST_TIMEOUT
+
+    def do_POST(self) -> None:
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            self.send_error(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+            return
+        if length > MAX_BODY_BYTES:
+            self.send_error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+            return
+
+        body = self.rfile.read(length)
+        try:
+            content = render_payload(body, **parse_options(query))
+        except (ValueError, UnicodeDecodeError, csv.Error) as e:
+            self.send_error(HTTPStatus.BAD_REQUEST, str(e))
+            return
+
+        payload = content.encode("utf-8")
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/markdown; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass  # keep the daemon quiet; errors are returned to the client
+
+
+def make_server(
+    host: str = DEFAULT_HOST, port: int = DEFAULT_PORT
+) -> ThreadingHTTPServer:
+    """
+    Create a rendering server bound to a local address.
+
+    Parameters:
+        host (str): Interface to listen on.
+        port (int): Port to listen on, or 0 to pick a free one.
+
+    Returns:
+        ThreadingHTTPServer: The server, ready for serve_forever().
+    """
+    return ThreadingHTTPServer((host, port), RenderHandler)
+
+
+def start_server(host: str = DEFAULT_HOST, port: int = 0) -> ThreadingHTTPServer:
+    """
+    Start a rendering server on a background thread.
+
+    Parameters:
+        host (str): Interface to listen on.
+        port (int): Port to listen on, 0 to pick a free one.
+
+    Returns:
+        ThreadingHTTPServer: The running server; call shutdown() to stop it.
+    """
+    server = make_server(host, port)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def request_render(
+    body: bytes,
+    url: str = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}/",
+    alignments: str | None = None,
+    transforms: str | None = None,
+    preview: bool = False,
+    **options: Any,
+) -> str:
+    """
+    Send CSV data to a running server and return the rendered table.
+
+    Parameters:
+        body (bytes): The CSV data, UTF-8 encoded.
+        url (str): The server's address.
+        alignments (Optional[str]): Comma-separated column alignments.
+        transforms (Optional[str]): Comma-separated cell transforms.
+        preview (bool): Request the terminal preview instead of Markdown.
+        **options: Other query-string options, with underscores for dashes, such
+        as sort_by="Score" or where=["Score>=80"]. See OPTIONS.
+
+    Returns:
+        str: The rendered table.
+    """
+    query = {"align": alignments, "transforms": transforms, "preview": preview or None}
+    query.update((k.replace("_", "-"), v) for k, v in options.items())
+    params = urllib.parse.urlencode(
+        {k: v for k, v in query.items() if v is not None}, doseq=True
+    )
+    request = urllib.request.Request(f"{url}?{params}", data=body, method="POST")
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.read().decode("utf-8")
+    except urllib.error.HTTPError as e:
+        raise ValueError(e.reason) from None
@@ -0,0 +1,222 @@
+import csv
+import heapq
+import tempfile
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from typing import TextIO
+
+from .query import _number
+
+RUN_SIZE = 100_000
+MERGE_WIDTH = 64
+
+SortKey = Callable[[list[str]], tuple]
+
+
+def sort_key(index: int, desc: bool = False) -> SortKey:
+    """
+    Build a sort key for one column.
+
+    Numeric cells are compared as numbers and text is compared as is. Text sorts
+    after the numbers in either direction, so cells such as 'n/a' end up last.
+
+    Parameters:
+        index (int): Position of the column to sort by.
+        desc (bool): Whether the key is used for a descending sort.
+
+    Returns:
+        Callable[[List[str]], tuple]: The key function.
+    """
+    text_rank = -1 if desc else 1
+
+    def key(row: list[str]) -> tuple:
+        cell = row[index]
+        number = _number(cell)
+        if number is None or number != number:  # text or NaN
+            return (text_rank, cell)
+        return (0, number)
+
+    return key
+
+
+def order_rows(
+    rows: Iterable[list[str]], index: int, desc: bool = False, keep: int | None = None
+) -> Iterator[list[str]]:
+    """
+    Sort body rows by one column, keeping only the first `keep` if given.
+
+    Ties keep their input order.
+
+    Parameters:
+        rows (Iterable[List[str]]): The body rows.
+        index (int): Position of the column to sort by.
+        desc (bool): Sort in descending order.
+        keep (Optional[int]): Number of rows to keep. A heap of this size is used
+        instead of sorting every row.
+
+    Returns:
+        Iterator[List[str]]: The rows, in order.
+    """
+    key = sort_key(index, desc)
+    if keep is not None:
+        return iter(top_rows(rows, key, keep, desc))
+    return sort_rows(rows, key, desc)
+
+
+def top_rows(
+    rows: Iterable[list[str]], key: SortKey, n: int, desc: bool = False
+) -> list[list[str]]:
+    """
+    Find the first `n` rows in sort order, holding only `n` rows in memory.
+
+    Parameters:
+        rows (Iterable[List[str]]): The body rows.
+        key (Callable[[List[str]], tuple]): The sort key.
+        n (int): Number of rows to keep.
+        desc (bool): Keep the largest rows instead of the smallest.
+
+    Returns:
+        List[List[str]]: The kept rows, in order.
+    """
+    if desc:
+        return heapq.nlargest(n, rows, key=key)
+    return heapq.nsmallest(n, rows, key=key)
+
+
+def sort_rows(
+    rows: Iterable[list[str]],
+    key: SortKey,
+    desc: bool = False,
+    run_size: int = RUN_SIZE,
+    merge_width: int = MERGE_WIDTH,
+) -> Iterator[list[str]]:
+    """
+    Sort rows that may not fit in memory with an external merge sort.
+
+    Rows are sorted in memory `run_size` at a time. Inputs that fit in a single run
+    never touch the disk; otherwise each sorted run is spilled to a temporary file
+    and the runs are merged lazily. Runs are merged in levels so the number of open
+    files stays bounded: every `merge_width` runs of a level are merged into one run
+    of the next level, and each row is rewritten once per level rather than once
+    per run.
+
+    Parameters:
+        rows (Iterable[List[str]]): The body rows.
+        key (Callable[[List[str]], tuple]): The sort key.
+        desc (bool): Sort in descending order.
+        run_size (int): Number of rows sorted in memory at a time.
+        merge_width (int): Maximum number of runs merged at once, at least 2.
+
+    Returns:
+        Iterator[List[str]]: The rows, in order.
+    """
+    if merge_width < 2:
+        raise ValueError("merge_width must be at least 2.")
+    rows = iter(rows)
+    run = sorted(islice(rows, run_size), key=key, reverse=desc)
+    if len(run) < run_size:
+        yield from run
+        return
+
+    # levels[i] holds the runs merged i times, oldest first. Every run of a level
+    # holds rows from earlier in the input than the runs of the levels below it.
+    levels: list[list[TextIO]] = []
+    try:
+        while run:
+            _push(levels, 0, _spill(run), key, desc, merge_width)
+            run = sorted(islice(rows, run_size), key=key, reverse=desc)
+        # Merge the lowest levels up until the final merge fits in `merge_width`.
+        depth = 0
+        while sum(map(len, levels)) > merge_width:
+            group, levels[depth] = levels[depth], []
+            if group:
+                merged = _merge_runs(group, key, desc)
+                _push(levels, depth + 1, merged, key, desc, merge_width)
+            depth += 1
+        yield from _merge([f for level in reversed(levels) for f in level], key, desc)
+    finally:
+        for level in levels:
+            for f in level:
+                f.close()
+
+
+def _push(
+    levels: list[list[TextIO]],
+    depth: int,
+    run: TextIO,
+    key: SortKey,
+    desc: bool,
+    merge_width: int,
+) -> None:
+    """
+    Add a spilled run to a level, merging full levels into the next one.
+
+    Parameters:
+        levels (List[List[TextIO]]): The runs of each level, oldest first.
+        depth (int): The level the run belongs to.
+        run (TextIO): The spilled run.
+        key (Callable[[List[str]], tuple]): The sort key.
+        desc (bool): Whether the runs are in descending order.
+        merge_width (int): Number of runs that fill a level.
+    """
+    while True:
+        if depth == len(levels):
+            levels.append([])
+        levels[depth].append(run)
+        if len(levels[depth]) < merge_width:
+            return
+        group, levels[depth] = levels[depth], []
+        run = _merge_runs(group, key, desc)
+        depth += 1
+
+
+def _merge_runs(runs: list[TextIO], key: SortKey, desc: bool) -> TextIO:
+    """
+    Merge spilled runs into a new spilled run, closing the merged ones.
+
+    Parameters:
+        runs (List[TextIO]): The spilled runs, in input order.
+        key (Callable[[List[str]], tuple]): The sort key.
+        desc (bool): Whether the runs are in descending order.
+
+    Returns:
+        TextIO: The merged run. A single run is returned as is.
+    """
+    if len(runs) == 1:
+        return runs[0]
+    try:
+        return _spill(_merge(runs, key, desc))
+    finally:
+        for f in runs:
+            f.close()
+
+
+def _spill(rows: Iterable[list[str]]) -> TextIO:
+    """
+    Write rows to a temporary CSV file, rewound for reading.
+
+    Parameters:
+        rows (Iterable[List[str]]): The rows to write.
+
+    Returns:
+        TextIO: The temporary file, deleted when closed.
+    """
+    f = tempfile.TemporaryFile("w+", newline="", encoding="utf-8")
+    csv.writer(f).writerows(rows)
+    f.seek(0)
+    return f
+
+
+def _merge(runs: list[TextIO], key: SortKey, desc: bool) -> Iterator[list[str]]:
+    """
+    Lazily merge sorted runs spilled to temporary files.
+
+    Parameters:
+        runs (List[TextIO]): The spilled runs, in input order.
+        key (Callable[[List[str]], tuple]): The sort key.
+        desc (bool): Whether the runs are in descending order.
+
+    Returns:
+        Iterator[List[str]]: The merged rows.
+    """
+    return heapq.merge(*(csv.reader(f) for f in runs), key=key, reverse=desc)
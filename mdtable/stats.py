@@ -0,0 +1,155 @@
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from itertools import islice
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None  # type: ignore[assignment]
+
+
+class Stats:
+    """
+    Per-stage wall and CPU timers plus row and byte counters for one conversion.
+    """
+
+    enabled = True
+
+    def __init__(self) -> None:
+        self.stages: dict[str, dict[str, float]] = {}
+        self.rows = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Time a stage of the conversion. Repeated stages accumulate.
+
+        Parameters:
+            name (str): The stage name, e.g. 'read', 'render' or 'write'.
+        """
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            timing = self.stages.setdefault(name, {"wall": 0.0, "cpu": 0.0})
+            timing["wall"] += time.perf_counter() - wall
+            timing["cpu"] += time.process_time() - cpu
+
+    def count_rows(self, rows: Iterable[list[str]]) -> Iterable[list[str]]:
+        """
+        Pass rows through while counting the body rows after the header.
+
+        Parameters:
+            rows (Iterable[List[str]]): The header followed by the body rows.
+
+        Returns:
+            Iterable[List[str]]: The same rows.
+        """
+        rows = iter(rows)
+        for row in islice(rows, 1):
+            yield row
+        for row in rows:
+            self.rows += 1
+            yield row
+
+    def count_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        """
+        Pass rendered Markdown through while counting the body rows.
+
+        Parameters:
+            lines (Iterable[str]): The header and alignment lines followed by
+            chunks of newline-separated body lines.
+
+        Returns:
+            Iterator[str]: The same lines.
+        """
+        lines = iter(lines)
+        yield from islice(lines, 2)
+        for chunk in lines:
+            self.rows += chunk.count("\n") + 1
+            yield chunk
+
+    def report(self) -> dict:
+        """
+        Summarize the collected measurements.
+
+        Returns:
+            dict: Stage timings, counters, throughput and peak memory.
+        """
+        wall = sum(t["wall"] for t in self.stages.values())
+        return {
+            "stages": self.stages,
+            "rows": self.rows,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "rows_per_sec": self.rows / wall if wall else 0.0,
+            "bytes_per_sec": self.bytes_in / wall if wall else 0.0,
+            "peak_memory_bytes": peak_memory(),
+        }
+
+    def format(self, style: str = "human") -> str:
+        """
+        Format the report for display.
+
+        Parameters:
+            style (str): Either 'human' or 'json'.
+
+        Returns:
+            str: The formatted report.
+        """
+        report = self.report()
+        if style == "json":
+            import json
+
+            return json.dumps(report)
+
+        lines = [f"{'stage':<12} {'wall (s)':>10} {'cpu (s)':>10}"]
+        for name, timing in report["stages"].items():
+            lines.append(f"{name:<12} {timing['wall']:>10.4f} {timing['cpu']:>10.4f}")
+        lines.append(
+            f"{report['rows']:,} rows, {report['bytes_in']:,} bytes in, "
+            f"{report['bytes_out']:,} bytes out"
+        )
+        lines.append(
+            f"{report['rows_per_sec']:,.0f} rows/s, "
+            f"{report['bytes_per_sec'] / 1024**2:,.2f} MB/s"
+        )
+        if report["peak_memory_bytes"] is not None:
+            lines.append(f"peak memory {report['peak_memory_bytes'] / 1024**2:,.1f} MB")
+        return "\n".join(lines)
+
+
+class NullStats(Stats):
+    """
+    Stats that record nothing, used when instrumentation is disabled.
+    """
+
+    enabled = False
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        yield
+
+    def count_rows(self, rows: Iterable[list[str]]) -> Iterable[list[str]]:
+        return rows
+
+    def count_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        return iter(lines)
+
+
+def peak_memory() -> int | None:
+    """
+    Return the peak resident memory of the process.
+
+    Returns:
+        Optional[int]: The peak RSS in bytes, or None where it cannot be measured.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
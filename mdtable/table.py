@@ -0,0 +1,114 @@
+from collections.abc import Iterable, Iterator, Sequence
+
+from .width import display_width
+
+
+class Table:
+    """
+    Column-oriented table of string cells with precomputed column widths.
+
+    Cells are stored in one list per column rather than one list per row, and the
+    widest cell of each column (by display width, see `width.display_width`) is
+    tracked as rows are appended, so renderers that need aligned output do not have
+    to measure every cell again.
+
+    Iterating over a table yields the header followed by each body row as a tuple,
+    so a Table can be passed anywhere a list of rows is accepted.
+    """
+
+    __slots__ = ("header", "columns", "widths")
+
+    def __init__(self, header: Sequence[str]) -> None:
+        """
+        Parameters:
+            header (Sequence[str]): The column names.
+        """
+        self.header = list(header)
+        self.columns: list[list[str]] = [[] for _ in self.header]
+        self.widths = [display_width(h) for h in self.header]
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence[str]]) -> "Table":
+        """
+        Build a table from an iterable of rows, the first being the header.
+
+        Parameters:
+            rows (Iterable[Sequence[str]]): The header followed by the body rows.
+
+        Returns:
+            Table: The new table.
+        """
+        rows = iter(rows)
+        header = next(rows, None)
+        if header is None:
+            raise ValueError("Table data is empty.")
+        table = cls(header)
+        table.extend(rows)
+        return table
+
+    @classmethod
+    def from_columns(
+        cls, header: Sequence[str], columns: Sequence[list[str]]
+    ) -> "Table":
+        """
+        Build a table directly from column lists, without copying them.
+
+        Parameters:
+            header (Sequence[str]): The column names.
+            columns (Sequence[List[str]]): One list of cells per column, all of the
+            same length.
+
+        Returns:
+            Table: The new table.
+        """
+        if len(columns) != len(header) or len({len(c) for c in columns}) > 1:
+            raise ValueError("All rows must have the same number of columns.")
+        table = cls(header)
+        table.columns = list(columns)
+        table.widths = [
+            max(width, max(map(display_width, column), default=0))
+            for width, column in zip(table.widths, table.columns)
+        ]
+        return table
+
+    def append(self, row: Sequence[str]) -> None:
+        """
+        Append a body row, updating the column widths.
+
+        Parameters:
+            row (Sequence[str]): The row's cells.
+        """
+        if len(row) != len(self.columns):
+            raise ValueError("All rows must have the same number of columns.")
+        widths = self.widths
+        for i, (column, cell) in enumerate(zip(self.columns, row)):
+            column.append(cell)
+            width = len(cell) if cell.isascii() else display_width(cell)
+            if width > widths[i]:
+                widths[i] = width
+
+    def extend(self, rows: Iterable[Sequence[str]]) -> None:
+        """
+        Append several body rows.
+
+        Parameters:
+            rows (Iterable[Sequence[str]]): The rows to append.
+        """
+        for row in rows:
+            self.append(row)
+
+    def rows(self) -> Iterator[tuple[str, ...]]:
+        """
+        Iterate over the body rows without copying the columns.
+
+        Returns:
+            Iterator[Tuple[str, ...]]: Each body row as a tuple of cells.
+        """
+        return zip(*self.columns)
+
+    def __iter__(self) -> Iterator[Sequence[str]]:
+        yield self.header
+        yield from self.rows()
+
+    def __len__(self) -> int:
+        return len(self.columns[0]) if self.columns else 0
@@ -0,0 +1,211 @@
+from collections.abc import Callable, Sequence
+from functools import lru_cache
+
+# Cell transforms are either a mapping of substrings to replacements, applied to
+# whole rows with str.replace, or a function applied to each cell.
+TRANSFORMS: dict[str, dict[str, str] | Callable[[str], str]] = {
+    "commas": {"_": ","},
+    "escape": {"|": "\\|"},
+    "trim": str.strip,
+}
+DEFAULT_TRANSFORMS = ("commas",)
+SEPARATOR = " | "
+PLACEHOLDER = "\x1f"
+
+
+def register_transform(
+    name: str, transform: dict[str, str] | Callable[[str], str]
+) -> None:
+    """
+    Register a cell transform that can be used in a formatting pipeline.
+
+    Parameters:
+        name (str): Name used to select the transform.
+        transform (Union[Dict[str, str], Callable[[str], str]]): A mapping of
+        substrings to their replacements, or a function applied to each cell.
+    """
+    TRANSFORMS[name] = transform
+    compile_replacer.cache_clear()
+    compile_row_formatter.cache_clear()
+    compile_cell_formatter.cache_clear()
+
+
+def normalize_transforms(transforms: str | Sequence[str]) -> tuple[str, ...]:
+    """
+    Normalize transform names into a tuple, validating each one.
+
+    Parameters:
+        transforms (Union[str, Sequence[str]]): Transform names as a comma-separated
+        string or a sequence of strings.
+
+    Returns:
+        Tuple[str, ...]: The transform names, in order.
+    """
+    if isinstance(transforms, str):
+        transforms = transforms.split(",") if transforms else []
+    normalized = tuple(t.strip().lower() for t in transforms)
+    for t in normalized:
+        if t not in TRANSFORMS:
+            raise ValueError(f"Invalid transform: '{t}'")
+    return normalized
+
+
+def replacements(transforms: Sequence[str]) -> list[tuple[str, str]]:
+    """
+    Collect the substring replacements of a pipeline, in the order they apply.
+
+    Parameters:
+        transforms (Sequence[str]): Transform names, in order.
+
+    Returns:
+        List[Tuple[str, str]]: (old, new) pairs for str.replace.
+    """
+    pairs: list[tuple[str, str]] = []
+    for name in transforms:
+        mapping = TRANSFORMS[name]
+        if not callable(mapping):
+            pairs.extend(mapping.items())
+    return pairs
+
+
+def cell_functions(transforms: Sequence[str]) -> list[Callable[[str], str]]:
+    """
+    Collect the per-cell functions of a pipeline, in the order they apply.
+
+    Parameters:
+        transforms (Sequence[str]): Transform names, in order.
+
+    Returns:
+        List[Callable[[str], str]]: The functions applied to each cell.
+    """
+    funcs: list[Callable[[str], str]] = []
+    for name in transforms:
+        func = TRANSFORMS[name]
+        if callable(func):
+            funcs.append(func)
+    return funcs
+
+
+@lru_cache
+def compile_replacer(transforms: tuple[str, ...]) -> Callable[[str], str]:
+    """
+    Build a function applying the replacements of a pipeline to a whole string.
+
+    Only useful for replacements that never touch the column separator, such as
+    comma formatting applied to already padded preview lines.
+
+    Parameters:
+        transforms (Tuple[str, ...]): Transform names, in order.
+
+    Returns:
+        Callable[[str], str]: The replacing function.
+    """
+    pairs = replacements(normalize_transforms(transforms))
+
+    def replace(text: str) -> str:
+        for old, new in pairs:
+            text = text.replace(old, new)
+        return text
+
+    return replace
+
+
+@lru_cache
+def compile_row_formatter(
+    transforms: tuple[str, ...] = DEFAULT_TRANSFORMS,
+) -> Callable[[Sequence[str]], str]:
+    """
+    Compose a pipeline of cell transforms into a single row formatter.
+
+    Per-cell functions run first. The cells are then joined once and every
+    replacement runs over the whole row string, instead of once per cell. If a
+    replacement could touch the column separator, cells are joined with a
+    placeholder that is swapped for the separator last. Rows with a cell that
+    contains the placeholder itself are replaced cell by cell instead.
+
+    Parameters:
+        transforms (Tuple[str, ...]): Transform names, in order.
+
+    Returns:
+        Callable[[Sequence[str]], str]: A function rendering a row of cells as a
+        Markdown table line.
+    """
+    transforms = normalize_transforms(transforms)
+    cell_funcs = cell_functions(transforms)
+    cell_pairs = replacements(transforms)
+    pairs = list(cell_pairs)
+    joiner = SEPARATOR
+    if any(set(old) & set(SEPARATOR) for old, _ in pairs):
+        joiner = PLACEHOLDER
+        pairs.append((PLACEHOLDER, SEPARATOR))
+
+    def replace_cell(cell: str) -> str:
+        for old, new in cell_pairs:
+            cell = cell.replace(old, new)
+        return cell
+
+    def format_row(row: Sequence[str]) -> str:
+        for func in cell_funcs:
+            row = [func(cell) for cell in row]
+        line = joiner.join(row)
+        if joiner == PLACEHOLDER and line.count(PLACEHOLDER) != len(row) - 1:
+            return "| " + SEPARATOR.join(map(replace_cell, row)) + " |"
+        for old, new in pairs:
+            line = line.replace(old, new)
+        return "| " + line + " |"
+
+    return format_row
+
+
+def format_header(header: Sequence[str], transforms: Sequence[str]) -> list[str]:
+    """
+    Apply the escape transform to the header row, if it is in the pipeline.
+
+    The other transforms only apply to body rows.
+
+    Parameters:
+        header (Sequence[str]): The header cells.
+        transforms (Sequence[str]): Transform names, in order.
+
+    Returns:
+        List[str]: The header cells, with '|' escaped if asked for.
+    """
+    if "escape" not in transforms:
+        return list(header)
+    pairs = replacements(["escape"])
+    cells = []
+    for cell in header:
+        for old, new in pairs:
+            cell = cell.replace(old, new)
+        cells.append(cell)
+    return cells
+
+
+@lru_cache
+def compile_cell_formatter(
+    transforms: tuple[str, ...] = DEFAULT_TRANSFORMS,
+) -> Callable[[str], str]:
+    """
+    Compose a pipeline of cell transforms into a function applied to one cell.
+
+    Used where cells must be measured after transforming them, such as padded
+    output, rather than joined straight into a row.
+
+    Parameters:
+        transforms (Tuple[str, ...]): Transform names, in order.
+
+    Returns:
+        Callable[[str], str]: A function returning the transformed cell.
+    """
+    transforms = normalize_transforms(transforms)
+    cell_funcs = cell_functions(transforms)
+    pairs = replacements(transforms)
+
+    def format_cell(cell: str) -> str:
+        for func in cell_funcs:
+            cell = func(cell)
+        for old, new in pairs:
+            cell = cell.replace(old, new)
+        return cell
+
+    return format_cell
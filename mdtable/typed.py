@@ -0,0 +1,226 @@
+import re
+from collections.abc import Callable, Sequence
+from datetime import date
+from decimal import Decimal, InvalidOperation
+
+from .table import Table
+
+try:
+    import numpy as np  # type: ignore[import-not-found]
+except ImportError:  # pure-Python fallback
+    np = None
+
+SAMPLE_SIZE = 1000
+NUMERIC_TYPES = {"int", "float", "decimal"}
+# Years are right-aligned like numbers but never get thousands separators.
+RIGHT_ALIGNED = NUMERIC_TYPES | {"year"}
+
+# No leading zeros (so codes such as '00501' stay text), and separators only
+# between groups of three digits.
+_DIGITS = r"(?:0|[1-9]\d*|[1-9]\d{0,2}(?:,\d{3})+|[1-9]\d{0,2}(?:_\d{3})+)"
+_INT = re.compile(rf"[+-]?{_DIGITS}")
+_YEAR = re.compile(r"[12]\d{3}")
+_DECIMAL = re.compile(rf"[+-]?{_DIGITS}?\.\d+")
+_FLOAT = re.compile(rf"[+-]?(?:{_DIGITS}(?:\.\d*)?|\.\d+)[eE][+-]?\d+")
+# The kinds of values each numeric type can convert.
+_ACCEPTED_KINDS = {
+    "int": {"int", "year"},
+    "decimal": {"int", "year", "decimal"},
+    "float": {"int", "year", "decimal", "float"},
+}
+
+
+def infer_type(values: Sequence[str]) -> str:
+    """
+    Infer the type of a column from a sample of its values.
+
+    Empty cells are ignored. Integers and fixed-point numbers may use underscores or
+    commas as thousands separators, between groups of three digits. Numbers with
+    leading zeros, such as ZIP codes, are text. Columns made only of four-digit
+    numbers from 1000 to 2999 are years. Columns mixing numeric kinds get the widest
+    one: int, then decimal, then float.
+
+    Parameters:
+        values (Sequence[str]): Sample values from the column.
+
+    Returns:
+        str: One of 'int', 'decimal', 'float', 'year', 'date' or 'text'.
+    """
+    kinds = {_value_kind(v.strip()) for v in values if v.strip()}
+    if not kinds or "text" in kinds:
+        return "text"
+    if kinds in ({"date"}, {"year"}):
+        return kinds.pop()
+    if "date" in kinds:
+        return "text"
+    for kind in ("float", "decimal", "int"):
+        if kind in kinds:
+            return kind
+    return "text"
+
+
+def _value_kind(value: str) -> str:
+    """
+    Classify a single non-empty value.
+
+    Parameters:
+        value (str): The stripped cell value.
+
+    Returns:
+        str: One of 'int', 'year', 'decimal', 'float', 'date' or 'text'.
+    """
+    if _YEAR.fullmatch(value):
+        return "year"
+    if _INT.fullmatch(value):
+        return "int"
+    if _DECIMAL.fullmatch(value):
+        return "decimal"
+    if _FLOAT.fullmatch(value):
+        return "float"
+    try:
+        date.fromisoformat(value)
+    except ValueError:
+        return "text"
+    return "date"
+
+
+def infer_column_types(table: Table, sample: int = SAMPLE_SIZE) -> list[str]:
+    """
+    Infer the type of every column of a table from its first rows.
+
+    Parameters:
+        table (Table): The table.
+        sample (int): Number of rows to inspect.
+
+    Returns:
+        List[str]: The type of each column.
+    """
+    return [infer_type(column[:sample]) for column in table.columns]
+
+
+def format_column(
+    values: list[str], col_type: str, precision: int | None = None
+) -> list[str]:
+    """
+    Format a whole column of numeric values at once.
+
+    Values are converted to numbers in bulk, with NumPy when it is installed, and
+    formatted with thousands separators. Floats and decimals are shown with
+    `precision` decimal places when given. Empty cells, and every cell of non-numeric
+    columns, are returned unchanged. So is the whole column if any cell, such as
+    one past the rows sampled to infer the type, is not a number of that type.
+
+    Parameters:
+        values (List[str]): The column's cells.
+        col_type (str): The column's inferred type.
+        precision (Optional[int]): Number of decimal places for floats and decimals.
+
+    Returns:
+        List[str]: The formatted cells.
+    """
+    if col_type not in NUMERIC_TYPES:
+        return values
+
+    present = [i for i, v in enumerate(values) if v.strip()]
+    accepted = _ACCEPTED_KINDS[col_type]
+    if not all(_value_kind(values[i].strip()) in accepted for i in present):
+        return values  # the sample did not represent the whole column
+    cleaned = [values[i].strip().replace("_", "").replace(",", "") for i in present]
+    try:
+        numbers = _to_numbers(cleaned, col_type)
+    except (ValueError, OverflowError, InvalidOperation):
+        return values  # the sample did not represent the whole column
+
+    formatted = list(values)
+    for i, text in zip(present, map(_formatter(col_type, precision), numbers)):
+        formatted[i] = text
+    return formatted
+
+
+def _to_numbers(cleaned: list[str], col_type: str) -> list:
+    """
+    Convert cleaned numeric strings to numbers in one batch.
+
+    Parameters:
+        cleaned (List[str]): Numeric strings without thousands separators.
+        col_type (str): 'int', 'float' or 'decimal'.
+
+    Returns:
+        list: The converted values.
+    """
+    if col_type == "decimal":
+        return list(map(Decimal, cleaned))
+    if np is not None and cleaned:
+        dtype = np.int64 if col_type == "int" else np.float64
+        try:
+            return np.asarray(cleaned).astype(dtype).tolist()
+        except OverflowError:
+            pass  # integers beyond int64 are converted by Python below
+    return list(map(int if col_type == "int" else float, cleaned))
+
+
+def _formatter(col_type: str, precision: int | None) -> Callable[[object], str]:
+    """
+    Build the format function for a numeric column.
+
+    Parameters:
+        col_type (str): 'int', 'float' or 'decimal'.
+        precision (Optional[int]): Number of decimal places for floats and decimals.
+
+    Returns:
+        Callable[[object], str]: A bound str.format method.
+    """
+    if col_type == "int":
+        return "{:,}".format
+    if precision is None:
+        # keep the digits as written; 'f' stops Decimal using exponent notation
+        return "{:,f}".format if col_type == "decimal" else "{:,}".format
+    return f"{{:,.{precision}f}}".format
+
+
+def typed_alignments(
+    types: Sequence[str], alignments: Sequence[str] | None = None
+) -> list[str]:
+    """
+    Right-align numeric and year columns, keeping any explicitly requested alignments.
+
+    Parameters:
+        types (Sequence[str]): The type of each column.
+        alignments (Optional[Sequence[str]]): Explicit alignments, which win over
+        the inferred ones.
+
+    Returns:
+        List[str]: An alignment for every column.
+    """
+    inferred = ["right" if t in RIGHT_ALIGNED else "left" for t in types]
+    if alignments:
+        inferred[: len(alignments)] = alignments
+    return inferred
+
+
+def format_table(
+    table: Table,
+    alignments: Sequence[str] | None = None,
+    precision: int | None = None,
+    sample: int = SAMPLE_SIZE,
+) -> tuple[Table, list[str]]:
+    """
+    Infer column types, format numeric columns and align them to the right.
+
+    Parameters:
+        table (Table): The table to format.
+        alignments (Optional[Sequence[str]]): Explicit alignments, which win over
+        the inferred ones.
+        precision (Optional[int]): Number of decimal places for floats and decimals.
+        sample (int): Number of rows used to infer the column types.
+
+    Returns:
+        Tuple[Table, List[str]]: The formatted table and its alignments.
+    """
+    types = infer_column_types(table, sample)
+    columns = [
+        format_column(column, col_type, precision)
+        for column, col_type in zip(table.columns, types)
+    ]
+    formatted = Table.from_columns(table.header, columns)
+    return formatted, typed_alignments(types, alignments)
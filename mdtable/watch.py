@@ -0,0 +1,280 @@
+import ctypes
+import ctypes.util
+import glob
+import os
+import select
+import struct
+import sys
+import time
+from collections.abc import Generator, Iterable
+from pathlib import Path
+
+from .batch import expand_sources, output_path, run_batch
+
+DEBOUNCE_SECONDS = 0.2
+POLL_INTERVAL = 0.5
+
+# From <sys/inotify.h>.
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+_EVENT = struct.Struct("iIII")
+
+
+class PollingWatcher:
+    """
+    Detect changed files by comparing their modification time and size.
+
+    Works everywhere, at the cost of one stat() call per watched file per interval.
+    """
+
+    __slots__ = ("patterns", "interval", "snapshot")
+
+    def __init__(self, patterns: Iterable[str], interval: float = POLL_INTERVAL):
+        """
+        Parameters:
+            patterns (Iterable[str]): Glob patterns or paths of the files to watch.
+            interval (float): Seconds between two scans.
+        """
+        self.patterns = list(patterns)
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        """
+        Stat every file matching the patterns.
+
+        Returns:
+            Dict[str, Tuple[int, int]]: Modification time and size by path.
+        """
+        snapshot = {}
+        for path in expand_sources(self.patterns):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            snapshot[os.path.normpath(path)] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def wait(self, timeout: float | None = None) -> set[str]:
+        """
+        Wait until files change or the timeout expires.
+
+        Parameters:
+            timeout (Optional[float]): Seconds to wait, or None to wait forever.
+
+        Returns:
+            Set[str]: Normalized paths of the files that were created or modified.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snapshot = self._scan()
+            changed = {p for p, s in snapshot.items() if self.snapshot.get(p) != s}
+            self.snapshot = snapshot
+            if changed:
+                return changed
+            remaining = self.interval
+            if deadline is not None:
+                remaining = min(remaining, deadline - time.monotonic())
+                if remaining <= 0:
+                    return set()
+            time.sleep(remaining)
+
+    def close(self) -> None:
+        """
+        Release resources held by the watcher.
+        """
+
+
+class InotifyWatcher:
+    """
+    Detect changed files with Linux inotify, without scanning the files.
+
+    The directories holding the watched files, and the fixed leading directory of
+    each pattern, are watched for files that are closed after writing or moved
+    into place.
+    """
+
+    __slots__ = ("fd", "dirs")
+
+    def __init__(self, patterns: Iterable[str]):
+        """
+        Parameters:
+            patterns (Iterable[str]): Glob patterns or paths of the files to watch.
+        """
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs: dict[int, str] = {}
+        patterns = list(patterns)
+        dirs = {_base_dir(p) for p in patterns}
+        dirs.update(os.path.dirname(p) or "." for p in expand_sources(patterns))
+        mask = IN_CLOSE_WRITE | IN_MOVED_TO
+        for directory in dirs:
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(directory), mask)
+            if wd >= 0:
+                self.dirs[wd] = directory
+
+    def wait(self, timeout: float | None = None) -> set[str]:
+        """
+        Wait until files change or the timeout expires.
+
+        Parameters:
+            timeout (Optional[float]): Seconds to wait, or None to wait forever.
+
+        Returns:
+            Set[str]: Normalized paths of the files that were written or moved into
+            a watched directory.
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        buf = os.read(self.fd, 64 * 1024)
+        changed = set()
+        offset = 0
+        while offset < len(buf):
+            wd, mask, _, length = _EVENT.unpack_from(buf, offset)
+            offset += _EVENT.size
+            end = offset + length
+            name = os.fsdecode(buf[offset:end].rstrip(b"\0"))
+            offset = end
+            if mask & IN_Q_OVERFLOW:
+                # Events were dropped, so treat every watched directory as changed.
+                changed.update(self._all_files())
+            elif wd in self.dirs and name:
+                changed.add(os.path.normpath(os.path.join(self.dirs[wd], name)))
+        return changed
+
+    def _all_files(self) -> set[str]:
+        """
+        List every file in the watched directories.
+
+        Returns:
+            Set[str]: Normalized paths of the files.
+        """
+        return {
+            os.path.normpath(os.path.join(d, name))
+            for d in self.dirs.values()
+            for name in os.listdir(d)
+        }
+
+    def close(self) -> None:
+        """
+        Close the inotify file descriptor.
+        """
+        os.close(self.fd)
+
+
+def _base_dir(pattern: str) -> str:
+    """
+    Return the leading directories of a glob pattern that contain no wildcards.
+
+    Parameters:
+        pattern (str): The glob pattern.
+
+    Returns:
+        str: The directory, '.' if the pattern starts with a wildcard.
+    """
+    parts = []
+    for part in Path(pattern).parent.parts:
+        if glob.has_magic(part):
+            break
+        parts.append(part)
+    return os.path.join(*parts) if parts else "."
+
+
+def make_watcher(
+    patterns: Iterable[str], polling: bool = False, interval: float = POLL_INTERVAL
+) -> InotifyWatcher | PollingWatcher:
+    """
+    Create an inotify watcher where available, falling back to polling.
+
+    Parameters:
+        patterns (Iterable[str]): Glob patterns or paths of the files to watch.
+        polling (bool): Always poll, for example on network file systems where
+        inotify misses changes made by other machines.
+        interval (float): Seconds between two scans when polling.
+
+    Returns:
+        Union[InotifyWatcher, PollingWatcher]: The watcher.
+    """
+    patterns = list(patterns)
+    if not polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(patterns)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(patterns, interval)
+
+
+def is_stale(src: str, dest: str) -> bool:
+    """
+    Check whether a Markdown output is missing or older than its input.
+
+    Parameters:
+        src (str): Path to the input CSV file.
+        dest (str): Path to the output Markdown file.
+
+    Returns:
+        bool: True if the output needs to be rendered.
+    """
+    try:
+        return os.stat(dest).st_mtime_ns < os.stat(src).st_mtime_ns
+    except FileNotFoundError:
+        return True
+
+
+def watch(
+    patterns: Iterable[str],
+    out_dir: str,
+    alignments: str | list[str] | None = None,
+    debounce: float = DEBOUNCE_SECONDS,
+    watcher: InotifyWatcher | PollingWatcher | None = None,
+) -> Generator[list[tuple[str, str, float | str]], None, None]:
+    """
+    Keep Markdown files up to date with the CSV files they are rendered from.
+
+    Outputs that are missing or older than their input are rendered first. After
+    that, each change is followed by a quiet period of `debounce` seconds, so that
+    a burst of writes to a file renders it once, and only the files that changed
+    are converted again. Files created later that match a pattern are picked up too.
+
+    Parameters:
+        patterns (Iterable[str]): Glob patterns or paths of the CSV files.
+        out_dir (str): Directory the Markdown files are written to. It is created
+        if missing.
+        alignments (Optional[Union[List[str], str]]): Column alignments applied to
+        every file.
+        debounce (float): Seconds without changes to wait before rendering.
+        watcher (Optional[Union[InotifyWatcher, PollingWatcher]]): The watcher to
+        use, `make_watcher(patterns)` by default. It is closed when the generator
+        is.
+
+    Returns:
+        Generator[List[Tuple[str, str, Union[float, str]]], None, None]: For each
+        round of conversions, the source, destination and either the elapsed
+        seconds or an error message of every converted file.
+    """
+    patterns = list(patterns)
+    watcher = watcher or make_watcher(patterns)
+    try:
+        sources = [
+            src
+            for src in expand_sources(patterns)
+            if is_stale(src, output_path(src, out_dir))
+        ]
+        yield list(run_batch(sources, out_dir, alignments))
+        while True:
+            changed = watcher.wait()
+            while more := watcher.wait(debounce):
+                changed |= more
+            sources = [
+                src
+                for src in expand_sources(patterns)
+                if os.path.normpath(src) in changed
+            ]
+            if sources:
+                yield list(run_batch(sources, out_dir, alignments))
+    finally:
+        watcher.close()
@@ -0,0 +1,91 @@
+import unicodedata
+from functools import lru_cache
+
+# Distinct non-ASCII cells whose width is remembered. Tables repeat the same values
+# (names, cities, categories) often enough that most lookups hit the cache.
+WIDTH_CACHE_SIZE = 65_536
+# Combining marks and format characters such as the zero-width joiner.
+ZERO_WIDTH_CATEGORIES = {"Mn", "Me", "Cf"}
+# Emoji skin tone modifiers merge into the emoji before them.
+SKIN_TONES = ("\U0001f3fb", "\U0001f3ff")
+
+
+def display_width(text: str) -> int:
+    """
+    Measure how many terminal columns a string takes up.
+
+    ASCII strings are measured with `len`. Other strings go through a memoized
+    function in which wide and fullwidth East Asian characters count as two
+    columns and combining marks and other zero-width characters as none.
+
+    Parameters:
+        text (str): The string.
+
+    Returns:
+        int: The display width.
+    """
+    if text.isascii():
+        return len(text)
+    return _unicode_width(text)
+
+
+@lru_cache(maxsize=WIDTH_CACHE_SIZE)
+def _unicode_width(text: str) -> int:
+    """
+    Measure the display width of a non-ASCII string, character by character.
+
+    Parameters:
+        text (str): The string.
+
+    Returns:
+        int: The display width.
+    """
+    width = 0
+    for char in text:
+        if unicodedata.category(char) in ZERO_WIDTH_CATEGORIES:
+            continue
+        if SKIN_TONES[0] <= char <= SKIN_TONES[1]:
+            continue
+        width += 2 if unicodedata.east_asian_width(char) in ("W", "F") else 1
+    return width
+
+
+def pad(text: str, width: int, align: str = "left") -> str:
+    """
+    Pad a string with spaces to a display width.
+
+    Parameters:
+        text (str): The string.
+        width (int): The display width to reach. Longer strings are unchanged.
+        align (str): 'left', 'center' or 'right'.
+
+    Returns:
+        str: The padded string.
+    """
+    space = max(width - display_width(text), 0)
+    if align == "right":
+        return " " * space + text
+    if align == "center":
+        return " " * (space // 2) + text + " " * (space - space // 2)
+    return text + " " * space
+
+
+def truncate(text: str, width: int) -> str:
+    """
+    Cut a string to at most a display width.
+
+    Parameters:
+        text (str): The string.
+        width (int): The maximum display width.
+
+    Returns:
+        str: The longest prefix of the string that fits.
+    """
+    if text.isascii():
+        return text[:width]
+    used = 0
+    for i, char in enumerate(text):
+        used += _unicode_width(char)
+        if used > width:
+            return text[:i]
+    return text
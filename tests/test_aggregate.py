@@ -0,0 +1,162 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from mdtable import cli
+from mdtable.aggregate import aggregate_rows, format_number, parse_aggregates
+
+ROWS = [
+    ["Region", "Name", "Balance"],
+    ["West", "Alice", "1_000.5"],
+    ["East", "Bob", "200"],
+    ["West", "Cy", "n/a"],
+    ["West", "Di", "3_000"],
+]
+
+
+def test_parse_aggregates() -> None:
+    """
+    Validate parsing of aggregate specifications.
+
+    Returns:
+        None
+    """
+    assert parse_aggregates("count, SUM:Balance,count:Name") == [
+        ("count", None),
+        ("sum", "Balance"),
+        ("count", "Name"),
+    ]
+
+
+@pytest.mark.parametrize("spec", ["median:Balance", "sum", "mean:"])
+def test_parse_aggregates_invalid(spec: str) -> None:
+    """
+    Validate that unknown functions and missing columns raise an error.
+
+    Parameters:
+        spec (str): An invalid aggregate specification.
+
+    Returns:
+        None
+    """
+    with pytest.raises(ValueError, match="Invalid aggregate"):
+        parse_aggregates(spec)
+
+
+def test_aggregate_rows_by_group() -> None:
+    """
+    Validate every aggregate per group, skipping non-numeric cells.
+
+    Returns:
+        None
+    """
+    aggs = "count,count:Balance,sum:Balance,min:Balance,max:Balance,mean:Balance"
+    assert list(aggregate_rows(ROWS, ["Region"], aggs)) == [
+        [
+            "Region",
+            "count",
+            "count(Balance)",
+            "sum(Balance)",
+            "min(Balance)",
+            "max(Balance)",
+            "mean(Balance)",
+        ],
+        ["West", "3", "3", "4000.5", "1_000.5", "3_000", "2000.25"],
+        ["East", "1", "1", "200", "200", "200", "200"],
+    ]
+
+
+@pytest.mark.parametrize(
+    "rows, expected",
+    [
+        (ROWS, [["count", "sum(Balance)"], ["4", "4200.5"]]),
+        (ROWS[:1], [["count", "sum(Balance)"], ["0", ""]]),
+    ],
+)
+def test_aggregate_rows_whole_table(
+    rows: list[list[str]], expected: list[list[str]]
+) -> None:
+    """
+    Validate that without grouping the whole table gives one summary row.
+
+    Parameters:
+        rows (List[List[str]]): The header followed by the body rows.
+        expected (List[List[str]]): The expected summary.
+
+    Returns:
+        None
+    """
+    assert list(aggregate_rows(rows, [], "count,sum:Balance")) == expected
+
+
+@pytest.mark.parametrize(
+    "cells, expected",
+    [
+        (["12345678901234567", "1"], ["12345678901234568", "6172839450617284"]),
+        (["9_007_199_254_740_993", "x"], ["9007199254740993", "9007199254740993"]),
+        (
+            ["12345678901234567", "0.5"],
+            ["1.23456789012346e+16", "6.17283945061728e+15"],
+        ),
+    ],
+)
+def test_aggregate_rows_exact_int_sum(cells: list[str], expected: list[str]) -> None:
+    """
+    Validate that integer columns are summed exactly until a non-integer appears.
+
+    Parameters:
+        cells (List[str]): The column's cells.
+        expected (List[str]): The expected sum and mean.
+
+    Returns:
+        None
+    """
+    rows = [["N"], *([cell] for cell in cells)]
+    summary = list(aggregate_rows(rows, [], "sum:N,mean:N"))
+    assert summary == [["sum(N)", "mean(N)"], expected]
+
+
+@pytest.mark.parametrize(
+    "value, expected", [(3.0, "3"), (0.1 + 0.2, "0.3"), (-2.5, "-2.5"), (1e20, "1e+20")]
+)
+def test_format_number(value: float, expected: str) -> None:
+    """
+    Validate that computed numbers are printed without floating-point noise.
+
+    Parameters:
+        value (float): The number.
+        expected (str): The expected text.
+
+    Returns:
+        None
+    """
+    assert format_number(value) == expected
+
+
+def test_cli_group_by(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
+    """
+    Validate that --group-by and --agg render a summary that can be filtered and
+    sorted.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.argv`.
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+        capsys (pytest.CaptureFixture): Fixture to capture stdout.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("\n".join(",".join(row) for row in ROWS) + "\n")
+    argv = ["mdtable", "--input", str(csv_file), "--group-by", "Region"]
+    argv += ["--agg", "sum:Balance", "--where", "Name!=Di", "--sort-by", "Region"]
+    for extra in ([], ["--stream"]):
+        monkeypatch.setattr(sys, "argv", argv + extra)
+        cli.main()
+        assert capsys.readouterr().out == (
+            "| Region | sum(Balance) |\n| :--- | :--- |\n"
+            "| East | 200 |\n| West | 1000.5 |\n"
+        )
@@ -0,0 +1,148 @@
+import asyncio
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from mdtable import aio
+from mdtable.core import generate_md_table, read_csv
+
+
+async def chunked(data: bytes, size: int) -> AsyncIterator[bytes]:
+    """
+    Yield bytes in fixed-size chunks, simulating a network body.
+
+    Parameters:
+        data (bytes): The bytes to yield.
+        size (int): Size of each chunk.
+
+    Returns:
+        AsyncIterator[bytes]: The chunks.
+    """
+    for start in range(0, len(data), size):
+        end = start + size
+        await asyncio.sleep(0)
+        yield data[start:end]
+
+
+class BufferWriter:
+    """
+    Minimal asyncio.StreamWriter stand-in that records writes and drains.
+    """
+
+    def __init__(self) -> None:
+        self.data = b""
+        self.drains = 0
+
+    def write(self, data: bytes) -> None:
+        self.data += data
+
+    async def drain(self) -> None:
+        self.drains += 1
+
+
+CSV_TEXT = 'Ciudad,Nota\r\nMéxico,"uno, dos"\n"Año\n2_024","dijo ""hola"""\nLima,x'
+
+
+@pytest.mark.parametrize("size", [1, 3, 1024])
+def test_aio_read_csv_chunk_boundaries(tmp_path: Path, size: int) -> None:
+    """
+    Validate that rows split across chunks parse exactly like csv.reader.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+        size (int): Size of the chunks fed to the parser.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_bytes(CSV_TEXT.encode("utf-8"))
+    expected = read_csv(str(csv_file))
+
+    data = CSV_TEXT.encode("utf-8")
+    assert asyncio.run(aio.read_csv(chunked(data, size))) == expected
+
+
+@pytest.mark.parametrize("size", [1, 4, 1024])
+def test_aio_read_csv_stray_quotes(size: int) -> None:
+    """
+    Validate that quotes inside unquoted fields are kept as literal characters.
+
+    Parameters:
+        size (int): Size of the chunks fed to the parser.
+
+    Returns:
+        None
+    """
+    data = b"Name,Height\nbob,5'10\"\nalice,6'1\"\n"
+    rows = asyncio.run(aio.read_csv(chunked(data, size)))
+    assert rows == [["Name", "Height"], ["bob", "5'10\""], ["alice", "6'1\""]]
+
+
+def test_aio_convert_matches_core(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Validate that the async pipeline writes the same table as the core functions.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to shrink the chunk size so
+        several chunks are offloaded.
+
+    Returns:
+        None
+    """
+    monkeypatch.setattr("mdtable.core.CHUNK_SIZE", 2)
+    data = [["Id", "Amount"]] + [[str(i), f"{i}_000"] for i in range(7)]
+    csv_bytes = "\n".join(",".join(row) for row in data).encode()
+    writer = BufferWriter()
+
+    async def run() -> None:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            source = chunked(csv_bytes, 5)
+            await aio.convert(source, writer, "left,right", "commas", executor)
+
+    asyncio.run(run())
+    assert writer.data.decode() == generate_md_table(data, "left,right")
+    assert writer.drains > 0
+
+
+def test_aio_concurrent_renders(tmp_path: Path) -> None:
+    """
+    Validate that many conversions can run concurrently on one event loop.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("Name,Score\nAlice,9_000\nBob,85\n")
+
+    async def render_one() -> str:
+        data = await aio.read_csv(aio.file_source(str(csv_file), chunk_size=4))
+        return await aio.generate_md_table(data)
+
+    async def run() -> list[str]:
+        return await asyncio.gather(*(render_one() for _ in range(50)))
+
+    results = asyncio.run(run())
+    assert set(results) == {generate_md_table(read_csv(str(csv_file)))}
+
+
+def test_aio_iter_md_table_validates_columns() -> None:
+    """
+    Validate that malformed rows raise a ValueError in the async renderer.
+
+    Returns:
+        None
+    """
+
+    async def run() -> None:
+        rows = aio.iter_csv(chunked(b"A,B\n1,2\n3\n", 2))
+        async for _ in aio.iter_md_table(rows):
+            pass
+
+    with pytest.raises(ValueError, match="same number of columns"):
+        asyncio.run(run())
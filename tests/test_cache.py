@@ -0,0 +1,140 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from mdtable import cli
+from mdtable.cache import RenderCache
+
+
+def test_cache_key_depends_on_content_and_options(tmp_path: Path) -> None:
+    """
+    Validate that the cache key changes with the input bytes and the options.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("Name,Score\nAlice,90\n")
+    key = RenderCache.key(str(csv_file), align=None)
+
+    assert RenderCache.key(str(csv_file), align=None) == key
+    assert RenderCache.key(str(csv_file), align=["right", "left"]) != key
+    csv_file.write_text("Name,Score\nAlice,91\n")
+    assert RenderCache.key(str(csv_file), align=None) != key
+
+
+def test_cache_get_put(tmp_path: Path) -> None:
+    """
+    Validate that stored entries are returned and unknown keys miss.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    cache = RenderCache(str(tmp_path / "cache"))
+    assert cache.get("missing") is None
+    cache.put("abc", "| A |")
+    assert cache.get("abc") == "| A |"
+
+
+def test_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    """
+    Validate that eviction removes the least recently used entries first.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    cache = RenderCache(str(tmp_path), max_bytes=20)
+    cache.put("old", "x" * 10)
+    cache.put("new", "y" * 10)
+    os.utime(tmp_path / "old.md", ns=(1, 1))
+    os.utime(tmp_path / "new.md", ns=(2, 2))
+    cache.get("old")  # refreshes "old", leaving "new" as least recently used
+
+    cache.put("newest", "z" * 10)
+    assert cache.get("new") is None
+    assert cache.get("old") == "x" * 10
+    assert cache.get("newest") == "z" * 10
+
+
+def test_cache_skips_entries_larger_than_cache(tmp_path: Path) -> None:
+    """
+    Validate that a table larger than the cache is not stored and evicts nothing.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    cache = RenderCache(str(tmp_path), max_bytes=20)
+    cache.put("small", "x" * 10)
+    cache.put("huge", "y" * 21)
+    assert cache.get("huge") is None
+    assert cache.get("small") == "x" * 10
+
+
+def test_cache_never_evicts_new_entry(tmp_path: Path) -> None:
+    """
+    Validate that the entry just written survives eviction, even if it is the
+    oldest by modification time.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    cache = RenderCache(str(tmp_path), max_bytes=20)
+    cache.put("old", "x" * 10)
+    os.utime(tmp_path / "old.md", ns=(2**62, 2**62))  # looks recently used
+    cache.put("new", "y" * 15)
+    assert cache.get("new") == "y" * 15
+    assert cache.get("old") is None
+
+
+@pytest.mark.parametrize("extra, cached", [([], True), (["--no-cache"], False)])
+def test_cli_cache(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, extra: list[str], cached: bool
+) -> None:
+    """
+    Validate that the CLI serves unchanged input from the cache unless disabled.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.argv`.
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+        extra (List[str]): Additional command-line arguments.
+        cached (bool): Whether the second run should be served from the cache.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("Name,Score\nAlice,90\n")
+    output_file = tmp_path / "output.md"
+    cache_dir = tmp_path / "cache"
+    argv = ["mdtable", "--input", str(csv_file), "--output", str(output_file)]
+    monkeypatch.setattr(sys, "argv", argv + ["--cache-dir", str(cache_dir)] + extra)
+
+    cli.main()
+    expected = output_file.read_text()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("table was re-rendered")
+
+    if cached:
+        monkeypatch.setattr("mdtable.core.generate_md_table", fail)
+    cli.main()
+
+    assert output_file.read_text() == expected
+    assert any(cache_dir.glob("*.md")) == cached
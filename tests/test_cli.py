@@ -121,3 +121,298 @@ def test_cli_output_file(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Non
     assert output_file.exists()
     content = output_file.read_text()
     assert "350,491.824569 XRP" in content
+
+
+def test_cli_stream(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Verifies that --stream writes the same Markdown as the default path.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.argv`.
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("Percentage,# Accounts,Balance\n0.1 %,6910,350_491.824569 XRP")
+    streamed = tmp_path / "streamed.md"
+    regular = tmp_path / "regular.md"
+
+    for output_file, extra in ((streamed, ["--stream"]), (regular, [])):
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["mdtable", "--input", str(csv_file), "--output", str(output_file)] + extra,
+        )
+        cli.main()
+
+    assert streamed.read_text() == regular.read_text()
+    assert "350,491.824569 XRP" in streamed.read_text()
+
+
+def test_cli_batch(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
+    """
+    Verifies that the batch command converts every matched file and reports timings.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.argv`.
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+        capsys (pytest.CaptureFixture): Pytest fixture used to capture stderr.
+
+    Returns:
+        None
+    """
+    src_dir = tmp_path / "csv"
+    src_dir.mkdir()
+    (src_dir / "a.csv").write_text("Name,Score\nAlice,9_000\n")
+    (src_dir / "b.csv").write_text("Name,Score\nBob,85\n")
+    out_dir = tmp_path / "md"
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["mdtable", "batch", str(src_dir / "*.csv"), "--out-dir", str(out_dir)],
+    )
+    cli.main()
+
+    assert "| Alice | 9,000 |" in (out_dir / "a.md").read_text()
+    assert "| Bob | 85 |" in (out_dir / "b.md").read_text()
+    assert "Converted 2 of 2 files" in capsys.readouterr().err
+
+
+def test_cli_batch_reports_failures(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
+    """
+    Verifies that a malformed file is reported without stopping the batch.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.argv`.
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+        capsys (pytest.CaptureFixture): Pytest fixture used to capture stderr.
+
+    Returns:
+        None
+    """
+    (tmp_path / "bad.csv").write_text("Name,Score\nAlice\n")
+    (tmp_path / "good.csv").write_text("Name,Score\nBob,85\n")
+    out_dir = tmp_path / "md"
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["mdtable", "batch", str(tmp_path / "*.csv"), "--out-dir", str(out_dir)],
+    )
+    with pytest.raises(SystemExit):
+        cli.main()
+
+    assert (out_dir / "good.md").exists()
+    assert "bad.csv: error:" in capsys.readouterr().err
+
+
+def test_cli_batch_reports_csv_errors(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
+    """
+    Verifies that a file the csv module cannot parse does not abort a parallel batch.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.argv`.
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+        capsys (pytest.CaptureFixture): Pytest fixture used to capture stderr.
+
+    Returns:
+        None
+    """
+    # A field over csv.field_size_limit() raises csv.Error.
+    (tmp_path / "huge.csv").write_text("Name\n" + "x" * 200_000 + "\n")
+    (tmp_path / "good.csv").write_text("Name,Score\nBob,85\n")
+    out_dir = tmp_path / "md"
+
+    argv = ["mdtable", "batch", str(tmp_path / "*.csv"), "--out-dir", str(out_dir)]
+    monkeypatch.setattr(sys, "argv", argv + ["--jobs", "2"])
+    with pytest.raises(SystemExit):
+        cli.main()
+
+    assert (out_dir / "good.md").exists()
+    assert "huge.csv: error: field larger than field limit" in capsys.readouterr().err
+
+
+def test_cli_batch_reports_shared_outputs(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
+    """
+    Verifies that files which would overwrite each other's output are reported.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.argv`.
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+        capsys (pytest.CaptureFixture): Pytest fixture used to capture stderr.
+
+    Returns:
+        None
+    """
+    for name in ("a/x.csv", "b/x.csv", "c/y.csv", "c/y.csv.gz", "c/z.csv"):
+        path = tmp_path / name
+        path.parent.mkdir(exist_ok=True)
+        path.write_text("Name,Score\nBob,85\n")
+    out_dir = tmp_path / "md"
+
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["mdtable", "batch", str(tmp_path / "*/*"), "--out-dir", str(out_dir)],
+    )
+    with pytest.raises(SystemExit):
+        cli.main()
+
+    err = capsys.readouterr().err
+    assert err.count("is also the output of another input file") == 4
+    assert sorted(p.name for p in out_dir.iterdir()) == ["z.md"]
+
+
+def test_cli_incremental(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Verifies that --incremental appends rows added to the input since the last run.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.argv`.
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "log.csv"
+    csv_file.write_text("Hour,Requests\n00,1_200\n")
+    output_file = tmp_path / "log.md"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "mdtable",
+            "--input",
+            str(csv_file),
+            "--output",
+            str(output_file),
+            "--incremental",
+        ],
+    )
+
+    cli.main()
+    with open(csv_file, "a") as f:
+        f.write("01,1_350\n")
+    cli.main()
+
+    assert output_file.read_text().endswith("| 00 | 1,200 |\n| 01 | 1,350 |")
+
+
+def test_cli_incremental_requires_output(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Verifies that --incremental without --output is rejected.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.argv`.
+
+    Returns:
+        None
+    """
+    monkeypatch.setattr(sys, "argv", ["mdtable", "--input", "x.csv", "--incremental"])
+    with pytest.raises(SystemExit):
+        cli.main()
+
+
+def test_cli_page_rows(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Verifies that --page-rows splits the output the same way with and without
+    --stream.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.argv`.
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("Name,Score\nAlice,90\nBob,85\nCy,70\n")
+    for name, extra in (("regular", []), ("streamed", ["--stream"])):
+        output = tmp_path / f"{name}.md"
+        argv = ["mdtable", "--input", str(csv_file), "--output", str(output)]
+        monkeypatch.setattr(sys, "argv", argv + ["--page-rows", "2"] + extra)
+        cli.main()
+        assert (tmp_path / f"{name}-2.md").read_text() == (
+            "| Name | Score |\n| :--- | :--- |\n| Cy | 70 |"
+        )
+        assert not (tmp_path / f"{name}-3.md").exists()
+
+
+@pytest.mark.parametrize("paging", [["--page-rows", "1"], ["--page-bytes", "55"]])
+def test_cli_paging_with_jobs(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, paging: list[str]
+) -> None:
+    """
+    Verifies that rows rendered in chunks by --jobs workers are paged one by one.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.argv`.
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+        paging (List[str]): The paging option giving one body row per page.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("Name,Score\nAlice,90\nBob,85\nCy,70\n")
+    for name, extra in (("regular", []), ("streamed", ["--stream"])):
+        output = tmp_path / f"{name}.md"
+        argv = ["mdtable", "--input", str(csv_file), "--output", str(output)]
+        monkeypatch.setattr(sys, "argv", argv + ["--jobs", "2"] + paging + extra)
+        cli.main()
+        assert (tmp_path / f"{name}-3.md").read_text() == (
+            "| Name | Score |\n| :--- | :--- |\n| Cy | 70 |"
+        )
+        assert not (tmp_path / f"{name}-4.md").exists()
+
+
+def test_cli_pager_requires_preview(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Verifies that --pager without --preview is rejected.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.argv`.
+
+    Returns:
+        None
+    """
+    monkeypatch.setattr(sys, "argv", ["mdtable", "--input", "x.csv", "--pager"])
+    with pytest.raises(SystemExit):
+        cli.main()
+
+
+def test_cli_jobs_reads_byte_ranges(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """
+    Verifies that --jobs gives the same output, with and without --stream, when the
+    workers render byte ranges of the input file.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.argv`.
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("Name,Score\n" + "".join(f"n{i},{i}_000\n" for i in range(30)))
+    outputs = []
+    for extra in ([], ["--jobs", "2"], ["--jobs", "2", "--stream"]):
+        output = tmp_path / f"output{len(outputs)}.md"
+        argv = ["mdtable", "--input", str(csv_file), "--output", str(output)]
+        monkeypatch.setattr(sys, "argv", argv + ["--no-cache"] + extra)
+        cli.main()
+        outputs.append(output.read_text())
+    assert outputs[0] == outputs[1] == outputs[2]
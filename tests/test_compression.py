@@ -0,0 +1,191 @@
+import bz2
+import gzip
+import io
+import lzma
+import sys
+from pathlib import Path
+
+import pytest
+
+from mdtable import cli, compression
+from mdtable.batch import output_path
+from mdtable.compression import detect_compression, split_compression
+from mdtable.core import page_path, read_csv, write_output
+from mdtable.readers import detect_format
+
+CSV_TEXT = "Name,Balance\nAlice,1_000\nBob,250\n"
+ROWS = [["Name", "Balance"], ["Alice", "1_000"], ["Bob", "250"]]
+CODECS = {"gz": gzip, "bz2": bz2, "xz": lzma}
+
+
+@pytest.mark.parametrize("ext", sorted(CODECS))
+@pytest.mark.parametrize("backend", ["csv", "mmap"])
+def test_read_compressed_csv(tmp_path: Path, ext: str, backend: str) -> None:
+    """
+    Validate that compressed CSV files are read by either backend.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+        ext (str): The compression extension.
+        backend (str): The CSV parser.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / f"input.csv.{ext}"
+    csv_file.write_bytes(CODECS[ext].compress(CSV_TEXT.encode()))
+    assert read_csv(str(csv_file), backend) == ROWS
+
+
+def test_detect_compression_by_magic(tmp_path: Path) -> None:
+    """
+    Validate that compressed files are recognized without an extension.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "export.csv"
+    csv_file.write_bytes(gzip.compress(CSV_TEXT.encode()))
+    assert detect_compression(str(csv_file)) == "gzip"
+    assert read_csv(str(csv_file)) == ROWS
+
+    csv_file.write_text(CSV_TEXT)
+    assert detect_compression(str(csv_file)) is None
+
+
+@pytest.mark.parametrize(
+    "head, expected",
+    [
+        (bz2.compress(CSV_TEXT.encode()), "bz2"),
+        (b"BZh,Name\n1,2\n", None),
+        (b"BZhang,Score\n1,2\n", None),
+    ],
+)
+def test_detect_bz2_block_size(
+    tmp_path: Path, head: bytes, expected: str | None
+) -> None:
+    """
+    Validate that the bz2 magic needs the block-size digit that follows 'BZh'.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+        head (bytes): The file's contents.
+        expected (Optional[str]): The expected codec.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "export.csv"
+    csv_file.write_bytes(head)
+    assert detect_compression(str(csv_file)) == expected
+
+
+def test_write_output_zstd_threads(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """
+    Validate that the zstd thread count is passed down to the compressor.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to replace the zstd opener.
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    calls = []
+
+    def fake_open_zstd(path: str, mode: str, threads: int = 0) -> io.BytesIO:
+        calls.append(threads)
+        return io.BytesIO()
+
+    monkeypatch.setattr(compression, "_open_zstd", fake_open_zstd)
+    write_output(str(tmp_path / "table.md.zst"), "| A |", zstd_threads=3)
+    assert calls == [3]
+
+
+def test_write_compressed_output(tmp_path: Path) -> None:
+    """
+    Validate that outputs ending in a compression extension are compressed.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    output = tmp_path / "table.md.xz"
+    write_output(str(output), "| A |\n| :--- |\n| 1 |")
+    assert lzma.decompress(output.read_bytes()) == b"| A |\n| :--- |\n| 1 |"
+
+
+@pytest.mark.parametrize(
+    "func, path, expected",
+    [
+        (split_compression, "a/data.csv.GZ", ("a/data.csv", "gzip")),
+        (split_compression, "data.csv", ("data.csv", None)),
+        (detect_format, "data.tsv.zst", "tsv"),
+        (lambda p: page_path(p, 2), "table.md.gz", "table-2.md.gz"),
+        (lambda p: output_path(p, "out"), "data.csv.bz2", str(Path("out/data.md"))),
+    ],
+)
+def test_compression_extensions(func: object, path: str, expected: object) -> None:
+    """
+    Validate that compression extensions do not get in the way of other ones.
+
+    Parameters:
+        func (Callable[[str], object]): The function under test.
+        path (str): The path passed to it.
+        expected (object): The expected result.
+
+    Returns:
+        None
+    """
+    assert func(path) == expected
+
+
+def test_zstd_round_trip(tmp_path: Path) -> None:
+    """
+    Validate zstd input and multi-threaded zstd output.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    zstandard = pytest.importorskip("zstandard")
+    csv_file = tmp_path / "input.csv.zst"
+    csv_file.write_bytes(zstandard.ZstdCompressor().compress(CSV_TEXT.encode()))
+    assert read_csv(str(csv_file)) == ROWS
+
+    output = tmp_path / "table.md.zst"
+    write_output(str(output), "| A |", zstd_threads=2)
+    decompressor = zstandard.ZstdDecompressor().decompressobj()
+    assert decompressor.decompress(output.read_bytes()) == b"| A |"
+
+
+def test_cli_compressed(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Validate that the CLI converts a compressed input to a compressed output.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.argv`.
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "input.csv.gz"
+    csv_file.write_bytes(gzip.compress(CSV_TEXT.encode()))
+    output = tmp_path / "output.md.bz2"
+    for extra in ([], ["--stream"]):
+        argv = ["mdtable", "--input", str(csv_file), "--output", str(output)]
+        monkeypatch.setattr(sys, "argv", argv + extra)
+        cli.main()
+        assert bz2.decompress(output.read_bytes()).decode() == (
+            "| Name | Balance |\n| :--- | :--- |\n| Alice | 1,000 |\n| Bob | 250 |"
+        )
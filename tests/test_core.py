@@ -1,14 +1,22 @@
 import sys
 from io import StringIO
+from pathlib import Path
 
 import pytest
 
+from mdtable import core
 from mdtable.core import (
+    _record_end,
     format_commas,
     generate_md_table,
+    iter_csv,
+    iter_md_table,
     normalize_alignments,
+    paginate,
     read_csv,
+    write_lines,
     write_output,
+    write_pages,
 )
 from mdtable.preview import preview_table
 
@@ -231,3 +239,293 @@ def test_write_output_stdout(capsys: pytest.CaptureFixture) -> None:
     write_output("", content)
     captured = capsys.readouterr()
     assert captured.out.strip() == content
+
+
+def test_iter_md_table_matches_generate(sample_table: list[list[str]]) -> None:
+    """
+    Verifies that iter_md_table yields the same lines as generate_md_table.
+
+    Parameters:
+        sample_table (List[List[str]]): A list of rows, where each row is a list of
+        string cells.
+
+    Returns:
+        None
+    """
+    lines = iter_md_table(iter(sample_table), "left,center,right")
+    assert "\n".join(lines) == generate_md_table(sample_table, "left,center,right")
+
+
+def test_iter_md_table_validates_incrementally() -> None:
+    """
+    Verifies that iter_md_table yields valid rows before failing on a malformed one.
+
+    Returns:
+        None
+    """
+    lines = iter_md_table([["A", "B"], ["1", "2"], ["3"]])
+    assert next(lines) == "| A | B |"
+    assert next(lines) == "| :--- | :--- |"
+    assert next(lines) == "| 1 | 2 |"
+    with pytest.raises(ValueError, match="same number of columns"):
+        next(lines)
+
+
+def test_iter_md_table_empty() -> None:
+    """
+    Verifies that iter_md_table raises a ValueError when given no rows.
+
+    Returns:
+        None
+    """
+    with pytest.raises(ValueError, match="empty"):
+        list(iter_md_table(iter([])))
+
+
+def test_iter_csv(tmp_path: Path) -> None:
+    """
+    Verifies that iter_csv lazily yields the same rows as read_csv.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("Name,Score\nAlice,90\nBob,85\n")
+    rows = iter_csv(str(csv_file))
+    assert next(rows) == ["Name", "Score"]
+    assert list(rows) == [["Alice", "90"], ["Bob", "85"]]
+
+
+def test_write_lines_matches_write_output(tmp_path: Path) -> None:
+    """
+    Verifies that write_lines produces the same file as write_output.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    lines = ["| A |", "| :--- |", "| 1 |"]
+    streamed = tmp_path / "streamed.md"
+    written = tmp_path / "written.md"
+    write_lines(str(streamed), iter(lines))
+    write_output(str(written), "\n".join(lines))
+    assert streamed.read_text() == written.read_text()
+
+
+def test_write_lines_stdout(capsys: pytest.CaptureFixture) -> None:
+    """
+    Verifies that write_lines sends lines to stdout like write_output does.
+
+    Parameters:
+        capsys (pytest.CaptureFixture): Pytest fixture used to intercept and inspect
+        stdout output.
+
+    Returns:
+        None
+    """
+    write_lines("", iter(["| A |", "| 1 |"]))
+    assert capsys.readouterr().out == "| A |\n| 1 |\n"
+
+
+PAGE_LINES = ["| A |", "| :--- |", "| 1 |", "| 22 |", "| 333 |"]
+
+
+@pytest.mark.parametrize(
+    "page_rows, page_bytes, expected",
+    [
+        (2, None, [["| 1 |", "| 22 |"], ["| 333 |"]]),
+        (None, 30, [["| 1 |", "| 22 |"], ["| 333 |"]]),
+        (None, 1, [["| 1 |"], ["| 22 |"], ["| 333 |"]]),
+        (10, None, [["| 1 |", "| 22 |", "| 333 |"]]),
+    ],
+)
+def test_paginate(
+    page_rows: int | None, page_bytes: int | None, expected: list[list[str]]
+) -> None:
+    """
+    Verifies that pages repeat the header and respect row and byte limits.
+
+    Parameters:
+        page_rows (Optional[int]): Maximum number of body rows per page.
+        page_bytes (Optional[int]): Maximum size of a page in bytes.
+        expected (List[List[str]]): The expected body rows of each page.
+
+    Returns:
+        None
+    """
+    pages = list(paginate(iter(PAGE_LINES), page_rows, page_bytes))
+    assert pages == [PAGE_LINES[:2] + rows for rows in expected]
+
+
+def test_write_pages_files(tmp_path: Path) -> None:
+    """
+    Verifies that each page is written to its own numbered file.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    output = tmp_path / "table.md"
+    paths = write_pages(str(output), iter(PAGE_LINES), page_rows=2)
+    assert paths == [str(tmp_path / "table-1.md"), str(tmp_path / "table-2.md")]
+    assert (tmp_path / "table-2.md").read_text() == "| A |\n| :--- |\n| 333 |"
+    assert not output.exists()
+
+
+def test_write_output_page_sections(tmp_path: Path) -> None:
+    """
+    Verifies that write_output can split a table into sections of one file.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    output = tmp_path / "table.md"
+    write_output(str(output), "\n".join(PAGE_LINES), 2, None, sections=True)
+    assert output.read_text() == (
+        "| A |\n| :--- |\n| 1 |\n| 22 |\n\n| A |\n| :--- |\n| 333 |"
+    )
+
+
+@pytest.mark.parametrize(
+    "csv_text",
+    [
+        "Name,Score\nAlice,90\nBob,85\n",
+        "Name,Score\r\nAlice,90\r\n\r\nBob,85",
+        'Name,Note\n"Smith, J","line one\nline two"\n"say ""hi""",\n',
+        "Ciudad,Año\nMéxico,2_024\n",
+        "",
+        "Name,Height\nbob,5'10\"\nalice,6'1\"\n",
+        'Name,Height\nbob,5"',
+        "\nA,B\r\n1,2\r3,4\n",
+    ],
+)
+def test_read_csv_mmap_backend(tmp_path: Path, csv_text: str) -> None:
+    """
+    Verifies that the mmap backend parses files exactly like csv.reader.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+        csv_text (str): Raw CSV content, including quoted and multi-line fields.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_bytes(csv_text.encode("utf-8"))
+    assert read_csv(str(csv_file), backend="mmap") == read_csv(str(csv_file))
+
+
+@pytest.mark.parametrize("quoted", [False, True])
+def test_read_csv_mmap_blocks(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, quoted: bool
+) -> None:
+    """
+    Verifies that records split across mmap blocks, or quoted later on, parse whole.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to shrink the block size.
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+        quoted (bool): Whether a quoted record appears after the first blocks.
+
+    Returns:
+        None
+    """
+    monkeypatch.setattr(core, "MMAP_BLOCK_BYTES", 16)
+    lines = [f"row {i},{'x' * (i % 40)}" for i in range(200)]
+    if quoted:
+        lines[150] = '"multi\nline",5\'10"'
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    assert read_csv(str(csv_file), backend="mmap") == read_csv(str(csv_file))
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (b"bob,5'10\"\nalice,6'1\"\n", 9),
+        (b'bob,5"', 6),
+        (b'"a\nb",c\nd', 7),
+        (b'"say ""hi\n""",x"y\nz', 17),
+        (b'"open\n', 6),
+    ],
+)
+def test_record_end_quotes_at_field_starts(data: bytes, expected: int) -> None:
+    """
+    Verifies that only quotes at the start of a field open a quoted section.
+
+    Parameters:
+        data (bytes): The buffer, starting with a record.
+        expected (int): Offset of the newline ending the first record.
+
+    Returns:
+        None
+    """
+    assert _record_end(data, 0) == expected
+
+
+def test_read_csv_mmap_stdin_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Verifies that the mmap backend falls back to csv.reader for stdin.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.stdin` with
+        mock input.
+
+    Returns:
+        None
+    """
+    monkeypatch.setattr(sys, "stdin", StringIO("Name,Score\nAlice,90"))
+    assert read_csv("-", backend="mmap") == [["Name", "Score"], ["Alice", "90"]]
+
+
+def test_read_csv_invalid_backend() -> None:
+    """
+    Verifies that read_csv rejects unknown backends.
+
+    Returns:
+        None
+    """
+    with pytest.raises(ValueError, match="Invalid backend"):
+        read_csv("-", backend="pandas")
+
+
+def test_generate_md_table_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Verifies that rendering across a process pool preserves row order and output.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to shrink the chunk size so
+        several chunks are rendered.
+
+    Returns:
+        None
+    """
+    monkeypatch.setattr("mdtable.core.CHUNK_SIZE", 3)
+    data = [["Id", "Amount"]] + [[str(i), f"{i}_000"] for i in range(20)]
+    assert generate_md_table(data, workers=2) == generate_md_table(data)
+
+
+def test_generate_md_table_padded() -> None:
+    """
+    Validate that padded output lines up by display width and keeps alignments.
+
+    Returns:
+        None
+    """
+    data = [["City", "Amount"], ["東京", "1_200"], ["Zürich", "7"]]
+    assert generate_md_table(data, "center,right", padded=True) == (
+        "|  City  | Amount |\n"
+        "| :----: | -----: |\n"
+        "|  東京  |  1,200 |\n"
+        "| Zürich |      7 |"
+    )
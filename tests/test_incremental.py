@@ -0,0 +1,123 @@
+from pathlib import Path
+
+import pytest
+
+from mdtable.core import generate_md_table, read_csv
+from mdtable.incremental import render_incremental, state_path
+
+
+def test_render_incremental_appends_new_rows(tmp_path: Path) -> None:
+    """
+    Validate that rows appended to the input are appended to the output.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "log.csv"
+    output_file = tmp_path / "log.md"
+    csv_file.write_text("Hour,Requests\n00,1_200\n")
+
+    assert render_incremental(str(csv_file), str(output_file), "left,right") is False
+    assert state_path(str(output_file)).exists()
+
+    with open(csv_file, "a") as f:
+        f.write("01,1_350\n02,980\n")
+    assert render_incremental(str(csv_file), str(output_file), "left,right") is True
+
+    expected = generate_md_table(read_csv(str(csv_file)), "left,right")
+    assert output_file.read_text() == expected
+
+
+def test_render_incremental_rerenders_rewritten_input(tmp_path: Path) -> None:
+    """
+    Validate that a rewritten input or new alignment triggers a full render.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "log.csv"
+    output_file = tmp_path / "log.md"
+    csv_file.write_text("Hour,Requests\n00,1_200\n01,1_350\n")
+    render_incremental(str(csv_file), str(output_file))
+
+    csv_file.write_text("Hour,Requests\n00,999\n01,1_350\n02,980\n")
+    assert render_incremental(str(csv_file), str(output_file)) is False
+    assert render_incremental(str(csv_file), str(output_file), "right,right") is False
+
+    expected = generate_md_table(read_csv(str(csv_file)), "right,right")
+    assert output_file.read_text() == expected
+
+
+def test_render_incremental_without_trailing_newline(tmp_path: Path) -> None:
+    """
+    Validate appends to an input whose last row had no trailing newline.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "log.csv"
+    output_file = tmp_path / "log.md"
+    csv_file.write_text("Hour,Requests\n00,1_200")
+    render_incremental(str(csv_file), str(output_file))
+
+    with open(csv_file, "a") as f:
+        f.write("\n01,1_350")
+    assert render_incremental(str(csv_file), str(output_file)) is True
+    assert output_file.read_text() == generate_md_table(read_csv(str(csv_file)))
+
+
+def test_render_incremental_finishes_partial_row(tmp_path: Path) -> None:
+    """
+    Validate that a last row still being written is rendered again once finished.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "log.csv"
+    output_file = tmp_path / "log.md"
+    csv_file.write_text("a\n1\n2")
+    render_incremental(str(csv_file), str(output_file))
+
+    with open(csv_file, "a") as f:
+        f.write("5\n")
+    assert render_incremental(str(csv_file), str(output_file)) is True
+    assert output_file.read_text() == "| a |\n| :--- |\n| 1 |\n| 25 |"
+
+
+def test_render_incremental_malformed_row_appends_nothing(tmp_path: Path) -> None:
+    """
+    Validate that a malformed new row leaves the output and its state untouched.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "log.csv"
+    output_file = tmp_path / "log.md"
+    csv_file.write_text("a,b\n1,2\n")
+    render_incremental(str(csv_file), str(output_file))
+    rendered = output_file.read_text()
+
+    with open(csv_file, "a") as f:
+        f.write("3,4\n5\n")
+    with pytest.raises(ValueError, match="same number of columns"):
+        render_incremental(str(csv_file), str(output_file))
+    assert output_file.read_text() == rendered
+
+    csv_file.write_text("a,b\n1,2\n3,4\n5,6\n")
+    render_incremental(str(csv_file), str(output_file))
+    assert output_file.read_text() == generate_md_table(read_csv(str(csv_file)))
@@ -0,0 +1,157 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from mdtable.core import read_csv
+from mdtable.pager import Pager, RowIndex, render_viewport
+
+FILLER_ROWS = "".join(f"x{i},{i},c{i}\r\n" for i in range(40))
+CSV_TEXT = 'Name,Age,City\r\nAlice,30,"New\nYork"\r\n\r\nBob,25,"Say ""hi"""\r\n'
+CSV_TEXT += FILLER_ROWS
+
+
+@pytest.fixture
+def row_index(tmp_path: Path) -> Iterator[RowIndex]:
+    """
+    Provide a RowIndex over a CSV file with quoted newlines and a blank line.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        Iterator[RowIndex]: The index, closed after the test.
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_bytes(CSV_TEXT.encode())
+    index = RowIndex(str(csv_file))
+    assert read_csv(str(csv_file)) == [index.header, *index[:]]
+    yield index
+    index.close()
+
+
+def test_row_index_slices(row_index: RowIndex) -> None:
+    """
+    Validate that the index finds every record and parses only the sliced rows.
+
+    Parameters:
+        row_index (RowIndex): The index.
+
+    Returns:
+        None
+    """
+    assert row_index.header == ["Name", "Age", "City"]
+    assert len(row_index) == 43
+    assert row_index[0:3] == [
+        ["Alice", "30", "New\nYork"],
+        [],
+        ["Bob", "25", 'Say "hi"'],
+    ]
+    assert row_index[42:100] == [["x39", "39", "c39"]]
+    assert row_index[50:60] == []
+
+
+def test_row_index_empty_file(tmp_path: Path) -> None:
+    """
+    Validate that an empty file has no header and no rows.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "empty.csv"
+    csv_file.write_text("")
+    index = RowIndex(str(csv_file))
+    assert index.header == []
+    assert len(index) == 0
+    assert index[0:10] == []
+    index.close()
+
+
+def test_render_viewport() -> None:
+    """
+    Validate that only the columns that fit are formatted, with row numbers pinned.
+
+    Returns:
+        None
+    """
+    header = ["Name", "Comment", "Score"]
+    rows = [["Alice", "multi\nline", "1_000"], ["Bob", "ok", "7"]]
+    assert render_viewport(header, rows, first_row=9, width=30) == [
+        "+----+-------+------------+",
+        "| #  | Name  | Comment    |",
+        "+----+-------+------------+",
+        "| 10 | Alice | multi line |",
+        "| 11 | Bob   | ok         |",
+        "+----+-------+------------+",
+    ]
+    assert render_viewport(header, rows, first_col=2, width=30)[3] == "| 1 | 1,000 |"
+
+
+def test_render_viewport_cuts_wide_cells() -> None:
+    """
+    Validate that a column wider than the viewport is still shown, cut to fit.
+
+    Returns:
+        None
+    """
+    lines = render_viewport(["Text"], [["a" * 50]], width=20)
+    assert lines[3] == "| 1 | " + "a" * 14
+    assert all(len(line) <= 20 for line in lines)
+
+
+def test_pager_scrolls_within_table(row_index: RowIndex) -> None:
+    """
+    Validate that scrolling and jumping stay within the rows and columns.
+
+    Parameters:
+        row_index (RowIndex): The index.
+
+    Returns:
+        None
+    """
+    pager = Pager(row_index.header, row_index, height=15, width=60)
+    assert pager.page_rows == 10
+    pager.scroll(rows=-5, cols=-1)
+    assert (pager.top, pager.left) == (0, 0)
+    pager.jump(1000)
+    assert pager.top == 33
+    pager.scroll(cols=10)
+    assert pager.left == 2
+
+    screen = pager.screen()
+    assert len(screen) == 15
+    assert screen[3].startswith("| 34 | c30 ")
+    assert screen[-1].startswith("rows 34-43 of 43  column 3 of 3")
+
+    pager.jump(5)
+    assert pager.top == 4
+
+
+def test_row_index_closes_file_on_error(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Validate that the input file is closed when the header cannot be read.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+        monkeypatch (pytest.MonkeyPatch): Fixture used to record the opened file.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_bytes(b"\xff\xfe,bad\n1,2\n")
+    opened = []
+
+    def recording_open(*args, **kwargs):
+        opened.append(open(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr("mdtable.pager.open", recording_open, raising=False)
+    with pytest.raises(UnicodeDecodeError):
+        RowIndex(str(csv_file))
+    assert opened and opened[0].closed
@@ -0,0 +1,177 @@
+import csv
+import io
+from pathlib import Path
+
+import pytest
+
+from mdtable.core import generate_md_table, read_csv
+from mdtable.parallel import (
+    _decode,
+    _parse_range,
+    iter_csv_parallel,
+    iter_md_csv_parallel,
+    split_ranges,
+)
+
+TRICKY_CSV = (
+    "Name,Note,Amount\r\n"
+    '"Smith, J","line one\nline two\n\nline four",1_000\r\n'
+    'plain,"say ""hi""\n""quoted"" newline",2\r\n'
+    '"","\n",3\r\n'
+    'Año,"mañana, ""tarde""",4\r\n'
+    "\r\n"
+    'last,"ends in newline\n",5'
+)
+
+
+def expected_rows(text: str) -> list[list[str]]:
+    """
+    Parse CSV text in one go with the csv module, the reference result.
+
+    Parameters:
+        text (str): The CSV text.
+
+    Returns:
+        List[List[str]]: The parsed rows.
+    """
+    return list(csv.reader(io.StringIO(text, newline="")))
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 2, 3, 5, 7, 16, 64, 1024])
+def test_split_ranges_never_split_records(tmp_path: Path, chunk_bytes: int) -> None:
+    """
+    Validate that ranges end on record boundaries wherever the cuts fall, even
+    inside quoted fields with newlines and escaped quotes.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+        chunk_bytes (int): Target size of each range in bytes.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "tricky.csv"
+    csv_file.write_bytes(TRICKY_CSV.encode())
+    ranges = split_ranges(str(csv_file), chunk_bytes)
+
+    assert ranges[0][0] == 0 and ranges[-1][1] == csv_file.stat().st_size
+    assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+    rows = [row for r in ranges for row in _decode(_parse_range(str(csv_file), *r))]
+    assert rows == expected_rows(TRICKY_CSV)
+
+
+@pytest.mark.parametrize(
+    "text, joined",
+    [
+        ("a,b\n1,2\n", True),
+        ('a,"b\nc"\n\n1,2\n', False),
+        ("a,b\x1fc\n", False),
+    ],
+)
+def test_parse_range_round_trip(tmp_path: Path, text: str, joined: bool) -> None:
+    """
+    Validate that ranges are sent back joined unless the separators or blank lines
+    would make that ambiguous.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+        text (str): The CSV text.
+        joined (bool): Whether the rows are expected to be joined into a string.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_bytes(text.encode())
+    batch = _parse_range(str(csv_file), 0, len(text.encode()))
+    assert isinstance(batch, str) == joined
+    assert _decode(batch) == expected_rows(text)
+
+
+def test_split_ranges_empty_file(tmp_path: Path) -> None:
+    """
+    Validate that an empty file has no ranges.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "empty.csv"
+    csv_file.write_text("")
+    assert split_ranges(str(csv_file)) == []
+
+
+def test_iter_csv_parallel_matches_csv_reader(tmp_path: Path) -> None:
+    """
+    Validate that parsing across worker processes yields the rows in order.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    text = TRICKY_CSV + "\n" + "".join(f'{i},"row\n{i}",{i}_000\n' for i in range(500))
+    csv_file = tmp_path / "large.csv"
+    csv_file.write_bytes(text.encode())
+    rows = list(iter_csv_parallel(str(csv_file), workers=2, chunk_bytes=256))
+    assert rows == expected_rows(text)
+
+
+def test_read_csv_parallel_backend(tmp_path: Path) -> None:
+    """
+    Validate that the 'parallel' backend reads like the default one.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_bytes(TRICKY_CSV.encode())
+    assert read_csv(str(csv_file), "parallel") == read_csv(str(csv_file))
+
+
+@pytest.mark.parametrize("workers, chunk_bytes", [(1, 16), (2, 16), (2, 1 << 20)])
+def test_iter_md_csv_parallel_matches_generate(
+    tmp_path: Path, workers: int, chunk_bytes: int
+) -> None:
+    """
+    Validate that rendering byte ranges in workers gives the same table as
+    rendering the parsed rows, including quoted newlines and a multi-line header.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+        workers (int): Number of worker processes.
+        chunk_bytes (int): Target size of each range in bytes.
+
+    Returns:
+        None
+    """
+    text = '"Name","Multi\nline"\n' + "".join(f"n{i},{i}_000\n" for i in range(50))
+    text += '"quoted\nname",7\n'
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text(text)
+    lines = iter_md_csv_parallel(
+        str(csv_file), "left,right", workers, chunk_bytes=chunk_bytes
+    )
+    assert "\n".join(lines) == generate_md_table(expected_rows(text), "left,right")
+
+
+def test_iter_md_csv_parallel_validates_columns(tmp_path: Path) -> None:
+    """
+    Validate that a row with the wrong number of columns fails in the workers too.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("A,B\n" + "1,2\n" * 20 + "3\n")
+    with pytest.raises(ValueError, match="same number of columns"):
+        list(iter_md_csv_parallel(str(csv_file), workers=2, chunk_bytes=8))
@@ -1,3 +1,10 @@
+from pathlib import Path
+
+import pytest
+
+from mdtable.preview import column_widths, preview_csv, preview_table
+
+
 def test_preview_output(markdown_output: str) -> None:
     """
     Validate that the preview output matches the expected Markdown formatting.
@@ -10,3 +17,60 @@ def test_preview_output(markdown_output: str) -> None:
     """
 
     assert markdown_output.startswith("| Name | Age | City |")
+
+
+def test_column_widths() -> None:
+    """
+    Validate that column_widths measures the widest cell of each column.
+
+    Returns:
+        None
+    """
+    rows = iter([["Name", "Age"], ["Charlie", "35"], ["Bo", "100", "extra"]])
+    assert column_widths(rows, 2) == [7, 3]
+
+
+def test_preview_csv_matches_preview_table(
+    sample_table: list[list[str]], tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
+    """
+    Validate that the two-pass preview prints the same table as preview_table.
+
+    Parameters:
+        sample_table (List[List[str]]): A list of rows, where each row is a list of
+        string cells.
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+        capsys (pytest.CaptureFixture): Pytest fixture used to capture stdout.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("\n".join(",".join(row) for row in sample_table))
+
+    preview_table(sample_table, None)
+    expected = capsys.readouterr().out
+    preview_csv(str(csv_file), None)
+    assert capsys.readouterr().out == expected
+
+
+def test_preview_table_wide_characters(capsys: pytest.CaptureFixture) -> None:
+    """
+    Validate that CJK cells are padded by display width so the borders line up.
+
+    Parameters:
+        capsys (pytest.CaptureFixture): Pytest fixture used to capture stdout.
+
+    Returns:
+        None
+    """
+    preview_table([["City", "Code"], ["東京都", "13"], ["Paris", "75"]])
+    assert capsys.readouterr().out.splitlines() == [
+        "+--------+------+",
+        "| City   | Code |",
+        "+--------+------+",
+        "| City   | Code |",
+        "| 東京都 | 13   |",
+        "| Paris  | 75   |",
+        "+--------+------+",
+    ]
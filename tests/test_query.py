@@ -0,0 +1,173 @@
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from mdtable import cli
+from mdtable.query import parse_where, select_rows
+from mdtable.readers import read_rows
+
+ROWS = [
+    ["Name", "Score", "City"],
+    ["Alice", "90", "Austin"],
+    ["Bob", "1_200", "Boston"],
+    ["Cy", "n/a", "Austin"],
+    ["Di", "75", "Denver"],
+]
+
+
+@pytest.mark.parametrize(
+    "condition, expected",
+    [
+        ("Score>=80", ("Score", ">=", "80")),
+        (" City = Austin ", ("City", "=", "Austin")),
+        ("Name!=Bob", ("Name", "!=", "Bob")),
+        ("City~ost", ("City", "~", "ost")),
+    ],
+)
+def test_parse_where(condition: str, expected: tuple[str, str, str]) -> None:
+    """
+    Validate that conditions are split into column, operator and value.
+
+    Parameters:
+        condition (str): The condition.
+        expected (Tuple[str, str, str]): The expected parts.
+
+    Returns:
+        None
+    """
+    assert parse_where(condition) == expected
+
+
+def test_parse_where_invalid() -> None:
+    """
+    Validate that conditions without an operator raise an error.
+
+    Returns:
+        None
+    """
+    with pytest.raises(ValueError, match="Invalid condition"):
+        parse_where("Score")
+
+
+@pytest.mark.parametrize(
+    "options, expected",
+    [
+        ({"columns": ["Name"], "limit": 2}, [["Name"], ["Alice"], ["Bob"]]),
+        ({"where": ["Score>80"]}, [ROWS[0], ROWS[1], ROWS[2]]),
+        ({"where": ["City=Austin", "Score<100"]}, [ROWS[0], ROWS[1]]),
+        ({"where": ["City~ost"], "columns": ["Name"]}, [["Name"], ["Bob"]]),
+        ({"limit": 2, "offset": 1}, [ROWS[0], ROWS[2], ROWS[3]]),
+        ({"where": ["City=Austin"], "offset": 1}, [ROWS[0], ROWS[3]]),
+    ],
+)
+def test_select_rows(options: dict, expected: list[list[str]]) -> None:
+    """
+    Validate filtering, slicing and projection of rows.
+
+    Parameters:
+        options (dict): Keyword arguments for select_rows.
+        expected (List[List[str]]): The expected rows.
+
+    Returns:
+        None
+    """
+    assert list(select_rows(ROWS, **options)) == expected
+
+
+def test_select_rows_stops_at_limit() -> None:
+    """
+    Validate that no rows are pulled from the reader past the limit.
+
+    Returns:
+        None
+    """
+    pulled = []
+
+    def reader() -> Iterator[list[str]]:
+        for row in ROWS:
+            pulled.append(row)
+            yield row
+
+    assert len(list(select_rows(reader(), limit=1))) == 2
+    assert pulled == ROWS[:2]
+
+
+def test_select_rows_unknown_column() -> None:
+    """
+    Validate that selecting a missing column raises an error.
+
+    Returns:
+        None
+    """
+    with pytest.raises(ValueError, match="Unknown column: 'Age'"):
+        list(select_rows(ROWS, columns=["Name", "Age"]))
+
+
+def test_ndjson_projection(tmp_path: Path) -> None:
+    """
+    Validate that projection and conditions work on projecting readers.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    ndjson_file = tmp_path / "input.ndjson"
+    ndjson_file.write_text(
+        '{"name": "Alice", "score": 90, "city": "Austin"}\n'
+        '{"name": "Bob", "score": 60, "city": "Boston"}\n'
+    )
+    rows = read_rows(str(ndjson_file), columns=["city"], where=["score>=80"])
+    assert rows == [["city"], ["Austin"]]
+
+
+def test_cli_selection(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
+    """
+    Validate that the selection options give the same table in every mode.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.argv`.
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+        capsys (pytest.CaptureFixture): Fixture to capture stdout.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("\n".join(",".join(row) for row in ROWS) + "\n")
+    argv = ["mdtable", "--input", str(csv_file), "--columns", "Name,Score"]
+    argv += ["--where", "City=Austin", "--limit", "1"]
+    for extra in ([], ["--stream"], ["--no-cache"]):
+        monkeypatch.setattr(sys, "argv", argv + extra)
+        cli.main()
+        assert capsys.readouterr().out == (
+            "| Name | Score |\n| :--- | :--- |\n| Alice | 90 |\n"
+        )
+
+
+@pytest.mark.parametrize(
+    "extra", [["--limit", "-1"], ["--offset", "-1"], ["--sort-by", "A", "--top", "-1"]]
+)
+def test_cli_rejects_negative_counts(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture, extra: list[str]
+) -> None:
+    """
+    Validate that negative row counts are reported as usage errors.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.argv`.
+        capsys (pytest.CaptureFixture): Fixture to capture stderr.
+        extra (List[str]): The option with a negative value.
+
+    Returns:
+        None
+    """
+    monkeypatch.setattr(sys, "argv", ["mdtable", "--input", "in.csv"] + extra)
+    with pytest.raises(SystemExit):
+        cli.main()
+    assert "must not be negative" in capsys.readouterr().err
@@ -0,0 +1,234 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from mdtable import cli
+from mdtable.readers import (
+    detect_format,
+    iter_rows,
+    read_rows,
+    read_table,
+    register_reader,
+)
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("data.csv", "csv"),
+        ("data.TSV", "tsv"),
+        ("logs/events.jsonl", "ndjson"),
+        ("data.parquet", "parquet"),
+        ("data.feather", "arrow"),
+        ("data.txt", "csv"),
+        ("-", "csv"),
+    ],
+)
+def test_detect_format(path: str, expected: str) -> None:
+    """
+    Validate that readers are chosen from the file extension.
+
+    Parameters:
+        path (str): Path to the input file.
+        expected (str): The expected reader name.
+
+    Returns:
+        None
+    """
+    assert detect_format(path) == expected
+
+
+def test_read_tsv(tmp_path: Path) -> None:
+    """
+    Validate that tab-separated files keep commas inside cells.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    tsv_file = tmp_path / "input.tsv"
+    tsv_file.write_text("Name\tScore\nDoe, Jane\t1,000\n")
+    assert read_rows(str(tsv_file)) == [["Name", "Score"], ["Doe, Jane", "1,000"]]
+
+
+def test_read_ndjson(tmp_path: Path) -> None:
+    """
+    Validate that NDJSON objects become rows under the first object's keys.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    ndjson_file = tmp_path / "input.ndjson"
+    ndjson_file.write_text(
+        '{"name": "Alice", "score": 90, "tags": ["a"]}\n'
+        "\n"
+        '{"score": 8.5, "name": "Bob", "extra": 1, "tags": null}\n'
+        '{"name": "Cy", "active": true}\n'
+    )
+    assert read_rows(str(ndjson_file)) == [
+        ["name", "score", "tags"],
+        ["Alice", "90", '["a"]'],
+        ["Bob", "8.5", ""],
+        ["Cy", "", ""],
+    ]
+
+
+def test_read_ndjson_rejects_non_objects(tmp_path: Path) -> None:
+    """
+    Validate that NDJSON lines must hold objects.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    ndjson_file = tmp_path / "input.ndjson"
+    ndjson_file.write_text("[1, 2]\n")
+    with pytest.raises(ValueError, match="JSON objects"):
+        read_rows(str(ndjson_file))
+
+
+def test_read_table_with_explicit_format(tmp_path: Path) -> None:
+    """
+    Validate that an explicit format overrides the file extension.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    data_file = tmp_path / "input.txt"
+    data_file.write_text("a\tb\n1\t22\n")
+    table = read_table(str(data_file), "tsv")
+    assert table.header == ["a", "b"]
+    assert table.widths == [1, 2]
+
+
+def test_invalid_format() -> None:
+    """
+    Validate that unknown formats raise an error.
+
+    Returns:
+        None
+    """
+    with pytest.raises(ValueError, match="Invalid format: 'xml'"):
+        iter_rows("data.xml", "xml")
+
+
+def test_register_reader(tmp_path: Path) -> None:
+    """
+    Validate that registered readers are selected by their extensions.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    register_reader("upper", lambda path, backend: iter([["A"], ["B"]]), (".up",))
+    assert read_rows(str(tmp_path / "data.up")) == [["A"], ["B"]]
+
+
+def test_read_parquet(tmp_path: Path) -> None:
+    """
+    Validate that Parquet files are read batch by batch with nulls left empty.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    table = pa.table({"name": ["Alice", None], "score": [90, 85]})
+    parquet_file = tmp_path / "input.parquet"
+    pq.write_table(table, parquet_file, row_group_size=1)
+    assert read_rows(str(parquet_file)) == [
+        ["name", "score"],
+        ["Alice", "90"],
+        ["", "85"],
+    ]
+
+
+def test_cli_ndjson(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
+    """
+    Validate that the CLI renders NDJSON input detected from its extension.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.argv`.
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+        capsys (pytest.CaptureFixture): Fixture to capture stdout.
+
+    Returns:
+        None
+    """
+    ndjson_file = tmp_path / "input.jsonl"
+    ndjson_file.write_text('{"Name": "Alice", "Balance": "1_000"}\n')
+    for extra in ([], ["--stream"]):
+        monkeypatch.setattr(
+            sys, "argv", ["mdtable", "--input", str(ndjson_file)] + extra
+        )
+        cli.main()
+        assert capsys.readouterr().out == (
+            "| Name | Balance |\n| :--- | :--- |\n| Alice | 1,000 |\n"
+        )
+
+
+def test_cli_incremental_requires_csv(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """
+    Validate that --incremental is rejected for non-CSV input.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.argv`.
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    output = str(tmp_path / "out.md")
+    argv = ["mdtable", "--input", "in.tsv", "--output", output, "--incremental"]
+    monkeypatch.setattr(sys, "argv", argv)
+    with pytest.raises(SystemExit):
+        cli.main()
+
+
+def test_cli_cache_depends_on_detected_format(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
+    """
+    Validate that a .tsv file and a .csv copy of it do not share a cache entry.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.argv`.
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+        capsys (pytest.CaptureFixture): Fixture to capture stdout.
+
+    Returns:
+        None
+    """
+    text = "Name\tCity\nAlice\tParis\n"
+    (tmp_path / "t.tsv").write_text(text)
+    (tmp_path / "t.csv").write_text(text)
+    cache = ["--cache-dir", str(tmp_path / "cache")]
+    for name in ("t.tsv", "t.csv"):
+        monkeypatch.setattr(
+            sys, "argv", ["mdtable", "--input", str(tmp_path / name)] + cache
+        )
+        cli.main()
+    assert capsys.readouterr().out == (
+        "| Name | City |\n| :--- | :--- |\n| Alice | Paris |\n"
+        "| Name\tCity |\n| :--- |\n| Alice\tParis |\n"
+    )
@@ -0,0 +1,240 @@
+import http.client
+import socket
+import sys
+import urllib.parse
+from collections.abc import Iterator
+from http import HTTPStatus
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from mdtable import cli
+from mdtable.core import generate_md_table
+from mdtable.preview import format_preview
+from mdtable.server import (
+    MAX_BODY_BYTES,
+    REQUEST_TIMEOUT,
+    RenderHandler,
+    request_render,
+    start_server,
+)
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    """
+    Run a rendering server on a free port for the duration of a test.
+
+    Returns:
+        Iterator[str]: The server's URL.
+    """
+    server: ThreadingHTTPServer = start_server(port=0)
+    host, port = server.server_address[:2]
+    yield f"http://{host}:{port}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_server_renders_markdown(
+    server_url: str, sample_table: list[list[str]]
+) -> None:
+    """
+    Validate that the server renders the same Markdown as generate_md_table.
+
+    Parameters:
+        server_url (str): URL of the running server.
+        sample_table (List[List[str]]): A list of rows, where each row is a list of
+        string cells.
+
+    Returns:
+        None
+    """
+    body = "\n".join(",".join(row) for row in sample_table).encode()
+    result = request_render(body, server_url, alignments="right,center,left")
+    assert result == generate_md_table(sample_table, "right,center,left")
+
+
+def test_server_renders_preview(server_url: str, sample_table: list[list[str]]) -> None:
+    """
+    Validate that the server returns the terminal preview on request.
+
+    Parameters:
+        server_url (str): URL of the running server.
+        sample_table (List[List[str]]): A list of rows, where each row is a list of
+        string cells.
+
+    Returns:
+        None
+    """
+    body = "\n".join(",".join(row) for row in sample_table).encode()
+    expected = format_preview(sample_table)
+    assert request_render(body, server_url, preview=True) == expected
+
+
+def test_server_rejects_malformed_csv(server_url: str) -> None:
+    """
+    Validate that malformed tables are reported back to the client as errors.
+
+    Parameters:
+        server_url (str): URL of the running server.
+
+    Returns:
+        None
+    """
+    with pytest.raises(ValueError, match="same number of columns"):
+        request_render(b"A,B\n1\n", server_url)
+
+
+@pytest.mark.parametrize("length", ["-1", "abc", "1.5"])
+def test_server_rejects_bad_content_length(server_url: str, length: str) -> None:
+    """
+    Validate that a negative or non-numeric Content-Length is a bad request.
+
+    Parameters:
+        server_url (str): URL of the running server.
+        length (str): The Content-Length header sent.
+
+    Returns:
+        None
+    """
+    url = urllib.parse.urlsplit(server_url)
+    conn = http.client.HTTPConnection(url.hostname, url.port, timeout=5)
+    try:
+        conn.putrequest("POST", "/")
+        conn.putheader("Content-Length", length)
+        conn.endheaders()
+        assert conn.getresponse().status == HTTPStatus.BAD_REQUEST
+    finally:
+        conn.close()
+
+
+def test_cli_client(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, server_url: str
+) -> None:
+    """
+    Validate that 'mdtable client' writes the table rendered by the server.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.argv`.
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+        server_url (str): URL of the running server.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("Name,Balance\nAlice,6_692_587.58 XRP\n")
+    output_file = tmp_path / "output.md"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "mdtable",
+            "client",
+            "--input",
+            str(csv_file),
+            "--output",
+            str(output_file),
+            "--url",
+            server_url,
+        ],
+    )
+    cli.main()
+
+    assert "| Alice | 6,692,587.58 XRP |" in output_file.read_text()
+
+
+def test_server_forwards_cli_options(server_url: str) -> None:
+    """
+    Validate that selection, typed and paging options match the command line.
+
+    Parameters:
+        server_url (str): URL of the running server.
+
+    Returns:
+        None
+    """
+    body = b"Name,Score\nAda,1200\nBob,80\nCy,95\n"
+    result = request_render(
+        body,
+        server_url,
+        where=["Score>=90"],
+        sort_by="Score",
+        desc=True,
+        typed=True,
+        page_rows=1,
+    )
+    assert result == (
+        "| Name | Score |\n| :--- | ---: |\n| Ada | 1,200 |\n\n"
+        "| Name | Score |\n| :--- | ---: |\n| Cy | 95 |"
+    )
+
+
+@pytest.mark.parametrize(
+    "options, message",
+    [
+        ({"jobs": 2}, "Unsupported options: jobs"),
+        ({"limit": "x"}, "Invalid value for 'limit'"),
+        ({"top": 1}, "require 'sort-by'"),
+        ({"preview": True, "page_rows": 1}, "cannot be combined"),
+    ],
+)
+def test_server_rejects_options(
+    server_url: str, options: dict[str, object], message: str
+) -> None:
+    """
+    Validate that unsupported and inconsistent options are bad requests.
+
+    Parameters:
+        server_url (str): URL of the running server.
+        options (Dict[str, object]): The query-string options sent.
+        message (str): Part of the expected error message.
+
+    Returns:
+        None
+    """
+    with pytest.raises(ValueError, match=message):
+        request_render(b"A,B\n1,2\n", server_url, **options)
+
+
+def test_server_rejects_large_body(server_url: str) -> None:
+    """
+    Validate that bodies larger than MAX_BODY_BYTES are refused unread.
+
+    Parameters:
+        server_url (str): URL of the running server.
+
+    Returns:
+        None
+    """
+    url = urllib.parse.urlsplit(server_url)
+    conn = http.client.HTTPConnection(url.hostname, url.port, timeout=5)
+    try:
+        conn.putrequest("POST", "/")
+        conn.putheader("Content-Length", str(MAX_BODY_BYTES + 1))
+        conn.endheaders()
+        assert conn.getresponse().status == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+    finally:
+        conn.close()
+
+
+def test_server_times_out_idle_connections(
+    monkeypatch: pytest.MonkeyPatch, server_url: str
+) -> None:
+    """
+    Validate that a client that stops sending its body is disconnected.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to shorten the timeout.
+        server_url (str): URL of the running server.
+
+    Returns:
+        None
+    """
+    assert RenderHandler.timeout == REQUEST_TIMEOUT
+    monkeypatch.setattr(RenderHandler, "timeout", 0.2)
+    url = urllib.parse.urlsplit(server_url)
+    with socket.create_connection((url.hostname, url.port), timeout=5) as sock:
+        sock.sendall(b"POST / HTTP/1.1\r\nContent-Length: 10\r\n\r\nA,B")
+        assert sock.recv(1024) == b""
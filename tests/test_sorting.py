@@ -0,0 +1,133 @@
+import random
+import sys
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TextIO
+
+import pytest
+
+from mdtable import cli, sorting
+from mdtable.sorting import order_rows, sort_key, sort_rows
+
+ROWS = [
+    ["a", "10"],
+    ["b", "n/a"],
+    ["c", "9"],
+    ["d", "1_000"],
+    ["e", "9"],
+    ["f", ""],
+]
+
+
+@pytest.mark.parametrize(
+    "desc, keep, expected",
+    [
+        (False, None, ["c", "e", "a", "d", "f", "b"]),
+        (True, None, ["d", "a", "c", "e", "b", "f"]),
+        (False, 2, ["c", "e"]),
+        (True, 3, ["d", "a", "c"]),
+    ],
+)
+def test_order_rows(desc: bool, keep: int | None, expected: list[str]) -> None:
+    """
+    Validate numeric ordering, stable ties and text sorting after numbers.
+
+    Parameters:
+        desc (bool): Sort in descending order.
+        keep (Optional[int]): Number of rows to keep.
+        expected (List[str]): The expected names, in order.
+
+    Returns:
+        None
+    """
+    assert [row[0] for row in order_rows(ROWS, 1, desc, keep)] == expected
+
+
+@pytest.mark.parametrize("merge_width", [2, 3, 4])
+@pytest.mark.parametrize("desc", [False, True])
+def test_sort_rows_spills_runs(desc: bool, merge_width: int) -> None:
+    """
+    Validate that an external sort over many spilled runs matches sorted().
+
+    Parameters:
+        desc (bool): Sort in descending order.
+        merge_width (int): Maximum number of runs merged at once.
+
+    Returns:
+        None
+    """
+    rng = random.Random(0)
+    rows = [[str(rng.randint(0, 50)), f"row {i}", 'q"uo,te'] for i in range(1_000)]
+    key = sort_key(0, desc)
+    result = list(sort_rows(rows, key, desc, run_size=30, merge_width=merge_width))
+    assert result == sorted(rows, key=key, reverse=desc)
+
+
+def test_cli_top(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
+    """
+    Validate that --sort-by with --desc and --top publishes a ranked table.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.argv`.
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+        capsys (pytest.CaptureFixture): Fixture to capture stdout.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("Name,Balance\nAlice,350_491.8\nBob,6_692_587.5\nCy,96\n")
+    argv = ["mdtable", "--input", str(csv_file), "--sort-by", "Balance", "--desc"]
+    for extra in (["--top", "2"], ["--top", "2", "--stream"]):
+        monkeypatch.setattr(sys, "argv", argv + extra)
+        cli.main()
+        assert capsys.readouterr().out == (
+            "| Name | Balance |\n| :--- | :--- |\n"
+            "| Bob | 6,692,587.5 |\n| Alice | 350,491.8 |\n"
+        )
+
+
+def test_cli_top_requires_sort_by(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Validate that --top without --sort-by is rejected.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.argv`.
+
+    Returns:
+        None
+    """
+    monkeypatch.setattr(sys, "argv", ["mdtable", "--input", "in.csv", "--top", "3"])
+    with pytest.raises(SystemExit):
+        cli.main()
+
+
+def test_sort_rows_merges_in_levels(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Validate that each row is rewritten once per merge level, not once per run.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to count spilled rows.
+
+    Returns:
+        None
+    """
+    spill = sorting._spill
+    written = []
+
+    def counting_spill(rows: Iterable[list[str]]) -> TextIO:
+        rows = list(rows)
+        written.append(len(rows))
+        return spill(rows)
+
+    monkeypatch.setattr(sorting, "_spill", counting_spill)
+    rows = [[str(i % 7), str(i)] for i in range(256)]
+    key = sort_key(0)
+    result = list(sort_rows(rows, key, run_size=4, merge_width=4))
+
+    assert result == sorted(rows, key=key)
+    # 64 runs of 4 rows: spilled once, then merged at levels 0, 1 and 2. Merging the
+    # growing result with every few new runs would write over 3,000 rows instead.
+    assert sum(written) == 256 * 4
@@ -0,0 +1,124 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+# Generous enough for slow machines, but far below what eager imports cost.
+IMPORT_BUDGET_MS = 100
+
+
+def import_times(code: str) -> dict[str, int]:
+    """
+    Run code in a fresh interpreter with -X importtime and collect import costs.
+
+    Parameters:
+        code (str): Python source to run.
+
+    Returns:
+        Dict[str, int]: Cumulative import time in microseconds for each top-level
+        import, keyed on module name.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if not name.startswith("  "):  # only top-level imports
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def imported_modules(code: str) -> set[str]:
+    """
+    Run code in a fresh interpreter and list every module imported.
+
+    Parameters:
+        code (str): Python source to run.
+
+    Returns:
+        Set[str]: Names of the modules in sys.modules afterwards.
+    """
+    code += "\nimport sys; print(*sys.modules, file=sys.stderr)"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        check=True,
+    )
+    return set(result.stderr.split())
+
+
+def test_import_mdtable_is_lazy() -> None:
+    """
+    Validate that importing the package loads no submodules besides its metadata.
+
+    Returns:
+        None
+    """
+    modules = imported_modules("import mdtable")
+    assert {m for m in modules if m.startswith("mdtable.")} == {"mdtable._version"}
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import mdtable",
+        "import mdtable.cli",
+        "from mdtable import core; core.generate_md_table([['a'], ['1']])",
+    ],
+)
+def test_import_time_budget(code: str) -> None:
+    """
+    Validate that importing mdtable stays within the startup budget.
+
+    Parameters:
+        code (str): Python source to run.
+
+    Returns:
+        None
+    """
+    times = import_times(code)
+    total = sum(t for name, t in times.items() if name.split(".")[0] == "mdtable")
+    assert total / 1000 < IMPORT_BUDGET_MS
+
+
+def test_cli_convert_loads_only_what_it_needs(tmp_path: Path) -> None:
+    """
+    Validate that a plain conversion does not import unrelated features.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("Name,Score\nAlice,90\n")
+    code = (
+        "import sys\n"
+        f"sys.argv = ['mdtable', '--input', {str(csv_file)!r}, '--no-cache']\n"
+        "from mdtable.cli import main\n"
+        "main()"
+    )
+    modules = imported_modules(code)
+    unwanted = {
+        "mdtable.aio",
+        "mdtable.batch",
+        "mdtable.incremental",
+        "mdtable.preview",
+        "mdtable.server",
+        "concurrent.futures.process",
+        "cProfile",
+        "http.server",
+    }
+    assert not modules & unwanted
@@ -0,0 +1,126 @@
+import json
+import pstats
+import sys
+from pathlib import Path
+
+import pytest
+
+from mdtable import cli
+from mdtable.stats import NullStats, Stats
+
+
+def test_stats_stage_accumulates() -> None:
+    """
+    Validate that repeated stages accumulate and rows are counted as they pass.
+
+    Returns:
+        None
+    """
+    stats = Stats()
+    for _ in range(2):
+        with stats.stage("render"):
+            pass
+    rows = [["Name"], ["a"], ["b"]]
+    assert list(stats.count_rows(rows)) == rows
+
+    report = stats.report()
+    assert set(report["stages"]) == {"render"}
+    assert report["stages"]["render"]["wall"] >= 0
+    assert report["rows"] == 2
+
+
+def test_null_stats_records_nothing() -> None:
+    """
+    Validate that disabled stats pass rows through untouched and record nothing.
+
+    Returns:
+        None
+    """
+    stats = NullStats()
+    rows = [["a"]]
+    with stats.stage("render"):
+        pass
+    assert stats.count_rows(rows) is rows
+    assert stats.stages == {}
+
+
+@pytest.mark.parametrize("extra", [[], ["--stream"], ["--preview"]])
+def test_cli_stats_json(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture,
+    extra: list[str],
+) -> None:
+    """
+    Validate that --stats json reports stages and counters on stderr.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.argv`.
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+        capsys (pytest.CaptureFixture): Pytest fixture used to capture stderr.
+        extra (List[str]): Additional command-line arguments.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("Name,Score\nAlice,90\nBob,85\n")
+    monkeypatch.setattr(
+        sys, "argv", ["mdtable", "--input", str(csv_file), "--stats", "json"] + extra
+    )
+    cli.main()
+
+    report = json.loads(capsys.readouterr().err)
+    assert report["stages"]
+    assert report["bytes_in"] == csv_file.stat().st_size
+    if "--preview" not in extra:
+        assert report["rows"] == 2
+
+
+def test_cli_profile(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Validate that --profile dumps cProfile data that pstats can load.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.argv`.
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("Name,Score\nAlice,90\n")
+    profile = tmp_path / "mdtable.prof"
+    monkeypatch.setattr(
+        sys, "argv", ["mdtable", "--input", str(csv_file), "--profile", str(profile)]
+    )
+    cli.main()
+
+    assert pstats.Stats(str(profile)).total_calls > 0
+
+
+def test_cli_stats_counts_cached_rows(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
+    """
+    Validate that --stats still reports the row count when the render is cached.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.argv`.
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+        capsys (pytest.CaptureFixture): Pytest fixture used to capture stderr.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("Name,Score\nAlice,90\nBob,85\n")
+    argv = ["mdtable", "--input", str(csv_file), "--stats", "json"]
+    monkeypatch.setattr(sys, "argv", argv + ["--cache-dir", str(tmp_path / "cache")])
+    for _ in range(2):
+        capsys.readouterr()
+        cli.main()
+
+    report = json.loads(capsys.readouterr().err)
+    assert "cache" in report["stages"]
+    assert report["rows"] == 2
@@ -0,0 +1,95 @@
+import sys
+from io import StringIO
+
+import pytest
+
+from mdtable.core import generate_md_table, read_table
+from mdtable.preview import preview_table
+from mdtable.table import Table
+
+
+def test_table_from_rows(sample_table: list[list[str]]) -> None:
+    """
+    Validate that a Table stores columns and tracks the widest cell per column.
+
+    Parameters:
+        sample_table (List[List[str]]): A list of rows, where each row is a list of
+        string cells.
+
+    Returns:
+        None
+    """
+    table = Table.from_rows(sample_table)
+    assert table.header == ["Name", "Age", "City"]
+    assert table.columns[0] == ["Alice", "Bob", "Charlie"]
+    assert table.widths == [7, 3, 7]
+    assert len(table) == 3
+    assert [list(row) for row in table] == sample_table
+
+
+def test_table_rejects_malformed_rows(malformed_table: list[list[str]]) -> None:
+    """
+    Validate that a Table raises a ValueError for rows with the wrong column count.
+
+    Parameters:
+        malformed_table (List[List[str]]): Rows with extra and missing columns.
+
+    Returns:
+        None
+    """
+    with pytest.raises(ValueError, match="same number of columns"):
+        Table.from_rows(malformed_table)
+
+
+def test_table_renderers_match_lists(
+    sample_table: list[list[str]], capsys: pytest.CaptureFixture
+) -> None:
+    """
+    Validate that both renderers produce the same output for a Table and a list.
+
+    Parameters:
+        sample_table (List[List[str]]): A list of rows, where each row is a list of
+        string cells.
+        capsys (pytest.CaptureFixture): Pytest fixture used to capture stdout.
+
+    Returns:
+        None
+    """
+    table = Table.from_rows(sample_table)
+    assert generate_md_table(table, "left,right,center") == generate_md_table(
+        sample_table, "left,right,center"
+    )
+
+    preview_table(sample_table)
+    expected = capsys.readouterr().out
+    preview_table(table)
+    assert capsys.readouterr().out == expected
+
+
+def test_read_table_from_stdin(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Validate that read_table builds a Table straight from CSV input.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.stdin`.
+
+    Returns:
+        None
+    """
+    monkeypatch.setattr(sys, "stdin", StringIO("Name,Score\nAlice,90\nBob,100"))
+    table = read_table("-")
+    assert table.columns == [["Alice", "Bob"], ["90", "100"]]
+    assert table.widths == [5, 5]
+
+
+def test_table_widths_use_display_width() -> None:
+    """
+    Validate that wide characters count as two columns in the tracked widths.
+
+    Returns:
+        None
+    """
+    table = Table.from_rows([["City", "Code"], ["東京都", "13"]])
+    assert table.widths == [6, 4]
+    table = Table.from_columns(["City"], [["서울", "Paris"]])
+    assert table.widths == [5]
@@ -0,0 +1,86 @@
+import pytest
+
+from mdtable.core import format_commas, generate_md_table
+from mdtable.transforms import (
+    compile_row_formatter,
+    normalize_transforms,
+    register_transform,
+)
+
+
+@pytest.mark.parametrize(
+    "transforms, row, expected",
+    [
+        (("commas",), ["6_692_587.5 XRP", "a_b"], "| 6,692,587.5 XRP | a,b |"),
+        (("escape",), ["a|b", "c"], "| a\\|b | c |"),
+        (("trim", "commas"), ["  1_000 ", " x"], "| 1,000 | x |"),
+        ((), ["1_000", "a|b"], "| 1_000 | a|b |"),
+        (("escape",), ["a\x1fb", "c|d"], "| a\x1fb | c\\|d |"),
+    ],
+)
+def test_compile_row_formatter(
+    transforms: tuple[str, ...], row: list[str], expected: str
+) -> None:
+    """
+    Validate that compiled pipelines apply every transform to every cell.
+
+    Parameters:
+        transforms (Tuple[str, ...]): Transform names, in order.
+        row (List[str]): A row of string cells.
+        expected (str): The expected Markdown line.
+
+    Returns:
+        None
+    """
+    assert compile_row_formatter(transforms)(row) == expected
+
+
+def test_default_formatter_matches_format_commas() -> None:
+    """
+    Validate that the default pipeline renders like format_commas per cell.
+
+    Returns:
+        None
+    """
+    row = ["0.01 %", "6_910", "350_491.824569 XRP"]
+    expected = "| " + " | ".join(format_commas(cell) for cell in row) + " |"
+    assert compile_row_formatter()(row) == expected
+
+
+@pytest.mark.parametrize("padded", [False, True])
+def test_escape_applies_to_header(padded: bool) -> None:
+    """
+    Validate that escape also applies to the header, unlike the other transforms.
+
+    Parameters:
+        padded (bool): Pad the cells so the columns line up.
+
+    Returns:
+        None
+    """
+    data = [["a|b", "c_d"], ["1", "2"]]
+    table = generate_md_table(data, transforms="escape,commas", padded=padded)
+    assert table.splitlines()[0].split() == ["|", "a\\|b", "|", "c_d", "|"]
+
+
+def test_register_transform() -> None:
+    """
+    Validate that registered transforms can be used by name.
+
+    Returns:
+        None
+    """
+    register_transform("upper", str.upper)
+    data = [["Name"], ["alice"]]
+    assert generate_md_table(data, transforms="upper").endswith("| ALICE |")
+
+
+def test_normalize_transforms_invalid() -> None:
+    """
+    Validate that unknown transform names are rejected.
+
+    Returns:
+        None
+    """
+    with pytest.raises(ValueError, match="Invalid transform"):
+        normalize_transforms("commas,shout")
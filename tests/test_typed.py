@@ -0,0 +1,155 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from mdtable import cli
+from mdtable.table import Table
+from mdtable.typed import format_column, format_table, infer_type
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        (["691", "6_910", "1,234", ""], "int"),
+        (["350_491.824569", "-2.5", "10"], "decimal"),
+        (["1e3", "2.5", "7"], "float"),
+        (["2024-01-02", "2024-02-29"], "date"),
+        (["0.01 %", "5"], "text"),
+        (["2024-01-02", "5"], "text"),
+        (["", " "], "text"),
+        (["00501", "02134"], "text"),
+        (["1,2", "3"], "text"),
+        (["1,0000"], "text"),
+        (["1_000_000", "0", "-12,345"], "int"),
+        (["2024", "1999"], "year"),
+        (["2024", "15000"], "int"),
+        (["2024", "2.5"], "decimal"),
+        (["e4", "e5"], "text"),
+        ([".5e3", "1.e-2"], "float"),
+    ],
+)
+def test_infer_type(values: list[str], expected: str) -> None:
+    """
+    Validate column type inference, including mixed and empty columns.
+
+    Parameters:
+        values (List[str]): Sample values from a column.
+        expected (str): The expected column type.
+
+    Returns:
+        None
+    """
+    assert infer_type(values) == expected
+
+
+@pytest.mark.parametrize(
+    "values, col_type, precision, expected",
+    [
+        (["6_910", "", "-1234567"], "int", None, ["6,910", "", "-1,234,567"]),
+        (["350_491.824569", "10"], "decimal", None, ["350,491.824569", "10"]),
+        (["350_491.824569", "10"], "decimal", 2, ["350,491.82", "10.00"]),
+        (["1e3", "0.025"], "float", 2, ["1,000.00", "0.03"]),
+        (["a_b"], "text", 2, ["a_b"]),
+        (["2024", "1999"], "year", None, ["2024", "1999"]),
+        (["501", "00501"], "int", None, ["501", "00501"]),
+        (["1", "1,2"], "int", None, ["1", "1,2"]),
+    ],
+)
+def test_format_column(
+    values: list[str], col_type: str, precision: int | None, expected: list[str]
+) -> None:
+    """
+    Validate bulk formatting of numeric columns.
+
+    Parameters:
+        values (List[str]): The column's cells.
+        col_type (str): The column's type.
+        precision (Optional[int]): Number of decimal places.
+        expected (List[str]): The expected formatted cells.
+
+    Returns:
+        None
+    """
+    assert format_column(values, col_type, precision) == expected
+
+
+def test_format_column_falls_back_beyond_sample() -> None:
+    """
+    Validate that a column whose unsampled cells are not numeric is left unchanged.
+
+    Returns:
+        None
+    """
+    values = ["1", "2", "n/a"]
+    assert format_column(values, "int") == values
+
+
+def test_format_column_beyond_int64() -> None:
+    """
+    Validate that integers too large for NumPy's int64 are still formatted.
+
+    Returns:
+        None
+    """
+    pytest.importorskip("numpy")
+    values = ["1", "-99_999_999_999_999_999_999"]
+    assert format_column(values, "int") == ["1", "-99,999,999,999,999,999,999"]
+
+
+def test_format_table_alignments() -> None:
+    """
+    Validate that numeric columns are right-aligned unless set explicitly.
+
+    Returns:
+        None
+    """
+    table = Table.from_rows(
+        [["Name", "Accounts", "Balance"], ["Alice", "6_910", "350_491.8"]]
+    )
+    formatted, alignments = format_table(table, ["center"])
+    assert alignments == ["center", "right", "right"]
+    assert formatted.columns == [["Alice"], ["6,910"], ["350,491.8"]]
+    assert formatted.widths == [5, 8, 9]
+
+
+def test_cli_typed(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """
+    Validate that --typed formats and right-aligns numeric columns.
+
+    Parameters:
+        monkeypatch (pytest.MonkeyPatch): Fixture used to override `sys.argv`.
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_text("Percentage,Accounts,Balance\n0.01 %,6910,6692587.586946\n")
+    output_file = tmp_path / "output.md"
+    argv = ["mdtable", "--input", str(csv_file), "--output", str(output_file)]
+    monkeypatch.setattr(sys, "argv", argv + ["--typed", "--precision", "2"])
+    cli.main()
+
+    content = output_file.read_text()
+    assert "| :--- | ---: | ---: |" in content
+    assert "| 0.01 % | 6,910 | 6,692,587.59 |" in content
+
+
+def test_format_table_keeps_codes_and_years() -> None:
+    """
+    Validate that ZIP codes and years keep their digits, and years stay right-aligned.
+
+    Returns:
+        None
+    """
+    table = Table.from_rows(
+        [["Zip", "Year", "Count"], ["00501", "2024", "1500"], ["10001", "1999", "7"]]
+    )
+    formatted, alignments = format_table(table)
+    assert formatted.columns == [
+        ["00501", "10001"],
+        ["2024", "1999"],
+        ["1,500", "7"],
+    ]
+    assert alignments == ["left", "right", "right"]
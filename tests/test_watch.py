@@ -0,0 +1,118 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from mdtable.watch import InotifyWatcher, PollingWatcher, _base_dir, watch
+
+
+def touch(path: Path, text: str) -> None:
+    """
+    Rewrite a file and move its modification time forward by a second.
+
+    Parameters:
+        path (Path): The file.
+        text (str): The new contents.
+    """
+    mtime = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(text)
+    os.utime(path, ns=(mtime + 10**9, mtime + 10**9))
+
+
+@pytest.mark.parametrize(
+    "pattern, expected",
+    [
+        ("data/**/*.csv", "data"),
+        ("data/2024/report.csv", os.path.join("data", "2024")),
+        ("*.csv", "."),
+        ("dir*/a.csv", "."),
+    ],
+)
+def test_base_dir(pattern: str, expected: str) -> None:
+    """
+    Validate that the watched directory of a pattern stops at the first wildcard.
+
+    Parameters:
+        pattern (str): The glob pattern.
+        expected (str): The expected directory.
+
+    Returns:
+        None
+    """
+    assert _base_dir(pattern) == expected
+
+
+def test_polling_watcher(tmp_path: Path) -> None:
+    """
+    Validate that polling reports modified and new files only.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    (tmp_path / "a.csv").write_text("A\n1\n")
+    (tmp_path / "b.csv").write_text("B\n1\n")
+    watcher = PollingWatcher([str(tmp_path / "*.csv")], interval=0.01)
+    assert watcher.wait(0.02) == set()
+
+    touch(tmp_path / "a.csv", "A\n2\n")
+    (tmp_path / "c.csv").write_text("C\n1\n")
+    assert watcher.wait(1) == {str(tmp_path / "a.csv"), str(tmp_path / "c.csv")}
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux only")
+def test_inotify_watcher(tmp_path: Path) -> None:
+    """
+    Validate that inotify reports files written in a watched directory.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    (tmp_path / "a.csv").write_text("A\n1\n")
+    watcher = InotifyWatcher([str(tmp_path / "*.csv")])
+    try:
+        assert watcher.wait(0.01) == set()
+        (tmp_path / "a.csv").write_text("A\n2\n")
+        assert watcher.wait(1) == {str(tmp_path / "a.csv")}
+    finally:
+        watcher.close()
+
+
+def test_watch_renders_only_changed_files(tmp_path: Path) -> None:
+    """
+    Validate that watch renders stale outputs, then only the files that change,
+    once per burst of writes.
+
+    Parameters:
+        tmp_path (Path): Pytest fixture providing a temporary directory.
+
+    Returns:
+        None
+    """
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    for name in ("a", "b"):
+        (tmp_path / f"{name}.csv").write_text(f"{name}\n1_000\n")
+    (out_dir / "b.md").write_text("up to date")
+
+    patterns = [str(tmp_path / "*.csv")]
+    watcher = PollingWatcher(patterns, interval=0.01)
+    rounds = watch(patterns, str(out_dir), debounce=0.05, watcher=watcher)
+    try:
+        first = next(rounds)
+        assert [src for src, _, _ in first] == [str(tmp_path / "a.csv")]
+        assert (out_dir / "a.md").read_text() == "| a |\n| :--- |\n| 1,000 |"
+
+        touch(tmp_path / "b.csv", "b\n1\n")
+        touch(tmp_path / "b.csv", "b\n2\n")
+        second = next(rounds)
+        assert [src for src, _, _ in second] == [str(tmp_path / "b.csv")]
+        assert (out_dir / "b.md").read_text() == "| b |\n| :--- |\n| 2 |"
+    finally:
+        rounds.close()
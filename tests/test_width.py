@@ -0,0 +1,77 @@
+import pytest
+
+from mdtable.width import _unicode_width, display_width, pad, truncate
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("", 0),
+        ("Alice", 5),
+        ("東京", 4),
+        ("ｈｉ", 4),
+        ("Zürich", 6),
+        ("Zu\u0308rich", 6),
+        ("😀", 2),
+        ("👍🏽", 2),
+        ("a\u200bb", 2),
+    ],
+)
+def test_display_width(text: str, expected: int) -> None:
+    """
+    Validate that wide characters count twice and zero-width characters not at all.
+
+    Parameters:
+        text (str): The string to measure.
+        expected (int): Its display width.
+
+    Returns:
+        None
+    """
+    assert display_width(text) == expected
+
+
+def test_display_width_caches_unicode_only() -> None:
+    """
+    Validate that ASCII strings skip the memoized slow path.
+
+    Returns:
+        None
+    """
+    _unicode_width.cache_clear()
+    display_width("plain")
+    display_width("東京")
+    display_width("東京")
+    info = _unicode_width.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+@pytest.mark.parametrize(
+    "align, expected",
+    [("left", "東京  "), ("right", "  東京"), ("center", " 東京 ")],
+)
+def test_pad(align: str, expected: str) -> None:
+    """
+    Validate that padding fills up to the display width, following the alignment.
+
+    Parameters:
+        align (str): The alignment.
+        expected (str): The padded string.
+
+    Returns:
+        None
+    """
+    assert pad("東京", 6, align) == expected
+    assert pad("東京", 3, align) == "東京"
+
+
+def test_truncate() -> None:
+    """
+    Validate that truncation never splits a wide character across the limit.
+
+    Returns:
+        None
+    """
+    assert truncate("abcdef", 4) == "abcd"
+    assert truncate("東京都", 5) == "東京"
+    assert truncate("東京", 4) == "東京"